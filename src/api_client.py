@@ -4,13 +4,67 @@ Harness API Client
 Handles all API interactions with Harness instances.
 """
 
+import email.utils
 import logging
-from typing import Dict, List, Optional, Union
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # Optional faster JSON decoding; requests' stdlib decoding is used otherwise
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for request timeouts (408), rate limiting (429) and transient gateway
+# errors; a 500 usually reflects the request itself and would fail again
+RETRY_STATUS_CODES = frozenset({408, 429, 502, 503, 504})
+MAX_RETRIES = 3
+BASE_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 30.0
+RETRY_JITTER = 0.5
+
+# Keep-alive connections per host, sized above the number of concurrent workers
+CONNECTION_POOL_SIZE = 32
+
+# Delay factor for transport-level retries of failed connection attempts
+CONNECT_RETRY_BACKOFF = 0.5
+
+# Seconds to wait for a connection and for each read of the response, so a stalled
+# connection fails the request instead of holding a pooled connection indefinitely
+REQUEST_TIMEOUT = (5.0, 60.0)
+
+# Default client-side request rate, applied per Harness instance
+DEFAULT_RATE_LIMIT_RPS = 20.0
+
+# After the server throttles a client, its request rate is halved (not below this floor)
+MIN_RATE_LIMIT_RPS = 1.0
+
+# ...and then climbs back towards the configured rate by this many requests per second, each second
+RATE_LIMIT_RECOVERY = 1.0
+
+# Error bodies can be large validation dumps; only this much is decoded for logs
+MAX_ERROR_BODY_BYTES = 2000
+
+# Streamed bodies up to this size are read to the end so their connection can be reused
+MAX_DRAINED_BODY_BYTES = 64 * 1024
+
+# Seconds a successful GET without query parameters is reused for identical requests
+GET_CACHE_TTL = 30.0
+
+# Upper bound on cached GET responses per client; the oldest are dropped first
+GET_CACHE_MAX_ENTRIES = 512
+
 
 class HarnessAuthenticationError(Exception):
     """Raised when API authentication fails (401 Unauthorized)"""
@@ -20,25 +74,140 @@ class HarnessAuthenticationError(Exception):
         super().__init__(message)
 
 
+class TokenBucket:
+    """Thread-safe token bucket limiting how many requests are sent per second"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Allow `rate` requests per second with bursts of up to `capacity` requests"""
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = max(1.0, capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds`, then resume from an empty bucket"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def slow_down(self) -> None:
+        """Halve the rate after the server throttled a request; it recovers gradually afterwards"""
+        with self._lock:
+            self.rate = max(min(self.max_rate, MIN_RATE_LIMIT_RPS), self.rate / 2)
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    elapsed = now - max(self._updated, self._paused_until)
+                    self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                    if self.rate < self.max_rate:
+                        self.rate = min(self.max_rate, self.rate + elapsed * RATE_LIMIT_RECOVERY)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies REQUEST_TIMEOUT to requests sent without a timeout"""
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if timeout is None:
+            timeout = REQUEST_TIMEOUT
+        return super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+
+_shared_adapter: Optional[HTTPAdapter] = None
+_shared_adapter_lock = threading.Lock()
+
+
+def _get_shared_adapter() -> HTTPAdapter:
+    """Get the process-wide HTTP adapter whose connection pools all clients share.
+
+    Source and destination are often the same Harness host; sharing the pools lets
+    both clients reuse the same keep-alive connections instead of opening their own.
+    """
+    global _shared_adapter
+    with _shared_adapter_lock:
+        if _shared_adapter is None:
+            # Reuse connections across concurrent requests instead of discarding them
+            # when the default pool of 10 is exhausted. Nested worker pools can have more
+            # requests in flight than the pool holds, so extra requests wait for a free
+            # keep-alive connection rather than opening one that is thrown away afterwards.
+            # Failed connection attempts never reach the server, so the transport retries
+            # them for every method; retries based on the HTTP status are handled in _send.
+            connect_retry = Retry(total=MAX_RETRIES, connect=MAX_RETRIES, read=0, status=0, other=0,
+                                  redirect=False, backoff_factor=CONNECT_RETRY_BACKOFF)
+            _shared_adapter = _TimeoutHTTPAdapter(pool_connections=CONNECTION_POOL_SIZE,
+                                                  pool_maxsize=CONNECTION_POOL_SIZE, pool_block=True,
+                                                  max_retries=connect_retry)
+        return _shared_adapter
+
+
 class HarnessAPIClient:
-    """Client for interacting with Harness API"""
+    """Client for interacting with Harness API.
 
-    def __init__(self, base_url: str, api_key: str):
-        """Initialize API client with base URL and API key"""
+    Create one client per Harness instance and pass it to every handler: its session
+    keeps the auth headers, rate limit and GET cache, and reuses pooled connections.
+    """
+
+    def __init__(self, base_url: str, api_key: str, rate_limit: Optional[float] = None):
+        """Initialize API client with base URL and API key.
+
+        rate_limit caps requests per second sent by this client; None or 0 disables it.
+        """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.session = requests.Session()
         self.session.headers.update({
             "x-api-key": api_key,
             "Content-Type": "application/json",
+            "Connection": "keep-alive",
         })
 
-    def _handle_auth_errors(self, e: requests.exceptions.RequestException) -> None:
+        # Resolve proxy and CA bundle settings from the environment once for this host,
+        # instead of requests re-reading them (and ~/.netrc) on every call
+        self.session.proxies.update(requests.utils.get_environ_proxies(self.base_url))
+        ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+        if ca_bundle:
+            self.session.verify = ca_bundle
+        self.session.trust_env = False
+
+        # Share keep-alive connections with other clients talking to the same host
+        adapter = _get_shared_adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+
+        # Recent GET responses by endpoint, dropped when this client writes to a related path
+        self._get_cache: Dict[str, Tuple[float, Any]] = {}
+        self._cache_ttl = GET_CACHE_TTL
+        # GETs currently being fetched by endpoint; concurrent callers share the response
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def throttle(self) -> None:
+        """Wait until the client-side rate limit allows another request"""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+    def _handle_auth_errors(self, e: requests.exceptions.RequestException,
+                            response_text: Optional[str] = None) -> None:
         """Check if the error is authentication-related and raise appropriate exception"""
         if hasattr(e, 'response') and e.response is not None:
             status_code = e.response.status_code
-            response_text = str(e.response.text).lower()
-            
+
             if status_code == 401:
                 raise HarnessAuthenticationError(
                     "Authentication failed. Please check your API key and ensure it has the required permissions.",
@@ -53,6 +222,9 @@ class HarnessAPIClient:
                 # Harness often returns 500 for authentication issues instead of 401
                 # Check for authentication-related keywords or assume auth issue for certain endpoints
                 auth_keywords = ["unauthorized", "invalid", "authentication", "forbidden", "access denied"]
+                if response_text is None:
+                    response_text = self.error_body(e.response)
+                response_text = response_text.lower()
                 is_auth_endpoint = any(endpoint in e.request.url for endpoint in ["/v1/orgs", "/v1/projects", "/ng/api/"])
                 
                 if any(keyword in response_text for keyword in auth_keywords) or is_auth_endpoint:
@@ -61,79 +233,268 @@ class HarnessAPIClient:
                         self.base_url
                     )
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Union[Dict, List]]:
-        """Make GET request to API endpoint"""
-        url = f"{self.base_url}{endpoint}"
-        logger.debug("Making GET request to: %s", url)
+    def _get_retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Compute how long to wait before retrying a throttled or unavailable request.
+
+        Honors the Retry-After header when present, otherwise uses exponential
+        backoff with jitter.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(MAX_RETRY_DELAY, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+            # Retry-After may also be an HTTP date, which is always in GMT
+            try:
+                retry_at = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError, IndexError):
+                retry_at = None
+            if retry_at is not None:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                return min(MAX_RETRY_DELAY, max(0.0, delay))
+
+        delay = min(MAX_RETRY_DELAY, BASE_RETRY_DELAY * 2 ** attempt)
+        return delay * (1 + random.random() * RETRY_JITTER)
+
+    def _make_request(self, method: str, endpoint: str, **kwargs) -> Optional[Union[Dict, List]]:
+        """Make request to API endpoint, retrying on rate limiting and transient errors"""
+        if method != "GET":
+            self._invalidate_cache(endpoint)
+        if orjson is not None and kwargs.get("json") is not None:
+            # Encode the body with orjson, several times faster than the stdlib json requests uses
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"), option=orjson.OPT_NON_STR_KEYS)
+        return self._request(method, endpoint, self._decode_json, **kwargs)
+
+    def _url(self, endpoint: str) -> str:
+        """Join an endpoint path to the client's base URL"""
+        return self.base_url + endpoint
 
+    def _request(self, method: str, endpoint: str, read: Callable[[requests.Response], Any],
+                 **kwargs) -> Any:
+        """Send a request and read its response body with `read`, logging failures and returning None"""
+        url = self._url(endpoint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Making %s request to: %s", method, url)
         try:
-            response = self.session.get(url, params=params)
+            response = self._send(method, url, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return read(response)
         except requests.exceptions.RequestException as e:
-            self._handle_auth_errors(e)
-            logger.error("API Error: %s", e)
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error("Status: %s", e.response.status_code)
-                logger.error("URL: %s", url)
-                logger.error("Response Text: %s", e.response.text)
+            self._report_request_error(e, url)
             return None
 
-    def post(self, endpoint: str, params: Optional[Dict] = None,
-             json: Optional[Dict] = None) -> Optional[Union[Dict, List]]:
-        """Make POST request to API endpoint"""
-        url = f"{self.base_url}{endpoint}"
-        logger.debug("Making POST request to: %s", url)
+    def _cache_response(self, endpoint: str, result: Union[Dict, List]) -> None:
+        """Cache a GET response, dropping the oldest entries beyond the size bound.
+
+        Entries are kept in the order they were fetched, so the first one is also
+        the closest to expiring.
+        """
+        self._get_cache.pop(endpoint, None)
+        self._get_cache[endpoint] = (time.monotonic(), result)
+        while len(self._get_cache) > GET_CACHE_MAX_ENTRIES:
+            self._get_cache.pop(next(iter(self._get_cache)), None)
+
+    def _invalidate_cache(self, endpoint: str) -> None:
+        """Drop cached GETs that a write to `endpoint` can change.
+
+        A write can change resources below the written path (a POST to a collection
+        creates an item in it) and the resources that contain it, but not siblings,
+        so concurrent creates do not discard each other's cached lookups.
+        """
+        for cached_endpoint in list(self._get_cache):
+            cached_below = cached_endpoint == endpoint or cached_endpoint.startswith(endpoint + "/")
+            if cached_below or endpoint.startswith(cached_endpoint + "/"):
+                self._get_cache.pop(cached_endpoint, None)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying on rate limiting and transient errors"""
+        send = getattr(self.session, method.lower())
+        for attempt in range(MAX_RETRIES + 1):
+            self.throttle()
+            response = send(url, **kwargs)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                return response
+
+            delay = self._get_retry_delay(response, attempt)
+            if response.status_code == 429 and self._rate_limiter is not None:
+                # The server is throttling this client, so hold back its other workers too,
+                # and send more slowly until the server has kept up for a while
+                self._rate_limiter.pause(delay)
+                self._rate_limiter.slow_down()
+            logger.warning("Received HTTP %s from %s, retrying in %.1fs (attempt %d/%d)",
+                           response.status_code, url, delay, attempt + 1, MAX_RETRIES)
+            # Release the connection of a streamed response before retrying
+            self._release(response)
+            time.sleep(delay)
+        return response
+
+    @staticmethod
+    def _release(response: requests.Response) -> None:
+        """Close a streamed response, keeping its connection alive when the body is small.
+
+        Closing a response whose body was not read discards its connection, so a
+        later request has to open a new one.
+        """
+        try:
+            length = int(response.headers.get("Content-Length", ""))
+        except (TypeError, ValueError):
+            length = None
+        if length is not None and length <= MAX_DRAINED_BODY_BYTES:
+            response.raw.drain_conn()
+        response.close()
+
+    def _report_request_error(self, e: requests.exceptions.RequestException, url: str) -> None:
+        """Raise on authentication failures, otherwise log the failed request"""
+        response = getattr(e, 'response', None)
+        # Read the error body once, and only when it is logged; a streamed body
+        # cannot be read a second time
+        log_errors = logger.isEnabledFor(logging.ERROR)
+        response_text = None
+        if response is not None and log_errors:
+            response_text = self.error_body(response)
+        self._handle_auth_errors(e, response_text)
+        if not log_errors:
+            if response is not None:
+                response.close()
+            return
+        logger.error("API Error: %s", e)
+        if response is not None:
+            logger.error("Status: %s", response.status_code)
+            logger.error("URL: %s", url)
+            logger.error("Response Text: %s", response_text)
+
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Optional[Union[Dict, List]]:
+        """Decode a JSON response body, using orjson when it is installed"""
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass  # Let requests raise its usual error for non-JSON bodies
+        return response.json()
+
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Union[Dict, List]]:
+        """Make GET request to API endpoint.
+
+        Successful responses for endpoints without query parameters are reused for
+        a short time, and callers asking for an endpoint that is already being
+        fetched wait for that response, so repeated lookups cost one request.
+        """
+        if params:
+            return self._make_request("GET", endpoint, params=params)
+
+        cached = self._get_cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        with self._inflight_lock:
+            inflight = self._inflight.get(endpoint)
+            if inflight is None:
+                future = self._inflight[endpoint] = Future()
+        if inflight is not None:
+            return inflight.result()
 
         try:
-            response = self.session.post(url, params=params, json=json)
+            result = self._make_request("GET", endpoint, params=params)
+            if result is not None:
+                self._cache_response(endpoint, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[endpoint]
+
+    def exists(self, endpoint: str, params: Optional[Dict] = None) -> bool:
+        """Check whether a resource exists without downloading or decoding its body.
+
+        A 404 is an expected answer to this check and is not logged as an error.
+        """
+        cached = None if params else self._get_cache.get(endpoint)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return True
+
+        url = self._url(endpoint)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking existence of: %s", url)
+        try:
+            response = self._send("GET", url, params=params, stream=True)
+            if response.status_code == 404:
+                self._release(response)
+                return False
             response.raise_for_status()
-            return response.json()
+            self._release(response)
+            return True
         except requests.exceptions.RequestException as e:
-            self._handle_auth_errors(e)
-            logger.error("API Error: %s", e)
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error("Status: %s", e.response.status_code)
-                logger.error("URL: %s", url)
-                logger.error("Response Text: %s", e.response.text)
-            return None
+            self._report_request_error(e, url)
+            return False
+
+    def get_raw(self, endpoint: str, params: Optional[Dict] = None) -> Optional[bytes]:
+        """Make GET request to API endpoint and return the undecoded JSON body.
 
-    def put(self, endpoint: str, params: Optional[Dict] = None,
-            json: Optional[Dict] = None) -> Optional[Union[Dict, List]]:
-        """Make PUT request to API endpoint"""
-        url = f"{self.base_url}{endpoint}"
-        logger.debug("Making PUT request to: %s", url)
+        For bodies that are forwarded unchanged, skipping a decode and re-encode.
+        """
+        return self._request("GET", endpoint, lambda response: response.content, params=params)
 
+    def send_raw(self, method: str, endpoint: str, data: Union[str, bytes], content_type: str,
+                 params: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Send a request with a body that is not JSON and return its response unread.
+
+        Retries on rate limiting and transient errors like the JSON methods do;
+        the caller checks the status of the final response. Returns None when
+        the request could not be sent, after logging the error.
+        """
+        self._invalidate_cache(endpoint)
+        url = self._url(endpoint)
         try:
-            response = self.session.put(url, params=params, json=json)
-            response.raise_for_status()
-            return response.json()
+            return self._send(method, url, params=params, data=data,
+                              headers={"Content-Type": content_type})
         except requests.exceptions.RequestException as e:
-            self._handle_auth_errors(e)
-            logger.error("API Error: %s", e)
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error("Status: %s", e.response.status_code)
-                logger.error("URL: %s", url)
-                logger.error("Response Text: %s", e.response.text)
+            self._report_request_error(e, url)
             return None
 
+    def post(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None,
+             idempotency_key: Optional[str] = None, data: Optional[bytes] = None) -> Optional[Union[Dict, List]]:
+        """Make POST request to API endpoint.
+
+        The body is given either as json, or as data already encoded as JSON.
+        An idempotency key is sent unchanged on every retry attempt, letting the
+        server discard duplicates of a create whose response was lost.
+        """
+        kwargs: Dict[str, Any] = {"params": params, "json": json}
+        if data is not None:
+            kwargs["data"] = data
+        if idempotency_key:
+            kwargs["headers"] = {"Idempotency-Key": idempotency_key}
+        return self._make_request("POST", endpoint, **kwargs)
+
+    def put(self, endpoint: str, params: Optional[Dict] = None, json: Optional[Dict] = None,
+            data: Optional[bytes] = None) -> Optional[Union[Dict, List]]:
+        """Make PUT request to API endpoint, with a json body or data already encoded as JSON"""
+        if data is not None:
+            return self._make_request("PUT", endpoint, params=params, json=json, data=data)
+        return self._make_request("PUT", endpoint, params=params, json=json)
+
     def delete(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Union[Dict, List]]:
         """Make DELETE request to API endpoint"""
-        url = f"{self.base_url}{endpoint}"
-        logger.debug("Making DELETE request to: %s", url)
+        return self._make_request("DELETE", endpoint, params=params)
 
-        try:
-            response = self.session.delete(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            self._handle_auth_errors(e)
-            logger.error("API Error: %s", e)
-            if hasattr(e, 'response') and e.response is not None:
-                logger.error("Status: %s", e.response.status_code)
-                logger.error("URL: %s", url)
-                logger.error("Response Text: %s", e.response.text)
-            return None
+    @staticmethod
+    def error_body(response: requests.Response) -> str:
+        """Decode the start of a response body for logging without decoding all of it"""
+        if getattr(response, "_content", None) is False:
+            # Streamed (stream=True) body that has not been read yet: fetch only the prefix
+            # and release the connection instead of downloading the whole error page
+            head = next(response.iter_content(MAX_ERROR_BODY_BYTES), b"")
+            response.close()
+        else:
+            head = response.content[:MAX_ERROR_BODY_BYTES]
+        return head.decode("utf-8", errors="replace")
 
     @staticmethod
     def normalize_response(response: Optional[Union[Dict, List]]) -> List[Dict]:
@@ -4,21 +4,41 @@ Base Replicator
 Base class with common functionality for all replication handlers.
 """
 
+import hashlib
 import logging
-from typing import Any, Dict, Optional
+import threading
+import uuid
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 from .api_client import HarnessAPIClient
+from .yaml_utils import YAMLUtils
 
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent API workers used by handlers
+DEFAULT_MAX_WORKERS = 4
+
+# Number of items requested per page from list endpoints
+LIST_PAGE_SIZE = 100
+
+# Statistics are shared between handlers and may be updated from worker threads
+_stats_lock = threading.Lock()
+
 
 class BaseReplicator:
     """Base class for replication handlers"""
 
     def __init__(self, config: Dict[str, Any], source_client: HarnessAPIClient,
-                 dest_client: HarnessAPIClient, replication_stats: Dict[str, Dict[str, int]]):
-        """Initialize base replicator"""
+                 dest_client: HarnessAPIClient, replication_stats: Dict[str, Dict[str, int]],
+                 run_id: Optional[str] = None):
+        """Initialize base replicator.
+
+        Handlers of one replication run share its run_id, which scopes their idempotency keys.
+        """
         self.config = config
+        self.run_id = run_id or uuid.uuid4().hex
+        # Options are read for every replicated resource, so keep their section at hand
+        self._options = config.get("options", {})
         self.source_org = config["source"]["org"]
         self.source_project = config["source"]["project"]
         self.dest_org = config["destination"]["org"]
@@ -28,9 +48,50 @@ class BaseReplicator:
         self.dest_client = dest_client
         self.replication_stats = replication_stats
 
+        # Org/project path prefixes, built once since most endpoints are scoped to one of them
+        self._source_scope = self._build_endpoint(org=self.source_org, project=self.source_project)
+        self._dest_scope = self._build_endpoint(org=self.dest_org, project=self.dest_project)
+        # Replicating within one org/project leaves identifiers in YAML unchanged
+        self._same_scope = self._source_scope == self._dest_scope
+
     def _get_option(self, key: str, default: Any = None) -> Any:
         """Get configuration option with default value"""
-        return self.config.get("options", {}).get(key, default)
+        return self._options.get(key, default)
+
+    def _get_max_workers(self) -> int:
+        """Get the maximum number of concurrent API workers"""
+        return max(1, int(self._get_option("max_workers", DEFAULT_MAX_WORKERS)))
+
+    def _increment_stat(self, resource: str, outcome: str) -> None:
+        """Increment a replication statistic (safe to call from worker threads)"""
+        with _stats_lock:
+            self.replication_stats[resource][outcome] += 1
+
+    def _merge_stats(self, resource: str, outcomes: Mapping[str, int]) -> None:
+        """Add outcome counts collected by a worker to the replication statistics at once"""
+        if not outcomes:
+            return
+        with _stats_lock:
+            stats = self.replication_stats[resource]
+            for outcome, count in outcomes.items():
+                stats[outcome] += count
+
+    def _idempotency_key(self, resource: str, *parts: Optional[str]) -> str:
+        """Derive an idempotency key for creating a resource in the destination.
+
+        The key repeats for retries within a run but not across runs, so a resource
+        deleted from the destination is created again when replication is re-run.
+        """
+        raw = "|".join([self.run_id, self.dest_org, self.dest_project, resource,
+                        *(part or "" for part in parts)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    def _rewrite_identifiers(self, yaml_content: str, wrapper_key: str) -> str:
+        """Point org/project identifiers in YAML at the destination"""
+        if self._same_scope:
+            return yaml_content
+        return YAMLUtils.update_identifiers(
+            yaml_content, self.dest_org, self.dest_project, wrapper_key=wrapper_key)
 
     def _is_dry_run(self) -> bool:
         """Check if running in dry-run mode"""
@@ -40,6 +101,45 @@ class BaseReplicator:
         """Check if running in interactive mode"""
         return not self.config.get("non_interactive", False)
 
+    def _iter_pages(self, client: HarnessAPIClient, endpoint: str,
+                    params: Optional[Dict[str, Any]] = None) -> Iterator[Optional[List[Dict]]]:
+        """Iterate over the pages of a list endpoint, fetching one page at a time.
+
+        Stops at the first short page, and at a page listing only items already
+        seen, which a server ignoring the paging parameters returns forever. A
+        page whose request failed is yielded as None and also ends the iteration.
+        """
+        seen: Set[Tuple[str, Optional[str]]] = set()
+        page = 0
+        while True:
+            page_params = dict(params or {}, page=page, limit=LIST_PAGE_SIZE)
+            response = client.get(endpoint, params=page_params)
+            if response is None:
+                yield None
+                return
+            items = HarnessAPIClient.normalize_response(response)
+            # Versions of a template share its identifier, so they are told apart by label
+            keys = {(item["identifier"], item.get("version_label", item.get("versionLabel")))
+                    for item in items if isinstance(item, dict) and item.get("identifier")}
+            if keys and keys <= seen:
+                return
+            seen |= keys
+            yield items
+            if len(items) < LIST_PAGE_SIZE:
+                return
+            page += 1
+
+    def _iter_list(self, client: HarnessAPIClient, endpoint: str,
+                   params: Optional[Dict[str, Any]] = None) -> Iterator[Dict]:
+        """Iterate over all items of a list endpoint, fetching one page at a time.
+
+        Items are yielded as each page arrives, so callers can start processing
+        before later pages are requested.
+        """
+        for items in self._iter_pages(client, endpoint, params):
+            if items:
+                yield from items
+
     def _build_endpoint(self, resource: Optional[str] = None, org: Optional[str] = None,
                         project: Optional[str] = None, resource_id: Optional[str] = None,
                         sub_resource: Optional[str] = None) -> str:
@@ -58,3 +158,13 @@ class BaseReplicator:
             parts.append(sub_resource)
 
         return "/".join(parts)
+
+    def _source_endpoint(self, resource: str, resource_id: Optional[str] = None,
+                         sub_resource: Optional[str] = None) -> str:
+        """Build an endpoint path within the source org/project"""
+        return "/".join(filter(None, (self._source_scope, resource, resource_id, sub_resource)))
+
+    def _dest_endpoint(self, resource: str, resource_id: Optional[str] = None,
+                       sub_resource: Optional[str] = None) -> str:
+        """Build an endpoint path within the destination org/project"""
+        return "/".join(filter(None, (self._dest_scope, resource, resource_id, sub_resource)))
@@ -10,6 +10,7 @@ import sys
 from .api_client import HarnessAuthenticationError
 from .argument_parser import ArgumentParser
 from .config import build_complete_config, load_config, save_config, should_save_config
+from .config_validator import ConfigValidator
 from .logging_utils import setup_logging
 from .mode_handlers import ModeHandlers
 from .replicator import HarnessReplicator
@@ -138,31 +139,19 @@ def _prompt_save_config(config: dict, config_file: str) -> None:
 
 def _validate_final_config(config: dict, is_non_interactive: bool, has_cli_pipelines: bool) -> bool:
     """Final validation - check for required variables and declare what must be set"""
-    missing_vars = []
-
     # Required fields for all modes
-    required_fields = [
-        ("source", "base_url", "Source Harness URL"),
-        ("source", "api_key", "Source API key"),
-        ("source", "org", "Source organization"),
-        ("source", "project", "Source project"),
-        ("destination", "base_url", "Destination Harness URL"),
-        ("destination", "api_key", "Destination API key"),
-        ("destination", "org", "Destination organization"),
-        ("destination", "project", "Destination project"),
-    ]
-
-    # Check required fields
-    for section, key, description in required_fields:
-        section_data = config.get(section, {})
-        if not isinstance(section_data, dict) or not section_data.get(key):
-            missing_vars.append(f"{section}.{key} ({description})")
+    missing_vars = ConfigValidator.missing_required_fields(config)
 
     # Check pipelines requirement for non-interactive mode without CLI pipelines
     if is_non_interactive and not has_cli_pipelines:
         if not config.get("pipelines"):
             missing_vars.append("pipelines (Pipeline specifications)")
 
+    # Numeric options from any source must be usable before replication starts
+    invalid_options = ConfigValidator.invalid_options(config)
+    for option in invalid_options:
+        logger.error("Invalid configuration option: %s", option)
+
     # If any required variables are missing, error and declare what must be set
     if missing_vars:
         logger.error("Missing required configuration variables:")
@@ -176,7 +165,7 @@ def _validate_final_config(config: dict, is_non_interactive: bool, has_cli_pipel
         logger.error("  - Interactive mode (prompts)")
         return False
 
-    return True
+    return not invalid_options
 
 
 if __name__ == "__main__":
@@ -4,14 +4,20 @@ Configuration Management
 Handles loading, saving, and managing configuration files.
 """
 
+import copy
 import json
 import logging
 import os
 import re
 from typing import Any, Dict
 
+from .config_validator import ConfigValidator
+
 logger = logging.getLogger(__name__)
 
+# Matches JSONC comments: whole-line // comments and /* */ blocks
+_JSONC_COMMENT_RE = re.compile(r'^\s*//[^\n]*$|/\*.*?\*/', re.MULTILINE | re.DOTALL)
+
 
 def load_config(config_file: str) -> Dict[str, Any]:
     """Load configuration from JSON file, handling JSONC comments and environment variable overrides
@@ -26,9 +32,8 @@ def load_config(config_file: str) -> Dict[str, Any]:
         with open(config_file, "r", encoding="utf-8") as f:
             content = f.read()
 
-        # Remove JSONC comments (// and /* */)
-        content = re.sub(r'^\s*//.*$', '', content, flags=re.MULTILINE)
-        content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+        # Remove JSONC comments (// and /* */) in one pass
+        content = _JSONC_COMMENT_RE.sub('', content)
 
         config = json.loads(content)
         logger.info("Configuration loaded from %s", config_file)
@@ -72,6 +77,12 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
         "HARNESS_NON_INTERACTIVE": ("", "non_interactive"),
     }
 
+    # Positive numeric options with environment variable support, and their types
+    number_env_mappings = {
+        "HARNESS_RATE_LIMIT_RPS": ("options", "rate_limit_rps", float),
+        "HARNESS_MAX_WORKERS": ("options", "max_workers", int),
+    }
+
     # Apply string environment variables
     for env_var, (section, key) in string_env_mappings.items():
         env_value = os.getenv(env_var)
@@ -96,6 +107,21 @@ def _apply_env_overrides(config: Dict[str, Any]) -> Dict[str, Any]:
                 config[key] = bool_value
                 logger.info("Environment override: %s=%s -> %s=%s", env_var, env_value, key, bool_value)
 
+    # Apply numeric environment variables
+    for env_var, (section, key, number_type) in number_env_mappings.items():
+        env_value = os.getenv(env_var)
+        if env_value is not None:
+            try:
+                number_value = number_type(env_value)
+            except ValueError:
+                logger.warning("Ignoring %s=%s: not a valid %s", env_var, env_value, number_type.__name__)
+                continue
+            if not ConfigValidator.is_positive_number(number_value, number_type):
+                logger.warning("Ignoring %s=%s: must be greater than 0", env_var, env_value)
+                continue
+            config.setdefault(section, {})[key] = number_value
+            logger.info("Environment override: %s -> %s.%s=%s", env_var, section, key, number_value)
+
     return config
 
 
@@ -226,7 +252,6 @@ def build_complete_config(config_file: str, args, interactive_config: Dict[str,
 def _apply_cli_overrides(config: Dict[str, Any], args) -> Dict[str, Any]:
     """Apply CLI argument overrides to configuration (step 3 in priority order)"""
     # Create a deep copy to avoid modifying the original
-    import copy
     updated_config = copy.deepcopy(config)
 
     # Source configuration overrides
@@ -291,7 +316,6 @@ def _apply_cli_overrides(config: Dict[str, Any], args) -> Dict[str, Any]:
 
 def _merge_interactive_config(config: Dict[str, Any], interactive_config: Dict[str, Any]) -> Dict[str, Any]:
     """Merge interactive selections into configuration (step 4 in priority order)"""
-    import copy
     merged_config = copy.deepcopy(config)
 
     # Interactive selections override all previous values
@@ -5,30 +5,70 @@ Handles validation of configuration for different modes.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
+# Connection settings every mode needs, as (section, key, description)
+REQUIRED_FIELDS = (
+    ("source", "base_url", "Source Harness URL"),
+    ("source", "api_key", "Source API key"),
+    ("source", "org", "Source organization"),
+    ("source", "project", "Source project"),
+    ("destination", "base_url", "Destination Harness URL"),
+    ("destination", "api_key", "Destination API key"),
+    ("destination", "org", "Destination organization"),
+    ("destination", "project", "Destination project"),
+)
+
+# Options that must be numbers greater than 0, as key: (type of number, description)
+POSITIVE_NUMBER_OPTIONS = {
+    "rate_limit_rps": (float, "a number greater than 0"),
+    "max_workers": (int, "a positive integer"),
+}
+
 
 class ConfigValidator:
     """Validates configuration for different execution modes"""
 
     @staticmethod
-    def validate_non_interactive_config(config: Dict[str, Any], has_cli_pipelines: bool = False) -> bool:
-        """Validate configuration for non-interactive mode"""
-        # Validate required fields
-        required_fields = [
-            ("source", "base_url"), ("source", "api_key"), ("source", "org"),
-            ("source", "project"), ("destination", "base_url"), ("destination", "api_key"),
-            ("destination", "org"), ("destination", "project")
+    def missing_required_fields(config: Dict[str, Any]) -> List[str]:
+        """Return every required field missing from the configuration, in one pass"""
+        sections = {section: config.get(section) for section in ("source", "destination")}
+        return [
+            f"{section}.{key} ({description})"
+            for section, key, description in REQUIRED_FIELDS
+            if not isinstance(sections[section], dict) or not sections[section].get(key)
         ]
 
-        # Check all required fields
-        for section, key in required_fields:
-            section_data = config.get(section, {})
-            if isinstance(section_data, dict) and not section_data.get(key):
-                logger.error("Missing required field: %s.%s", section, key)
-                return False
+    @staticmethod
+    def is_positive_number(value: Any, number_type: type) -> bool:
+        """Check that a value is a number of the given type (an int also counts as a float) above 0"""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        if number_type is int and not isinstance(value, int):
+            return False
+        return value > 0
+
+    @staticmethod
+    def invalid_options(config: Dict[str, Any]) -> List[str]:
+        """Return every numeric option set to something other than a positive number"""
+        options = config.get("options") or {}
+        return [
+            f"options.{key}={options[key]!r} (must be {description})"
+            for key, (number_type, description) in POSITIVE_NUMBER_OPTIONS.items()
+            if key in options and not ConfigValidator.is_positive_number(options[key], number_type)
+        ]
+
+    @staticmethod
+    def validate_non_interactive_config(config: Dict[str, Any], has_cli_pipelines: bool = False) -> bool:
+        """Validate configuration for non-interactive mode"""
+        # Report every missing field at once rather than stopping at the first
+        missing_fields = ConfigValidator.missing_required_fields(config)
+        for field in missing_fields:
+            logger.error("Missing required field: %s", field)
+        if missing_fields:
+            return False
 
         # Only require pipelines in config if not provided via CLI
         if not has_cli_pipelines:
@@ -4,13 +4,14 @@ Input Set Handler
 Handles input set replication functionality.
 """
 
+import itertools
 import logging
-import time
-# No additional imports needed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
 
 from .api_client import HarnessAPIClient
 from .base_replicator import BaseReplicator
-from .yaml_utils import YAMLUtils
 
 logger = logging.getLogger(__name__)
 
@@ -18,95 +19,130 @@ logger = logging.getLogger(__name__)
 class InputSetHandler(BaseReplicator):
     """Handles input set replication"""
 
+    def __init__(self, config: Dict[str, Any], source_client: HarnessAPIClient,
+                 dest_client: HarnessAPIClient, replication_stats: Dict[str, Dict[str, int]],
+                 run_id: Optional[str] = None):
+        """Initialize input set handler"""
+        super().__init__(config, source_client, dest_client, replication_stats, run_id)
+        # Every input set is read from and written to the same collections
+        self._source_input_sets_endpoint = self._source_endpoint("input-sets")
+        self._dest_input_sets_endpoint = self._dest_endpoint("input-sets")
+
     def replicate_input_sets(self, pipeline_id: str) -> bool:
         """Replicate input sets for a specific pipeline"""
         logger.info("  Checking for input sets for pipeline: %s", pipeline_id)
 
-        # List input sets
-        endpoint = self._build_endpoint(
-            "input-sets", org=self.source_org, project=self.source_project)
-        params = {"pipeline": pipeline_id}
-        input_sets_response = self.source_client.get(endpoint, params=params)
-        input_sets = HarnessAPIClient.normalize_response(input_sets_response)
+        # List input sets page by page, replicating them as they arrive
+        input_sets = self._iter_list(
+            self.source_client, self._source_input_sets_endpoint, params={"pipeline": pipeline_id})
 
-        if not input_sets:
+        first_input_set = next(input_sets, None)
+        if first_input_set is None:
             logger.info("  No input sets found for pipeline: %s", pipeline_id)
             return True
 
-        logger.info("  Replicating %d input sets...", len(input_sets))
-
-        for input_set in input_sets:
-            input_set_id = input_set.get("identifier")
-            input_set_name = input_set.get("name", input_set_id)
-            logger.info("  Replicating input set: %s", input_set_name)
-
-            # Get full input set details
-            get_endpoint = self._build_endpoint(
-                "input-sets", org=self.source_org, project=self.source_project,
-                resource_id=input_set_id)
-            input_set_details = self.source_client.get(
-                get_endpoint, params={"pipeline": pipeline_id})
-
-            if not input_set_details:
-                logger.error("  Failed to get details for input set: %s", input_set_id)
-                self.replication_stats["input_sets"]["failed"] += 1
-                continue
+        # One listing answers which input sets the destination already has
+        existing_ids = self._list_destination_input_sets(pipeline_id)
+
+        # Input sets are independent of each other, so replicate them concurrently and
+        # record their outcomes in the shared statistics once
+        outcomes: Counter = Counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+                for outcome in executor.map(
+                        lambda input_set: self._replicate_input_set(pipeline_id, input_set, existing_ids),
+                        itertools.chain([first_input_set], input_sets)):
+                    outcomes[outcome] += 1
+        finally:
+            self._merge_stats("input_sets", outcomes)
+
+        logger.info("  Processed %d input sets for pipeline: %s", sum(outcomes.values()), pipeline_id)
+        return True
 
-            # Check if input set already exists in destination
-            existing_endpoint = self._build_endpoint(
-                "input-sets", org=self.dest_org, project=self.dest_project,
-                resource_id=input_set_id)
-            existing_input_set = self.dest_client.get(
+    def _list_destination_input_sets(self, pipeline_id: str) -> Optional[Set[str]]:
+        """List the identifiers of a pipeline's input sets in the destination, or None if listing failed"""
+        identifiers: Set[str] = set()
+        for input_sets in self._iter_pages(
+                self.dest_client, self._dest_input_sets_endpoint, params={"pipeline": pipeline_id}):
+            if input_sets is None:
+                return None
+            identifiers.update(
+                input_set["identifier"] for input_set in input_sets
+                if isinstance(input_set, dict) and input_set.get("identifier"))
+        return identifiers
+
+    def _replicate_input_set(self, pipeline_id: str, input_set: Dict,
+                             existing_ids: Optional[Set[str]] = None) -> str:
+        """Replicate a single input set from source to destination, returning the outcome.
+
+        existing_ids holds the input sets listed in the destination; when the
+        listing is unavailable, the destination is probed for this input set.
+        """
+        input_set_id = input_set.get("identifier")
+        input_set_name = input_set.get("name", input_set_id)
+        logger.info("  Replicating input set: %s", input_set_name)
+
+        # Check if input set already exists in destination
+        existing_endpoint = f"{self._dest_input_sets_endpoint}/{input_set_id}"
+        if existing_ids is not None:
+            existing_input_set = input_set_id in existing_ids
+        else:
+            existing_input_set = self.dest_client.exists(
                 existing_endpoint, params={"pipeline": pipeline_id})
 
-            if existing_input_set:
-                if not self._get_option("update_existing", False):
-                    logger.info("  Input set '%s' already exists, skipping", input_set_name)
-                    self.replication_stats["input_sets"]["skipped"] += 1
-                    continue
-                else:
-                    logger.info("  Input set '%s' already exists, updating", input_set_name)
-
-            # Update org/project identifiers in input set YAML
-            if isinstance(input_set_details, dict) and "input_set_yaml" in input_set_details:
-                yaml_content = input_set_details["input_set_yaml"]
-                updated_yaml = YAMLUtils.update_identifiers(
-                    yaml_content, self.dest_org, self.dest_project, wrapper_key="inputSet")
-                input_set_details["input_set_yaml"] = updated_yaml
-
-            # Create or update input set in destination
-            create_endpoint = self._build_endpoint(
-                "input-sets", org=self.dest_org, project=self.dest_project)
-
-            if self._is_dry_run():
-                action = "update" if existing_input_set else "create"
-                logger.info("  [DRY RUN] Would %s input set '%s'", action, input_set_name)
-                result = True
+        if existing_input_set:
+            if not self._get_option("update_existing", False):
+                logger.info("  Input set '%s' already exists, skipping", input_set_name)
+                return "skipped"
             else:
-                json_data = input_set_details if isinstance(input_set_details, dict) else None
-                if existing_input_set:
-                    # Update existing input set
-                    update_endpoint = self._build_endpoint(
-                        "input-sets", org=self.dest_org, project=self.dest_project,
-                        resource_id=input_set_id)
-                    result = self.dest_client.put(
-                        update_endpoint, params={"pipeline": pipeline_id},
-                        json=json_data)
-                else:
-                    # Create new input set
-                    result = self.dest_client.post(
-                        create_endpoint, params={"pipeline": pipeline_id},
-                        json=json_data)
-
-            if result:
-                action = "updated" if existing_input_set else "created"
-                logger.info("  ✓ Input set '%s' %s successfully", input_set_name, action)
-                self.replication_stats["input_sets"]["success"] += 1
-            else:
-                action = "update" if existing_input_set else "create"
-                logger.error("  ✗ Failed to %s input set: %s", action, input_set_name)
-                self.replication_stats["input_sets"]["failed"] += 1
-
-            time.sleep(0.3)
-
-        return True
+                logger.info("  Input set '%s' already exists, updating", input_set_name)
+
+        # A dry run only reports what would happen, so the full details are not needed
+        if self._is_dry_run():
+            action = "update" if existing_input_set else "create"
+            logger.info("  [DRY RUN] Would %s input set '%s'", action, input_set_name)
+            return "success"
+
+        # Get full input set details
+        get_endpoint = f"{self._source_input_sets_endpoint}/{input_set_id}"
+        if self._same_scope:
+            # Identifiers stay the same, so the source body is forwarded without decoding it
+            raw_details = self.source_client.get_raw(get_endpoint, params={"pipeline": pipeline_id})
+            input_set_details = None
+        else:
+            input_set_details = self.source_client.get(
+                get_endpoint, params={"pipeline": pipeline_id})
+            raw_details = None
+
+        if not input_set_details and not raw_details:
+            logger.error("  Failed to get details for input set: %s", input_set_id)
+            return "failed"
+
+        # Update org/project identifiers in input set YAML
+        if isinstance(input_set_details, dict) and "input_set_yaml" in input_set_details:
+            yaml_content = input_set_details["input_set_yaml"]
+            updated_yaml = self._rewrite_identifiers(yaml_content, wrapper_key="inputSet")
+            input_set_details["input_set_yaml"] = updated_yaml
+
+        # Create or update input set in destination
+        json_data = input_set_details if isinstance(input_set_details, dict) else None
+        if existing_input_set:
+            # Update existing input set
+            result = self.dest_client.put(
+                existing_endpoint, params={"pipeline": pipeline_id},
+                json=json_data, data=raw_details)
+        else:
+            # Create new input set
+            result = self.dest_client.post(
+                self._dest_input_sets_endpoint, params={"pipeline": pipeline_id},
+                json=json_data, data=raw_details,
+                idempotency_key=self._idempotency_key("input-sets", pipeline_id, input_set_id))
+
+        if result:
+            action = "updated" if existing_input_set else "created"
+            logger.info("  ✓ Input set '%s' %s successfully", input_set_name, action)
+            return "success"
+
+        action = "update" if existing_input_set else "create"
+        logger.error("  ✗ Failed to %s input set: %s", action, input_set_name)
+        return "failed"
@@ -4,14 +4,38 @@ Logging Utilities
 Handles logging configuration and setup with output orchestrator integration.
 """
 
+import atexit
 import logging
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 from .output_orchestrator import OutputType, setup_output
 
+# Background listener that writes queued records to the log file
+_file_listener: Optional[QueueListener] = None
+
+# Log file of this process, named once so repeated setup keeps writing to the same file
+_log_file_name: Optional[str] = None
+
+
+def _stop_file_listener() -> None:
+    """Flush queued records to the log file, stop the background listener and close the file"""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(debug: bool = False, output_json: bool = False, output_color: bool = True) -> None:
     """Setup logging configuration with output orchestrator integration"""
+    global _file_listener, _log_file_name
     level = logging.DEBUG if debug else logging.INFO
 
     # Determine output type based on configuration
@@ -23,12 +47,23 @@ def setup_logging(debug: bool = False, output_json: bool = False, output_color:
     # Set logging level
     logging.getLogger().setLevel(level)
 
-    # Add file handler for persistent logging (in addition to orchestrator)
-    file_handler = logging.FileHandler(
-        f'replication_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
-    )
+    # Add file handler for persistent logging (in addition to orchestrator); the file is
+    # opened by the listener thread when the first record arrives, not on the caller's thread
+    if _log_file_name is None:
+        _log_file_name = f'replication_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+    file_handler = logging.FileHandler(_log_file_name, encoding="utf-8", delay=True)
     file_handler.setLevel(level)
     file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(name)s - %(message)s"))
 
+    # Write the file from a background thread so worker threads never wait on disk I/O;
+    # console output stays synchronous so it remains ordered with prompts and prints
+    _stop_file_listener()
+    log_queue: queue.Queue = queue.Queue(-1)
+    _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_listener.start()
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+
     # Add file handler to root logger (orchestrator already handles console output)
-    logging.getLogger().addHandler(file_handler)
+    logging.getLogger().addHandler(queue_handler)
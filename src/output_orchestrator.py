@@ -7,12 +7,19 @@ This orchestrator translates internal state into the desired display format.
 
 import json
 import logging
+import re
 import sys
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+# Patterns highlighted in terminal messages, compiled once since every log line is scanned
+_VARIABLE_RE = re.compile(r'\b\w+_\w+\b')
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]*)"')
+_SINGLE_QUOTED_RE = re.compile(r"'([^']*)'")
+_URL_RE = re.compile(r'https?://[^\s]+')
+
 
 class OutputLevel(Enum):
     """Output severity levels"""
@@ -95,6 +102,13 @@ class TerminalOutputTransformer(OutputTransformer):
     VALUE_COLOR = "\033[95m"     # Magenta
     URL_COLOR = "\033[94m"       # Blue
 
+    # Summary counters in display order, with their labels and the level whose color they use
+    SUMMARY_FIELDS = (
+        ("success", "Success", OutputLevel.SUCCESS),
+        ("failed", "Failed", OutputLevel.ERROR),
+        ("skipped", "Skipped", OutputLevel.WARNING),
+    )
+
     def __init__(self, use_colors: bool = True):
         self.use_colors = use_colors and sys.stdout.isatty()
 
@@ -123,13 +137,12 @@ class TerminalOutputTransformer(OutputTransformer):
             return text
 
         # Color variables (words with underscores or in quotes)
-        import re
-        text = re.sub(r'\b\w+_\w+\b', lambda m: self._colorize(m.group(), self.VARIABLE_COLOR), text)
-        text = re.sub(r'"([^"]*)"', lambda m: f'"{self._colorize(m.group(1), self.VALUE_COLOR)}"', text)
-        text = re.sub(r"'([^']*)'", lambda m: f"'{self._colorize(m.group(1), self.VALUE_COLOR)}'", text)
+        text = _VARIABLE_RE.sub(lambda m: self._colorize(m.group(), self.VARIABLE_COLOR), text)
+        text = _DOUBLE_QUOTED_RE.sub(lambda m: f'"{self._colorize(m.group(1), self.VALUE_COLOR)}"', text)
+        text = _SINGLE_QUOTED_RE.sub(lambda m: f"'{self._colorize(m.group(1), self.VALUE_COLOR)}'", text)
 
         # Color URLs
-        text = re.sub(r'https?://[^\s]+', lambda m: self._colorize(m.group(), self.URL_COLOR), text)
+        text = _URL_RE.sub(lambda m: self._colorize(m.group(), self.URL_COLOR), text)
 
         return text
 
@@ -160,15 +173,11 @@ class TerminalOutputTransformer(OutputTransformer):
 
         # Resource statistics
         for resource_type, stats in summary_data.items():
-            if isinstance(stats, dict) and all(k in stats for k in ['success', 'failed', 'skipped']):
-                resource_title = self._colorize(f"{resource_type.upper()}:", self.BOLD)
-                lines.append(resource_title)
-
-                success_text = f"  Success: {self._colorize(str(stats['success']), self.COLORS[OutputLevel.SUCCESS])}"
-                failed_text = f"  Failed: {self._colorize(str(stats['failed']), self.COLORS[OutputLevel.ERROR])}"
-                skipped_text = f"  Skipped: {self._colorize(str(stats['skipped']), self.COLORS[OutputLevel.WARNING])}"
-
-                lines.extend([success_text, failed_text, skipped_text, ""])
+            if isinstance(stats, dict) and all(key in stats for key, _, _ in self.SUMMARY_FIELDS):
+                lines.append(self._colorize(f"{resource_type.upper()}:", self.BOLD))
+                lines.extend(f"  {label}: {self._colorize(str(stats[key]), self.COLORS[level])}"
+                             for key, label, level in self.SUMMARY_FIELDS)
+                lines.append("")
 
         lines.append(self._colorize(separator, self.BOLD))
         return "\n".join(lines)
@@ -196,14 +205,17 @@ class JSONOutputTransformer(OutputTransformer):
     def __init__(self):
         self.messages: List[Dict[str, Any]] = []
 
-    def format_message(self, message: OutputMessage) -> str:
-        """Format a single message for JSON output (store for batch output)"""
+    def collect_message(self, message: OutputMessage) -> Dict[str, Any]:
+        """Store a message for batch output without serializing it"""
         message_dict = message.to_dict()
         self.messages.append(message_dict)
+        return message_dict
 
+    def format_message(self, message: OutputMessage) -> str:
+        """Format a single message for JSON output (store for batch output)"""
         # For JSON mode, we typically don't output individual messages immediately
         # Instead, we collect them and output at the end
-        return json.dumps(message_dict)
+        return json.dumps(self.collect_message(message))
 
     def format_summary(self, summary_data: Dict[str, Any]) -> str:
         """Format summary data for JSON output"""
@@ -249,29 +261,31 @@ class OutputOrchestrator:
         """Set up integration with Python logging system"""
         # Create custom handler that routes through orchestrator
         class OrchestatorHandler(logging.Handler):
+            # Map logging levels to output levels
+            LEVEL_MAPPING = {
+                logging.DEBUG: OutputLevel.DEBUG,
+                logging.INFO: OutputLevel.INFO,
+                logging.WARNING: OutputLevel.WARNING,
+                logging.ERROR: OutputLevel.ERROR,
+            }
+
             def __init__(self, orchestrator):
                 super().__init__()
                 self.orchestrator = orchestrator
 
             def emit(self, record):
-                # Map logging levels to output levels
-                level_mapping = {
-                    logging.DEBUG: OutputLevel.DEBUG,
-                    logging.INFO: OutputLevel.INFO,
-                    logging.WARNING: OutputLevel.WARNING,
-                    logging.ERROR: OutputLevel.ERROR,
-                }
-
-                output_level = level_mapping.get(record.levelno, OutputLevel.INFO)
+                output_level = self.LEVEL_MAPPING.get(record.levelno, OutputLevel.INFO)
                 message = self.format(record)
 
                 # Extract category from logger name
-                category = record.name.split('.')[-1] if '.' in record.name else record.name
+                category = record.name.rpartition('.')[2]
 
+                # Reuse the time the record was created rather than reading the clock again
                 self.orchestrator._output_message(OutputMessage(
                     level=output_level,
                     message=message,
-                    category=category
+                    category=category,
+                    timestamp=datetime.fromtimestamp(record.created)
                 ))
 
         # Replace existing handlers with orchestrator handler
@@ -289,12 +303,13 @@ class OutputOrchestrator:
 
     def _output_message(self, message: OutputMessage):
         """Internal method to output a message"""
-        formatted = self.transformer.format_message(message)
+        if isinstance(self.transformer, JSONOutputTransformer):
+            # For JSON output, messages are collected and serialized once at the end
+            self.transformer.collect_message(message)
+            return
 
-        if self.output_type == OutputType.TERMINAL:
-            # For terminal output, print immediately
-            print(formatted)
-        # For JSON output, messages are collected and output at the end
+        # For terminal output, print immediately
+        print(self.transformer.format_message(message))
 
     def debug(self, message: str, category: str = "general", data: Optional[Dict[str, Any]] = None):
         """Output debug message"""
@@ -5,107 +5,260 @@ Handles pipeline replication functionality.
 """
 
 import logging
-from typing import Dict, Optional
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Set, Union
 
+from .api_client import HarnessAPIClient
 from .base_replicator import BaseReplicator
 from .yaml_utils import YAMLUtils
 
 logger = logging.getLogger(__name__)
 
+# Pipeline definitions fetched ahead of replication, per worker, so memory stays bounded
+PREFETCH_AHEAD_PER_WORKER = 2
+
 
 class PipelineHandler(BaseReplicator):
     """Handles pipeline replication"""
 
+    def __init__(self, config: Dict[str, Any], source_client: HarnessAPIClient,
+                 dest_client: HarnessAPIClient, replication_stats: Dict[str, Dict[str, int]],
+                 run_id: Optional[str] = None):
+        """Initialize pipeline handler"""
+        super().__init__(config, source_client, dest_client, replication_stats, run_id)
+        # Every pipeline is read from and written to the same collections
+        self._source_pipelines_endpoint = self._source_endpoint("pipelines")
+        self._dest_pipelines_endpoint = self._dest_endpoint("pipelines")
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched_details: Dict[str, Future] = {}
+        self._prefetch_pending: Deque[str] = deque()
+        self._prefetch_lock = threading.Lock()
+        self._destination_pipeline_ids: Set[str] = set()
+        self._destination_pipelines_loaded = False
+        self._destination_listing_complete = False
+        # Pipelines the destination listing was narrowed to, or None if it recorded all of them
+        self._destination_listing_scope: Optional[Set[str]] = None
+        self._load_lock = threading.Lock()
+
+    def prefetch_pipeline_details(self) -> None:
+        """Start fetching the selected pipeline definitions from the source in the background.
+
+        Only a few definitions per worker are fetched ahead; each one taken for
+        replication starts the fetch of the next. Does nothing while a prefetch
+        is already running.
+        """
+        pipeline_ids = [p["identifier"] for p in self._selected_pipelines() if p.get("identifier")]
+        if not pipeline_ids:
+            return
+        workers = self._get_max_workers()
+        with self._prefetch_lock:
+            if self._prefetch_executor is not None:
+                return
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=workers)
+            self._prefetch_pending.extend(pipeline_ids)
+        for _ in range(workers * PREFETCH_AHEAD_PER_WORKER):
+            self._prefetch_next()
+
+    def _prefetch_next(self) -> None:
+        """Start fetching the next pending pipeline definition, if any"""
+        with self._prefetch_lock:
+            if self._prefetch_executor is None or not self._prefetch_pending:
+                return
+            pipeline_id = self._prefetch_pending.popleft()
+            self._prefetched_details[pipeline_id] = self._prefetch_executor.submit(
+                self._fetch_pipeline_details, pipeline_id)
+
+    def cancel_prefetch(self) -> None:
+        """Drop pipeline definitions that were prefetched but not used"""
+        with self._prefetch_lock:
+            self._prefetch_pending.clear()
+            for future in self._prefetched_details.values():
+                future.cancel()
+            self._prefetched_details.clear()
+            if self._prefetch_executor is not None:
+                self._prefetch_executor.shutdown(wait=False)
+                self._prefetch_executor = None
+
+    def load_destination_pipelines(self) -> None:
+        """Record the pipelines already present in the destination with a single listing.
+
+        Only runs once per replication. When every page of the listing was fetched,
+        it answers all existence checks; if a page failed, pipelines that were not
+        listed are still probed individually. When pipelines are selected, only
+        those are recorded, and the listing stops once all of them were found.
+        """
+        with self._load_lock:
+            if self._destination_pipelines_loaded:
+                return
+            self._destination_pipelines_loaded = True
+
+            selected = {p["identifier"] for p in self.config.get("pipelines", []) if p.get("identifier")}
+            complete = True
+            for pipelines in self._iter_pages(self.dest_client, self._dest_pipelines_endpoint):
+                if pipelines is None:
+                    complete = False
+                    break
+                identifiers = (p["identifier"] for p in pipelines if isinstance(p, dict) and p.get("identifier"))
+                if selected:
+                    identifiers = (identifier for identifier in identifiers if identifier in selected)
+                self._destination_pipeline_ids.update(identifiers)
+                if selected and self._destination_pipeline_ids >= selected:
+                    break
+
+            self._destination_listing_complete = complete
+            self._destination_listing_scope = selected or None
+            logger.debug("Found %d pipeline(s) in destination (complete listing: %s)",
+                         len(self._destination_pipeline_ids), complete)
+
+    def _pipeline_exists(self, pipeline_id: str) -> bool:
+        """Check if a pipeline exists in destination"""
+        self.load_destination_pipelines()
+        if pipeline_id in self._destination_pipeline_ids:
+            return True
+        scope = self._destination_listing_scope
+        if self._destination_listing_complete and (scope is None or pipeline_id in scope):
+            return False
+        return self.dest_client.exists(f"{self._dest_pipelines_endpoint}/{pipeline_id}")
+
+    def _selected_pipelines(self) -> List[Dict]:
+        """Get the selected pipelines in order, keeping the first entry of a pipeline listed twice"""
+        pipelines = []
+        seen: Set[str] = set()
+        for pipeline in self.config.get("pipelines", []):
+            pipeline_id = pipeline.get("identifier")
+            if pipeline_id:
+                if pipeline_id in seen:
+                    continue
+                seen.add(pipeline_id)
+            pipelines.append(pipeline)
+        return pipelines
+
     def replicate_pipelines(self, template_handler, inputset_handler, trigger_handler) -> bool:
         """Replicate all selected pipelines"""
-        pipelines = self.config.get("pipelines", [])
+        pipelines = self._selected_pipelines()
         if not pipelines:
             logger.warning("No pipelines selected for replication")
             return True
 
         logger.info("Replicating %d pipelines...", len(pipelines))
 
-        for pipeline in pipelines:
-            pipeline_id = pipeline.get("identifier")
-            if not pipeline_id:
-                logger.error("Pipeline missing identifier, skipping: %s", pipeline)
-                self.replication_stats["pipelines"]["failed"] += 1
-                continue
-
-            pipeline_name = pipeline.get("name") or pipeline_id
-
-            logger.info("\nReplicating pipeline: %s (%s)", pipeline_name, pipeline_id)
-
-            # Get pipeline details from source
-            pipeline_endpoint = self._build_endpoint(
-                "pipelines", org=self.source_org, project=self.source_project,
-                resource_id=pipeline_id)
-            pipeline_details = self.source_client.get(pipeline_endpoint)
-
-            if not pipeline_details:
-                logger.error("Failed to get pipeline details: %s", pipeline_id)
-                self.replication_stats["pipelines"]["failed"] += 1
-                continue
-
-            # Extract and handle template dependencies
-            yaml_content = pipeline_details.get("pipeline_yaml", "") if isinstance(pipeline_details, dict) else ""
-            if yaml_content:
-                templates = YAMLUtils.extract_template_refs(yaml_content)
-                if templates:
-                    logger.info("  Found %d template reference(s) in pipeline", len(templates))
-
-                    # Check which templates already exist
-                    for template_ref, version_label in templates:
-                        if template_handler.check_template_exists(template_ref, version_label):
-                            logger.info(
-                                "  Template '%s' (v%s) already exists in destination",
-                                template_ref, version_label if version_label else "stable"
-                            )
-                            self.replication_stats["templates"]["skipped"] += 1
-
-                    # Handle missing templates
-                    if not template_handler.handle_missing_templates(templates, pipeline_name):
-                        self.replication_stats["pipelines"]["failed"] += 1
-                        continue
-
-            # Create or update the pipeline
-            if isinstance(pipeline_details, dict):
-                result = self._create_or_update_pipeline(pipeline_id, pipeline_name, pipeline_details)
-            else:
-                logger.error("Pipeline details is not a dictionary: %s", pipeline_id)
-                result = None
-
-            if result is True:
-                self.replication_stats["pipelines"]["success"] += 1
-            elif result is False:
-                # Skipped - already exists
-                self.replication_stats["pipelines"]["skipped"] += 1
-            else:
-                # Failed
-                self.replication_stats["pipelines"]["failed"] += 1
-
-            # Replicate associated resources regardless of pipeline creation result
-            # (input sets and triggers should be replicated even if pipeline already exists)
-            if result is not None:  # Only skip if pipeline replication completely failed
-                # Replicate associated input sets
-                if not self._get_option("skip_input_sets", False):
-                    inputset_handler.replicate_input_sets(pipeline_id)
+        # Fetch the next definitions while the current pipelines are being written,
+        # unless setup already started doing so
+        self.prefetch_pipeline_details()
 
-                # Replicate associated triggers (after input sets since triggers may reference them)
-                if not self._get_option("skip_triggers", False):
-                    trigger_handler.replicate_triggers(pipeline_id)
+        # Pipelines are independent of each other, so replicate them concurrently and
+        # record their outcomes in the shared statistics once
+        outcomes: Counter = Counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+                for outcome in executor.map(
+                        lambda pipeline: self._replicate_pipeline(
+                            pipeline, self._get_pipeline_details(pipeline),
+                            template_handler, inputset_handler, trigger_handler),
+                        pipelines):
+                    outcomes[outcome] += 1
+        finally:
+            self._merge_stats("pipelines", outcomes)
+            self.cancel_prefetch()
 
         return True
 
+    def _get_pipeline_details(self, pipeline: Dict) -> Optional[Union[Dict, List]]:
+        """Get a pipeline definition from the source, using the prefetched one when available"""
+        pipeline_id = pipeline.get("identifier")
+        if not pipeline_id:
+            return None
+        with self._prefetch_lock:
+            prefetched = self._prefetched_details.pop(pipeline_id, None)
+            if prefetched is None and pipeline_id in self._prefetch_pending:
+                self._prefetch_pending.remove(pipeline_id)
+        if prefetched is None:
+            return self._fetch_pipeline_details(pipeline_id)
+        # Keep the same number of definitions in flight ahead of the workers
+        self._prefetch_next()
+        return prefetched.result()
+
+    def _fetch_pipeline_details(self, pipeline_id: str) -> Optional[Union[Dict, List]]:
+        """Fetch a pipeline definition from the source"""
+        return self.source_client.get(f"{self._source_pipelines_endpoint}/{pipeline_id}")
+
+    def _replicate_pipeline(self, pipeline: Dict, pipeline_details: Optional[Union[Dict, List]],
+                            template_handler, inputset_handler, trigger_handler) -> str:
+        """Replicate one pipeline and its templates, input sets and triggers, returning the outcome"""
+        pipeline_id = pipeline.get("identifier")
+        if not pipeline_id:
+            logger.error("Pipeline missing identifier, skipping: %s", pipeline)
+            return "failed"
+
+        pipeline_name = pipeline.get("name") or pipeline_id
+
+        logger.info("\nReplicating pipeline: %s (%s)", pipeline_name, pipeline_id)
+
+        if not pipeline_details:
+            logger.error("Failed to get pipeline details: %s", pipeline_id)
+            return "failed"
+
+        if not isinstance(pipeline_details, dict):
+            logger.error("Pipeline details is not a dictionary: %s", pipeline_id)
+            return "failed"
+
+        # A pipeline that already exists and is not updated needs none of its templates
+        existing_pipeline = self._pipeline_exists(pipeline_id)
+        skip_pipeline = existing_pipeline and not self._get_option("update_existing", False)
+
+        # Extract and handle template dependencies
+        yaml_content = pipeline_details.get("pipeline_yaml", "")
+        if yaml_content and not skip_pipeline:
+            templates = YAMLUtils.extract_template_refs(yaml_content)
+            if templates:
+                logger.info("  Found %d template reference(s) in pipeline", len(templates))
+                template_handler.load_destination_templates()
+
+                # Check which templates already exist
+                existing = template_handler.check_templates_exist(templates)
+                for (template_ref, version_label), exists in zip(templates, existing):
+                    if exists:
+                        logger.info(
+                            "  Template '%s' (v%s) already exists in destination",
+                            template_ref, version_label if version_label else "stable"
+                        )
+                self._merge_stats("templates", {"skipped": sum(existing)})
+
+                # Handle missing templates
+                if not template_handler.handle_missing_templates(templates, pipeline_name, existing):
+                    return "failed"
+
+        # Create or update the pipeline
+        result = self._create_or_update_pipeline(pipeline_id, pipeline_name, pipeline_details,
+                                                 existing_pipeline)
+
+        if result is True:
+            outcome = "success"
+        elif result is False:
+            # Skipped - already exists
+            outcome = "skipped"
+        else:
+            # Failed
+            outcome = "failed"
+
+        # Replicate associated resources regardless of pipeline creation result
+        # (input sets and triggers should be replicated even if pipeline already exists)
+        if result is not None:  # Only skip if pipeline replication completely failed
+            # Replicate associated input sets
+            if not self._get_option("skip_input_sets", False):
+                inputset_handler.replicate_input_sets(pipeline_id)
+
+            # Replicate associated triggers (after input sets since triggers may reference them)
+            if not self._get_option("skip_triggers", False):
+                trigger_handler.replicate_triggers(pipeline_id)
+
+        return outcome
+
     def _create_or_update_pipeline(self, pipeline_id: str, pipeline_name: str,
-                                   pipeline_details: Dict) -> Optional[bool]:
+                                   pipeline_details: Dict, existing_pipeline: bool) -> Optional[bool]:
         """Create or update a pipeline in the destination"""
-        # Check if pipeline already exists
-        existing_endpoint = self._build_endpoint(
-            "pipelines", org=self.dest_org, project=self.dest_project,
-            resource_id=pipeline_id)
-        existing_pipeline = self.dest_client.get(existing_endpoint)
-
         if existing_pipeline:
             if not self._get_option("update_existing", False):
                 logger.info("  Pipeline '%s' already exists, skipping", pipeline_name)
@@ -113,24 +266,26 @@ class PipelineHandler(BaseReplicator):
             else:
                 logger.info("  Pipeline '%s' already exists, updating", pipeline_name)
 
-        # Update YAML identifiers
-        yaml_content = pipeline_details.get("pipeline_yaml", "")
-        if yaml_content:
-            yaml_content = YAMLUtils.update_identifiers(
-                yaml_content, self.dest_org, self.dest_project, wrapper_key="pipeline")
-            pipeline_details["pipeline_yaml"] = yaml_content
-
-        # Create or update pipeline
-        endpoint = self._build_endpoint("pipelines", org=self.dest_org, project=self.dest_project)
-
+        # A dry run sends nothing, so the YAML is not rewritten either
         if self._is_dry_run():
             logger.info("  [DRY RUN] Would create/update pipeline '%s'", pipeline_name)
             return True
 
+        # Update YAML identifiers in the payload; the source details may be a cached
+        # response, so they are left as fetched rather than rewritten in place
+        payload = pipeline_details
+        yaml_content = pipeline_details.get("pipeline_yaml", "")
+        if yaml_content:
+            payload = {**pipeline_details,
+                       "pipeline_yaml": self._rewrite_identifiers(yaml_content, wrapper_key="pipeline")}
+
+        # Create or update pipeline
         if existing_pipeline:
-            result = self.dest_client.put(endpoint, json=pipeline_details)
+            result = self.dest_client.put(self._dest_pipelines_endpoint, json=payload)
         else:
-            result = self.dest_client.post(endpoint, json=pipeline_details)
+            result = self.dest_client.post(
+                self._dest_pipelines_endpoint, json=payload,
+                idempotency_key=self._idempotency_key("pipelines", pipeline_id))
 
         if result:
             logger.info("  ✓ Pipeline '%s' replicated successfully", pipeline_name)
@@ -5,9 +5,8 @@ Handles organization and project creation prerequisites.
 """
 
 import logging
-# No additional imports needed
+from concurrent.futures import ThreadPoolExecutor
 
-from .api_client import HarnessAPIClient
 from .base_replicator import BaseReplicator
 
 logger = logging.getLogger(__name__)
@@ -20,21 +19,35 @@ class PrerequisiteHandler(BaseReplicator):
         """Verify that destination org and project exist"""
         logger.info("Verifying destination org and project...")
 
-        if not self._create_org_if_missing():
+        # The org and project lookups are independent, so issue them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            org_future = executor.submit(self.dest_client.exists, self._org_endpoint())
+            project_future = executor.submit(self.dest_client.exists, self._project_endpoint())
+
+        if not self._ensure_org(org_future.result()):
             return False
 
-        if not self._create_project_if_missing():
+        if not self._ensure_project(project_future.result()):
             return False
 
         return True
 
+    def _org_endpoint(self) -> str:
+        """Endpoint of the destination organization"""
+        return self._build_endpoint(org=self.dest_org)
+
+    def _project_endpoint(self) -> str:
+        """Endpoint of the destination project"""
+        return self._dest_scope
+
     def _create_org_if_missing(self) -> bool:
         """Create organization if it doesn't exist"""
         # Check if org exists by trying to get it directly
-        org_endpoint = f"/v1/orgs/{self.dest_org}"
-        existing_org = self.dest_client.get(org_endpoint)
+        return self._ensure_org(self.dest_client.exists(self._org_endpoint()))
 
-        if existing_org:
+    def _ensure_org(self, org_exists: bool) -> bool:
+        """Create organization unless the existence check found it"""
+        if org_exists:
             logger.info("Organization '%s' already exists", self.dest_org)
             return True
 
@@ -51,13 +64,11 @@ class PrerequisiteHandler(BaseReplicator):
         orgs_endpoint = self._build_endpoint("orgs")
         create_org = self.dest_client.post(orgs_endpoint, json=create_org_data)
         if not create_org:
-            # Check if it failed because org already exists (race condition)
-            orgs_check = self.dest_client.get(orgs_endpoint)
-            orgs_list_check = HarnessAPIClient.normalize_response(orgs_check)
-            for org in orgs_list_check:
-                if org.get("identifier") == self.dest_org:
-                    logger.info("Organization '%s' already exists (created concurrently)", self.dest_org)
-                    return True
+            # Check if it failed because org already exists (race condition); probe the
+            # org itself rather than downloading the list of every org
+            if self.dest_client.exists(self._org_endpoint()):
+                logger.info("Organization '%s' already exists (created concurrently)", self.dest_org)
+                return True
 
             logger.error("Failed to create organization")
             return False
@@ -68,10 +79,11 @@ class PrerequisiteHandler(BaseReplicator):
     def _create_project_if_missing(self) -> bool:
         """Create project if it doesn't exist"""
         # Check if project exists by trying to get it directly
-        project_endpoint = f"/v1/orgs/{self.dest_org}/projects/{self.dest_project}"
-        existing_project = self.dest_client.get(project_endpoint)
+        return self._ensure_project(self.dest_client.exists(self._project_endpoint()))
 
-        if existing_project:
+    def _ensure_project(self, project_exists: bool) -> bool:
+        """Create project unless the existence check found it"""
+        if project_exists:
             logger.info("Project '%s' already exists", self.dest_project)
             return True
 
@@ -90,12 +102,9 @@ class PrerequisiteHandler(BaseReplicator):
         create_project = self.dest_client.post(projects_endpoint, json=create_project_data)
         if not create_project:
             # Check if it failed because project already exists (race condition)
-            projects_check = self.dest_client.get(projects_endpoint)
-            projects_list_check = HarnessAPIClient.normalize_response(projects_check)
-            for project in projects_list_check:
-                if project.get("identifier") == self.dest_project:
-                    logger.info("Project '%s' already exists (created concurrently)", self.dest_project)
-                    return True
+            if self.dest_client.exists(self._project_endpoint()):
+                logger.info("Project '%s' already exists (created concurrently)", self.dest_project)
+                return True
 
             logger.error("Failed to create project")
             return False
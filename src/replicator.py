@@ -5,9 +5,10 @@ Main replication orchestrator that coordinates all handlers.
 """
 
 import logging
+import uuid
 from typing import Any, Dict
 
-from .api_client import HarnessAPIClient
+from .api_client import DEFAULT_RATE_LIMIT_RPS, HarnessAPIClient
 from .inputset_handler import InputSetHandler
 from .pipeline_handler import PipelineHandler
 from .prerequisite_handler import PrerequisiteHandler
@@ -29,11 +30,12 @@ class HarnessReplicator:
         self.dest_project = config["destination"]["project"]
 
         # Initialize API clients
+        rate_limit = config.get("options", {}).get("rate_limit_rps", DEFAULT_RATE_LIMIT_RPS)
         self.source_client = HarnessAPIClient(
-            config["source"]["base_url"], config["source"]["api_key"]
+            config["source"]["base_url"], config["source"]["api_key"], rate_limit=rate_limit
         )
         self.dest_client = HarnessAPIClient(
-            config["destination"]["base_url"], config["destination"]["api_key"]
+            config["destination"]["base_url"], config["destination"]["api_key"], rate_limit=rate_limit
         )
 
         # Replication statistics
@@ -44,17 +46,20 @@ class HarnessReplicator:
             "triggers": {"success": 0, "failed": 0, "skipped": 0},
         }
 
+        # Idempotency keys of this run are shared by its handlers but not reused by later runs
+        self.run_id = uuid.uuid4().hex
+
         # Initialize handlers
         self.prerequisite_handler = PrerequisiteHandler(
-            config, self.source_client, self.dest_client, self.replication_stats)
+            config, self.source_client, self.dest_client, self.replication_stats, self.run_id)
         self.template_handler = TemplateHandler(
-            config, self.source_client, self.dest_client, self.replication_stats)
+            config, self.source_client, self.dest_client, self.replication_stats, self.run_id)
         self.inputset_handler = InputSetHandler(
-            config, self.source_client, self.dest_client, self.replication_stats)
+            config, self.source_client, self.dest_client, self.replication_stats, self.run_id)
         self.trigger_handler = TriggerHandler(
-            config, self.source_client, self.dest_client, self.replication_stats)
+            config, self.source_client, self.dest_client, self.replication_stats, self.run_id)
         self.pipeline_handler = PipelineHandler(
-            config, self.source_client, self.dest_client, self.replication_stats)
+            config, self.source_client, self.dest_client, self.replication_stats, self.run_id)
 
     def run_replication(self) -> bool:
         """Run the complete replication process"""
@@ -62,8 +67,17 @@ class HarnessReplicator:
         logger.info("Source: %s/%s", self.source_org, self.source_project)
         logger.info("Destination: %s/%s", self.dest_org, self.dest_project)
 
-        # Verify prerequisites
-        if not self.prerequisite_handler.verify_prerequisites():
+        # Fetch pipeline definitions from the source while the destination is being prepared
+        self.pipeline_handler.prefetch_pipeline_details()
+
+        # Verify prerequisites; a failed or aborted check leaves the prefetched definitions unused
+        try:
+            prerequisites_met = self.prerequisite_handler.verify_prerequisites()
+        except BaseException:
+            self.pipeline_handler.cancel_prefetch()
+            raise
+        if not prerequisites_met:
+            self.pipeline_handler.cancel_prefetch()
             return False
 
         # Replicate pipelines
@@ -5,9 +5,11 @@ Handles template replication functionality.
 """
 
 import logging
-import time
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from .api_client import HarnessAPIClient
 from .base_replicator import BaseReplicator
 from .yaml_utils import YAMLUtils
 
@@ -17,39 +19,147 @@ logger = logging.getLogger(__name__)
 class TemplateHandler(BaseReplicator):
     """Handles template replication"""
 
+    def __init__(self, config: Dict[str, Any], source_client: HarnessAPIClient,
+                 dest_client: HarnessAPIClient, replication_stats: Dict[str, Dict[str, int]],
+                 run_id: Optional[str] = None):
+        """Initialize template handler"""
+        super().__init__(config, source_client, dest_client, replication_stats, run_id)
+        # Every template is read from and written to the same collections
+        self._source_templates_endpoint = self._source_endpoint("templates")
+        self._dest_templates_endpoint = self._dest_endpoint("templates")
+        # Templates are shared between pipelines, so remember destination lookups for the run
+        self._template_exists_cache: Dict[Tuple[str, Optional[str]], bool] = {}
+        # Existence checks currently in progress; concurrent pipelines share their answer
+        self._pending_checks: Dict[Tuple[str, Optional[str]], Future] = {}
+        self._pending_checks_lock = threading.Lock()
+        # Source templates do not change during a run; keep them in case a create is retried
+        self._source_template_cache: Dict[Tuple[str, Optional[str]], Union[Dict, List]] = {}
+        self._destination_templates_loaded = False
+        self._destination_listing_complete = False
+        self._load_lock = threading.Lock()
+        # Concurrently replicated pipelines can share a missing template; create each one once
+        self._replication_locks: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+        self._replication_locks_lock = threading.Lock()
+        # Templates a dry run would create, kept apart from what the destination really has
+        self._dry_run_planned: Set[Tuple[str, Optional[str]]] = set()
+
+    def load_destination_templates(self) -> None:
+        """Record the templates already present in the destination with a single listing.
+
+        Only runs once per replication. When every page of the listing was fetched,
+        it answers all later existence checks without further requests; if a page
+        failed, templates that were not listed are still looked up individually.
+        """
+        with self._load_lock:
+            if self._destination_templates_loaded:
+                return
+            self._destination_templates_loaded = True
+
+            endpoint = self._dest_templates_endpoint
+            found = 0
+            complete = True
+            for templates in self._iter_pages(self.dest_client, endpoint, params={"type": "ALL"}):
+                if templates is None:
+                    complete = False
+                    break
+                for template in templates:
+                    template_ref = template.get("identifier")
+                    if not template_ref:
+                        continue
+                    # Accept both the v1 (snake_case) and NG (camelCase) field names
+                    version_label = template.get("version_label", template.get("versionLabel"))
+                    self._template_exists_cache[(template_ref, version_label)] = True
+                    if template.get("stable_template", template.get("stableTemplate")):
+                        # References without a versionLabel resolve to the stable version
+                        self._template_exists_cache[(template_ref, None)] = True
+                    found += 1
+
+            self._destination_listing_complete = complete
+            logger.debug("Found %d template version(s) in destination (complete listing: %s)",
+                         found, complete)
+
     def check_template_exists(self, template_ref: str, version_label: Optional[str] = None) -> bool:
         """Check if template exists in destination"""
-        org = self.dest_org
-        project = self.dest_project
+        cache_key = (template_ref, version_label)
+        if cache_key in self._template_exists_cache:
+            return self._template_exists_cache[cache_key]
+        if self._destination_listing_complete:
+            # Every destination template was listed, so this one is known to be missing
+            return False
+
+        with self._pending_checks_lock:
+            if cache_key in self._template_exists_cache:
+                return self._template_exists_cache[cache_key]
+            pending = self._pending_checks.get(cache_key)
+            if pending is None:
+                future = self._pending_checks[cache_key] = Future()
+        if pending is not None:
+            return pending.result()
+
+        endpoint = self._template_endpoint(self._dest_templates_endpoint, template_ref, version_label)
 
-        # Build sub_resource for version if specified
-        sub_resource = f"versions/{version_label}" if version_label else None
-        endpoint = self._build_endpoint(
-            "templates", org=org, project=project,
-            resource_id=template_ref, sub_resource=sub_resource
-        )
+        try:
+            exists = self.dest_client.exists(endpoint)
+            self._template_exists_cache[cache_key] = exists
+            future.set_result(exists)
+            return exists
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._pending_checks_lock:
+                del self._pending_checks[cache_key]
 
-        response = self.dest_client.get(endpoint)
-        return response is not None
+    @staticmethod
+    def _template_endpoint(templates_endpoint: str, template_ref: str,
+                           version_label: Optional[str] = None) -> str:
+        """Build the endpoint of a template, or of one of its versions, within a templates collection"""
+        if version_label:
+            return f"{templates_endpoint}/{template_ref}/versions/{version_label}"
+        return f"{templates_endpoint}/{template_ref}"
+
+    def _get_source_template(self, template_ref: str,
+                             version_label: Optional[str] = None) -> Optional[Union[Dict, List]]:
+        """Get a template version from the source, reusing earlier fetches during the run"""
+        cache_key = (template_ref, version_label)
+        if cache_key in self._source_template_cache:
+            return self._source_template_cache[cache_key]
+
+        source_endpoint = self._template_endpoint(self._source_templates_endpoint, template_ref, version_label)
+        template_data = self.source_client.get(source_endpoint)
+        if template_data:
+            self._source_template_cache[cache_key] = template_data
+        return template_data
 
     def replicate_template(self, template_ref: str, version_label: Optional[str] = None) -> bool:
         """Replicate a template from source to destination"""
-        logger.info("  Replicating template: %s (v%s)", template_ref, version_label or "stable")
+        cache_key = (template_ref, version_label)
+        with self._replication_locks_lock:
+            lock = self._replication_locks.setdefault(cache_key, threading.Lock())
 
-        # Get template from source
-        source_org = self.source_org
-        source_project = self.source_project
+        with lock:
+            if cache_key in self._dry_run_planned:
+                # Another pipeline of this dry run already reported creating it
+                logger.info("  [DRY RUN] Template '%s' (v%s) is already planned for creation",
+                            template_ref, version_label or "stable")
+                return True
+            if self._template_exists_cache.get(cache_key):
+                # Another pipeline replicated it while this one was waiting
+                logger.info("  Template '%s' (v%s) already exists in destination",
+                            template_ref, version_label or "stable")
+                self._increment_stat("templates", "skipped")
+                return True
+            return self._replicate_template(template_ref, version_label)
 
-        sub_resource = f"versions/{version_label}" if version_label else None
-        source_endpoint = self._build_endpoint(
-            "templates", org=source_org, project=source_project,
-            resource_id=template_ref, sub_resource=sub_resource
-        )
+    def _replicate_template(self, template_ref: str, version_label: Optional[str] = None) -> bool:
+        """Fetch a template version from the source and create it in the destination"""
+        logger.info("  Replicating template: %s (v%s)", template_ref, version_label or "stable")
 
-        template_data = self.source_client.get(source_endpoint)
+        # Get template from source
+        template_data = self._get_source_template(template_ref, version_label)
         if not template_data:
             logger.error("  Failed to get template from source: %s", template_ref)
-            self.replication_stats["templates"]["failed"] += 1
+            self._increment_stat("templates", "failed")
             return False
 
         # Extract template YAML
@@ -59,46 +169,66 @@ class TemplateHandler(BaseReplicator):
             template_yaml = ""
         if not template_yaml:
             logger.error("  Template missing YAML content: %s", template_ref)
-            self.replication_stats["templates"]["failed"] += 1
+            self._increment_stat("templates", "failed")
             return False
 
-        # Update YAML to use destination org/project and set version
-        updated_yaml = YAMLUtils.update_identifiers(
-            template_yaml, self.dest_org, self.dest_project, wrapper_key="template")
-        updated_yaml = YAMLUtils.set_template_version(updated_yaml, version_label)
-
-        # Create template in destination
-        dest_endpoint = self._build_endpoint(
-            "templates", org=self.dest_org, project=self.dest_project)
-
+        # A dry run creates nothing, so the destination is not marked as having the template
         if self._is_dry_run():
             logger.info("  [DRY RUN] Would create template '%s'", template_ref)
-            result = True
+            self._dry_run_planned.add((template_ref, version_label))
+            self._increment_stat("templates", "success")
+            return True
+
+        # Update YAML to use destination org/project and set version
+        if self._same_scope:
+            updated_yaml = YAMLUtils.set_template_version(template_yaml, version_label)
         else:
-            template_payload = {
-                "template_yaml": updated_yaml,
-                "template_identifier": template_ref,
-                "version_label": version_label or "stable"
-            }
-            result = self.dest_client.post(dest_endpoint, json=template_payload)
+            updated_yaml = YAMLUtils.update_template_yaml(
+                template_yaml, self.dest_org, self.dest_project, version_label)
+
+        # Create template in destination
+        template_payload = {
+            "template_yaml": updated_yaml,
+            "template_identifier": template_ref,
+            "version_label": version_label or "stable"
+        }
+        result = self.dest_client.post(
+            self._dest_templates_endpoint, json=template_payload,
+            idempotency_key=self._idempotency_key("templates", template_ref, version_label))
 
         if result:
             logger.info("  ✓ Template '%s' replicated successfully", template_ref)
-            self.replication_stats["templates"]["success"] += 1
+            self._template_exists_cache[(template_ref, version_label)] = True
+            self._increment_stat("templates", "success")
         else:
             logger.error("  ✗ Failed to replicate template: %s", template_ref)
-            self.replication_stats["templates"]["failed"] += 1
-
-        time.sleep(0.3)
+            self._increment_stat("templates", "failed")
         return bool(result)
 
+    def check_templates_exist(self, templates: List[Tuple[str, Optional[str]]]) -> List[bool]:
+        """Check several templates in the destination concurrently, preserving order"""
+        # Templates already answered by the destination listing or earlier checks need no request,
+        # and a template referenced several times is checked once
+        unknown = [template for template in dict.fromkeys(templates) if not self._is_template_known(template)]
+        if len(unknown) > 1:
+            with ThreadPoolExecutor(max_workers=min(self._get_max_workers(), len(unknown))) as executor:
+                list(executor.map(lambda template: self.check_template_exists(*template), unknown))
+        return [self.check_template_exists(*template) for template in templates]
+
+    def _is_template_known(self, template: Tuple[str, Optional[str]]) -> bool:
+        """Check whether a template's existence can be answered without a request"""
+        return template in self._template_exists_cache or self._destination_listing_complete
+
     def handle_missing_templates(self, templates: List[Tuple[str, Optional[str]]],
-                                 pipeline_name: str) -> bool:
-        """Handle missing templates - automatically replicate based on configuration"""
-        missing_templates = []
-        for template_ref, version_label in templates:
-            if not self.check_template_exists(template_ref, version_label):
-                missing_templates.append((template_ref, version_label))
+                                 pipeline_name: str, existing: Optional[List[bool]] = None) -> bool:
+        """Handle missing templates - automatically replicate based on configuration.
+
+        existing holds the results of check_templates_exist for the same templates,
+        when the caller already has them.
+        """
+        if existing is None:
+            existing = [self.check_template_exists(*template) for template in templates]
+        missing_templates = [template for template, exists in zip(templates, existing) if not exists]
 
         if not missing_templates:
             return True
@@ -113,8 +243,15 @@ class TemplateHandler(BaseReplicator):
 
         if not skip_templates:
             logger.info("  Auto-replicating missing templates...")
-            for template_ref, version_label in missing_templates:
-                self.replicate_template(template_ref, version_label)
+            if len(missing_templates) == 1:
+                self.replicate_template(*missing_templates[0])
+                return True
+
+            # Templates are independent of each other, so replicate them concurrently
+            workers = min(self._get_max_workers(), len(missing_templates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda template: self.replicate_template(*template),
+                                  missing_templates))
             return True
         else:
             logger.warning("  Template replication disabled, continuing without templates")
@@ -4,16 +4,20 @@ Trigger Handler
 Handles trigger replication functionality.
 """
 
+import itertools
 import logging
-import time
-# No additional imports needed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from .api_client import HarnessAPIClient
-from .base_replicator import BaseReplicator
-from .yaml_utils import YAMLUtils
+from .base_replicator import LIST_PAGE_SIZE, BaseReplicator
 
 logger = logging.getLogger(__name__)
 
+# Triggers live in the pipeline service API rather than the v1 API
+TRIGGERS_ENDPOINT = "/pipeline/api/triggers"
+
 
 class TriggerHandler(BaseReplicator):
     """Handles trigger replication"""
@@ -22,144 +26,214 @@ class TriggerHandler(BaseReplicator):
         """Replicate triggers for a specific pipeline"""
         logger.info("  Checking for triggers for pipeline: %s", pipeline_id)
 
-        # List triggers using the discovered API endpoint
-        endpoint = "/pipeline/api/triggers"
-        params = {
-            "orgIdentifier": self.source_org,
-            "projectIdentifier": self.source_project,
-            "targetIdentifier": pipeline_id
-        }
-        triggers_response = self.source_client.get(endpoint, params=params)
+        # Every trigger of this pipeline is addressed with the same org/project/target scope
+        source_params = self._trigger_params(self.source_org, self.source_project, pipeline_id)
+        dest_params = self._trigger_params(self.dest_org, self.dest_project, pipeline_id)
 
-        if not triggers_response:
+        triggers = self._iter_triggers(pipeline_id)
+        first_trigger = next(triggers, None)
+        if first_trigger is None:
             logger.info("  No triggers found for pipeline: %s", pipeline_id)
             return True
 
-        # Extract triggers from the response structure
-        triggers_data = triggers_response.get("data", {})
-        if isinstance(triggers_data, dict):
-            triggers_list = triggers_data.get("content", [])
-        else:
-            triggers_list = []
+        # One listing answers which triggers the destination already has
+        existing_ids = self._list_destination_triggers(dest_params)
+
+        # Triggers are independent of each other, so replicate them concurrently and
+        # record their outcomes in the shared statistics once
+        outcomes: Counter = Counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+                for outcome in executor.map(
+                        lambda trigger: self._replicate_trigger(trigger, source_params, dest_params, existing_ids),
+                        itertools.chain([first_trigger], triggers)):
+                    outcomes[outcome] += 1
+        finally:
+            self._merge_stats("triggers", outcomes)
+
+        logger.info("  Processed %d triggers for pipeline: %s", sum(outcomes.values()), pipeline_id)
+        return True
 
-        triggers = HarnessAPIClient.normalize_response(triggers_list)
+    @staticmethod
+    def _trigger_params(org: str, project: str, pipeline_id: str) -> Dict[str, str]:
+        """Build the query parameters addressing the triggers of a pipeline"""
+        return {
+            "orgIdentifier": org,
+            "projectIdentifier": project,
+            "targetIdentifier": pipeline_id
+        }
 
-        if not triggers:
-            logger.info("  No triggers found for pipeline: %s", pipeline_id)
-            return True
+    def _replicate_trigger(self, trigger: Dict, source_params: Dict[str, str],
+                           dest_params: Dict[str, str], existing_ids: Optional[Set[str]] = None) -> str:
+        """Replicate a single trigger from source to destination, returning the outcome.
+
+        existing_ids holds the triggers listed in the destination; when the
+        listing is unavailable, the destination is asked for this trigger.
+        """
+        trigger_id = trigger.get("identifier")
+        trigger_name = trigger.get("name", trigger_id)
+        logger.info("  Replicating trigger: %s", trigger_name)
+
+        # Check if trigger already exists in destination
+        trigger_endpoint = f"{TRIGGERS_ENDPOINT}/{trigger_id}"
+        if existing_ids is not None:
+            existing_trigger = trigger_id in existing_ids
+        else:
+            existing_trigger = self.dest_client.get(trigger_endpoint, params=dest_params)
 
-        logger.info("  Replicating %d triggers...", len(triggers))
-
-        for trigger in triggers:
-            trigger_id = trigger.get("identifier")
-            trigger_name = trigger.get("name", trigger_id)
-            logger.info("  Replicating trigger: %s", trigger_name)
-
-            # Check if trigger already exists in destination
-            existing_trigger_endpoint = f"/pipeline/api/triggers/{trigger_id}"
-            existing_trigger_params = {
-                "orgIdentifier": self.dest_org,
-                "projectIdentifier": self.dest_project,
-                "targetIdentifier": pipeline_id
-            }
-            existing_trigger = self.dest_client.get(existing_trigger_endpoint, params=existing_trigger_params)
-
-            if existing_trigger:
-                if not self._get_option("update_existing", False):
-                    logger.info("  Trigger '%s' already exists, skipping", trigger_name)
-                    self.replication_stats["triggers"]["skipped"] += 1
-                    continue
-                else:
-                    logger.info("  Trigger '%s' already exists, updating", trigger_name)
-
-            # Get full trigger details from source
-            get_endpoint = f"/pipeline/api/triggers/{trigger_id}"
-            get_params = {
-                "orgIdentifier": self.source_org,
-                "projectIdentifier": self.source_project,
-                "targetIdentifier": pipeline_id
-            }
-            trigger_response = self.source_client.get(get_endpoint, params=get_params)
-
-            # Extract trigger details from response
-            if trigger_response and isinstance(trigger_response, dict):
-                trigger_details = trigger_response.get("data", {})
+        if existing_trigger:
+            if not self._get_option("update_existing", False):
+                logger.info("  Trigger '%s' already exists, skipping", trigger_name)
+                return "skipped"
             else:
-                trigger_details = None
+                logger.info("  Trigger '%s' already exists, updating", trigger_name)
+
+        # Get full trigger details from source
+        trigger_response = self.source_client.get(trigger_endpoint, params=source_params)
 
-            if not trigger_details:
-                logger.error("  Failed to get details for trigger: %s", trigger_id)
-                self.replication_stats["triggers"]["failed"] += 1
-                continue
+        # Extract trigger details from response
+        if trigger_response and isinstance(trigger_response, dict):
+            trigger_details = trigger_response.get("data", {})
+        else:
+            trigger_details = None
 
-            # Update org/project identifiers in trigger YAML
+        if not trigger_details:
+            logger.error("  Failed to get details for trigger: %s", trigger_id)
+            return "failed"
+
+        # Create or update trigger in destination (PUT updates, POST creates)
+        if existing_trigger:
+            write_endpoint = trigger_endpoint
+            method = "PUT"
+            action = "update"
+        else:
+            write_endpoint = TRIGGERS_ENDPOINT
+            method = "POST"
+            action = "create"
+
+        if self._is_dry_run():
+            logger.info("  [DRY RUN] Would %s trigger '%s'", action, trigger_name)
+            result = True
+        else:
+            # Send the YAML content directly as the request body
             if isinstance(trigger_details, dict) and "yaml" in trigger_details:
-                yaml_content = trigger_details["yaml"]
-                updated_yaml = YAMLUtils.update_identifiers(
-                    yaml_content, self.dest_org, self.dest_project, wrapper_key="trigger")
-                trigger_details["yaml"] = updated_yaml
-
-            # Create or update trigger in destination
-            if existing_trigger:
-                # Update existing trigger (use PUT)
-                update_endpoint = f"/pipeline/api/triggers/{trigger_id}"
-                create_params = {
-                    "orgIdentifier": self.dest_org,
-                    "projectIdentifier": self.dest_project,
-                    "targetIdentifier": pipeline_id
-                }
-                action = "update"
-            else:
-                # Create new trigger (use POST)
-                update_endpoint = "/pipeline/api/triggers"
-                create_params = {
-                    "orgIdentifier": self.dest_org,
-                    "projectIdentifier": self.dest_project,
-                    "targetIdentifier": pipeline_id
-                }
-                action = "create"
-
-            if self._is_dry_run():
-                logger.info("  [DRY RUN] Would %s trigger '%s'", action, trigger_name)
-                result = True
-            else:
-                # Send the YAML content directly as the request body
-                if isinstance(trigger_details, dict) and "yaml" in trigger_details:
-                    yaml_content = trigger_details["yaml"]
-
-                    if existing_trigger:
-                        # Use PUT for updates
-                        result = self.dest_client.session.put(
-                            f"{self.dest_client.base_url}{update_endpoint}",
-                            params=create_params,
-                            data=yaml_content,
-                            headers={"Content-Type": "application/yaml"}
-                        )
-                    else:
-                        # Use POST for creation
-                        result = self.dest_client.session.post(
-                            f"{self.dest_client.base_url}{update_endpoint}",
-                            params=create_params,
-                            data=yaml_content,
-                            headers={"Content-Type": "application/yaml"}
-                        )
-
-                    # Check if the request was successful
-                    if result.status_code in [200, 201]:
-                        result = True
-                    else:
-                        logger.error("  API Error: %s", result.text)
-                        result = False
+                # Update org/project identifiers in trigger YAML
+                yaml_content = self._rewrite_identifiers(trigger_details["yaml"], wrapper_key="trigger")
+
+                result = self.dest_client.send_raw(
+                    method, write_endpoint, yaml_content, "application/yaml", params=dest_params)
+
+                # Check if the request was successful; no response means it could not be sent
+                if result is None:
+                    result = False
+                elif result.status_code in [200, 201]:
+                    result = True
                 else:
+                    # Only decode the error body when it is logged
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("  API Error: %s", HarnessAPIClient.error_body(result))
                     result = False
-
-            if result:
-                logger.info("  ✓ Trigger '%s' %s successfully", trigger_name, "updated" if existing_trigger else "replicated")
-                self.replication_stats["triggers"]["success"] += 1
             else:
-                logger.error("  ✗ Failed to %s trigger: %s", action, trigger_name)
-                self.replication_stats["triggers"]["failed"] += 1
-
-            time.sleep(0.3)
+                result = False
+
+        if result:
+            logger.info("  ✓ Trigger '%s' %s successfully", trigger_name, "updated" if existing_trigger else "replicated")
+            return "success"
+
+        logger.error("  ✗ Failed to %s trigger: %s", action, trigger_name)
+        return "failed"
+
+    def _iter_triggers(self, pipeline_id: str) -> Iterator[Dict]:
+        """Iterate over the source triggers of a pipeline, page by page"""
+        params = self._trigger_params(self.source_org, self.source_project, pipeline_id)
+        for triggers in self._iter_trigger_pages(self.source_client, params):
+            if triggers is None:
+                return
+            yield from triggers
+
+    def _list_destination_triggers(self, dest_params: Dict[str, str]) -> Optional[Set[str]]:
+        """List the identifiers of a pipeline's triggers in the destination, or None if listing failed"""
+        identifiers: Set[str] = set()
+        for triggers in self._iter_trigger_pages(self.dest_client, dest_params):
+            if triggers is None:
+                return None
+            identifiers.update(
+                trigger["identifier"] for trigger in triggers
+                if isinstance(trigger, dict) and trigger.get("identifier"))
+        return identifiers
+
+    def _iter_trigger_pages(self, client: HarnessAPIClient,
+                            params: Dict[str, str]) -> Iterator[Optional[List[Dict]]]:
+        """Iterate over the pages of a pipeline's triggers.
+
+        A page whose request failed is yielded as None and ends the iteration.
+        Triggers already seen on an earlier page are dropped, and a page holding
+        only such triggers ends the iteration, since the server is repeating pages.
+        """
+        seen: Set[str] = set()
+
+        def new_triggers(triggers: List[Dict]) -> Optional[List[Dict]]:
+            """Drop triggers seen before, returning None when the page repeats earlier ones only"""
+            unseen = []
+            for trigger in triggers:
+                trigger_id = trigger.get("identifier") if isinstance(trigger, dict) else None
+                if trigger_id in seen:
+                    continue
+                if trigger_id:
+                    seen.add(trigger_id)
+                unseen.append(trigger)
+            return unseen if unseen or not triggers else None
+
+        first_page = self._get_trigger_page(client, params, 0)
+        if first_page is None:
+            yield None
+            return
+        triggers, total_pages = first_page
+        yield new_triggers(triggers)
+
+        if total_pages is not None:
+            # The page count is known up front, so fetch the remaining pages concurrently
+            with ThreadPoolExecutor(max_workers=self._get_max_workers()) as executor:
+                pages = executor.map(lambda index: self._get_trigger_page(client, params, index),
+                                     range(1, total_pages))
+                for page in pages:
+                    if page is None:
+                        yield None
+                        return
+                    unseen = new_triggers(page[0])
+                    if unseen is None:
+                        return
+                    yield unseen
+            return
+
+        # Without a page count, keep going until a short page
+        page_index = 0
+        while len(triggers) >= LIST_PAGE_SIZE:
+            page_index += 1
+            page = self._get_trigger_page(client, params, page_index)
+            if page is None:
+                yield None
+                return
+            triggers = page[0]
+            unseen = new_triggers(triggers)
+            if unseen is None:
+                return
+            yield unseen
+
+    @staticmethod
+    def _get_trigger_page(client: HarnessAPIClient, params: Dict[str, str],
+                          page_index: int) -> Optional[Tuple[List[Dict], Optional[int]]]:
+        """Fetch one page of a pipeline's triggers, returning the triggers and the total page count"""
+        page_params = dict(params, page=page_index, size=LIST_PAGE_SIZE)
+        triggers_response = client.get(TRIGGERS_ENDPOINT, params=page_params)
+        if not isinstance(triggers_response, dict):
+            return None
+
+        # Extract triggers from the response structure; a response without a list of
+        # triggers is not a listing, so it does not count as an empty page
+        triggers_data = triggers_response.get("data", {})
+        if not isinstance(triggers_data, dict) or not isinstance(triggers_data.get("content"), list):
+            return None
 
-        return True
+        triggers = HarnessAPIClient.normalize_response(triggers_data["content"])
+        return triggers, triggers_data.get("totalPages")
@@ -5,14 +5,18 @@ Handles all user interactions and dialogs.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
+from prompt_toolkit import prompt
 from prompt_toolkit.shortcuts import (
     checkboxlist_dialog,
     message_dialog,
     radiolist_dialog,
+    yes_no_dialog,
 )
 
+from .base_replicator import LIST_PAGE_SIZE
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,13 +80,34 @@ def select_project(client, org: str, title: str = "SELECT PROJECT") -> Optional[
         return None
 
 
+def _list_pipelines(client, org: str, project: str) -> List[Dict[str, Any]]:
+    """List every pipeline in a project, fetching one bounded page at a time.
+
+    Stops at the first short page, and at a page listing only pipelines already
+    seen, which a server ignoring the paging parameters returns forever.
+    """
+    pipelines_endpoint = f"/v1/orgs/{org}/projects/{project}/pipelines"
+    pipelines: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    page = 0
+    while True:
+        pipelines_response = client.get(pipelines_endpoint, params={"page": page, "limit": LIST_PAGE_SIZE})
+        items = client.normalize_response(pipelines_response)
+        identifiers = {item["identifier"] for item in items if isinstance(item, dict) and item.get("identifier")}
+        if identifiers and identifiers <= seen:
+            return pipelines
+        seen |= identifiers
+        pipelines.extend(items)
+        if len(items) < LIST_PAGE_SIZE:
+            return pipelines
+        page += 1
+
+
 def select_pipelines(client, org: str, project: str,
                      title: str = "SELECT PIPELINES") -> List[Dict[str, str]]:
     """Select pipelines from list (multi-select)"""
     try:
-        pipelines_endpoint = f"/v1/orgs/{org}/projects/{project}/pipelines"
-        pipelines_response = client.get(pipelines_endpoint)
-        pipelines = client.normalize_response(pipelines_response)
+        pipelines = _list_pipelines(client, org, project)
 
         if not pipelines:
             message_dialog(
@@ -103,9 +128,10 @@ def select_pipelines(client, org: str, project: str,
             return []
 
         # Convert to list of dicts
+        selected_ids = set(selected)
         result = []
         for pipeline in pipelines:
-            if pipeline.get("identifier") in selected:
+            if pipeline.get("identifier") in selected_ids:
                 result.append({
                     "identifier": pipeline.get("identifier"),
                     "name": pipeline.get("name", pipeline.get("identifier"))
@@ -190,8 +216,6 @@ def select_or_create_project(client, org: str,
 
 def create_organization(client) -> Optional[str]:
     """Create a new organization"""
-    from prompt_toolkit import prompt
-
     try:
         org_name = prompt("Enter organization identifier: ")
         if not org_name:
@@ -226,8 +250,6 @@ def create_organization(client) -> Optional[str]:
 
 def create_project(client, org: str) -> Optional[str]:
     """Create a new project"""
-    from prompt_toolkit import prompt
-
     try:
         proj_name = prompt("Enter project identifier: ")
         if not proj_name:
@@ -313,8 +335,6 @@ def get_selections_from_clients(source_client, dest_client, base_config: Dict[st
 def get_interactive_selections(source_client, dest_client, base_config: Dict[str, Any],
                                config_file: str) -> Dict[str, Any]:
     """Get user selections with interactive dialogs - always show dialogs even if values exist"""
-    from prompt_toolkit.shortcuts import yes_no_dialog
-
     # Source organization - always show dialog
     current_source_org = base_config.get("source", {}).get("org")
     if current_source_org:
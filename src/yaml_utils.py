@@ -4,14 +4,67 @@ YAML Utilities
 Utilities for manipulating YAML content during replication.
 """
 
+import json
 import logging
 import re
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 import yaml
 
+try:
+    # libyaml's C implementation is several times faster than the pure-Python one
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Matches an orgIdentifier/projectIdentifier line, capturing its indentation
+_IDENTIFIER_LINE_RE = re.compile(
+    r'^(?P<indent>[ \t]*)(?P<key>orgIdentifier|projectIdentifier):[^\r\n]*?(?=\r?$)', re.MULTILINE)
+
+# Matches a versionLabel line, capturing its indentation
+_VERSION_LABEL_LINE_RE = re.compile(
+    r'^(?P<indent>[ \t]*)(?P<key>versionLabel):[^\r\n]*?(?=\r?$)', re.MULTILINE)
+
+# Matches any line rewritten in a template: its identifiers and version label
+_TEMPLATE_FIELD_LINE_RE = re.compile(
+    r'^(?P<indent>[ \t]*)(?P<key>orgIdentifier|projectIdentifier|versionLabel):[^\r\n]*?(?=\r?$)', re.MULTILINE)
+
+# Matches the next non-blank line after a rewritten line, capturing its indentation; a deeper
+# indented line continues the value (block scalar, nested mapping or multi-line scalar)
+_NEXT_LINE_RE = re.compile(r'(?:\r?\n[ \t]*(?=\r?\n))*\r?\n(?P<indent>[ \t]*)\S')
+
+# Fallback pattern used when YAML content cannot be parsed
+_IDENTIFIER_VALUE_RE = re.compile(r'(?P<key>orgIdentifier|projectIdentifier):\s*["\']?[^"\'\s]+["\']?')
+
+# Matches the start of a line that is not indented
+_UNINDENTED_LINE_RE = re.compile(r'^\S', re.MULTILINE)
+
+# Compiled wrapper-key patterns, one per resource kind, built on first use
+_WRAPPER_RES: Dict[str, Pattern[str]] = {}
+
+
+def _wrapper_re(wrapper_key: str) -> Pattern[str]:
+    """Get the pattern matching a top-level wrapper key and the indentation of its first child"""
+    pattern = _WRAPPER_RES.get(wrapper_key)
+    if pattern is None:
+        pattern = _WRAPPER_RES[wrapper_key] = re.compile(
+            rf'^{re.escape(wrapper_key)}:[ \t]*(?:#[^\r\n]*)?\r?\n'
+            r'(?:[ \t]*(?:#[^\r\n]*)?\r?\n)*(?P<indent>[ \t]+)\S',
+            re.MULTILINE)
+    return pattern
+
+
+def _load_yaml(yaml_content: str) -> Any:
+    """Parse YAML with the fastest available safe loader"""
+    return yaml.load(yaml_content, Loader=_SafeLoader)
+
+
+def _dump_yaml(data: Any) -> str:
+    """Serialize YAML with the fastest available safe dumper, keeping key order"""
+    return yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+
 
 class YAMLUtils:
     """Utilities for YAML manipulation during replication"""
@@ -20,8 +73,15 @@ class YAMLUtils:
     def update_identifiers(yaml_content: str, dest_org: str, dest_project: str,
                            wrapper_key: Optional[str] = None) -> str:
         """Update org and project identifiers in YAML content"""
+        # Fast path: rewrite the identifier lines in place, avoiding a full parse/dump round-trip
+        updated = YAMLUtils._replace_child_lines(
+            yaml_content, _IDENTIFIER_LINE_RE,
+            {"orgIdentifier": dest_org, "projectIdentifier": dest_project}, wrapper_key)
+        if updated is not None:
+            return updated
+
         try:
-            data = yaml.safe_load(yaml_content)
+            data = _load_yaml(yaml_content)
 
             # Determine where to update identifiers
             target = data.get(wrapper_key, data) if wrapper_key else data
@@ -29,55 +89,127 @@ class YAMLUtils:
             target["orgIdentifier"] = dest_org
             target["projectIdentifier"] = dest_project
 
-            return yaml.dump(data, default_flow_style=False, sort_keys=False)
+            return _dump_yaml(data)
         except (yaml.YAMLError, ValueError, TypeError, KeyError) as e:
             logger.error("Failed to update YAML identifiers: %s", e)
-            # Fallback to string replacement
-            yaml_content = re.sub(
-                r'orgIdentifier:\s*["\']?[^"\'\s]+["\']?',
-                f'orgIdentifier: "{dest_org}"',
-                yaml_content
-            )
-            yaml_content = re.sub(
-                r'projectIdentifier:\s*["\']?[^"\'\s]+["\']?',
-                f'projectIdentifier: "{dest_project}"',
-                yaml_content
-            )
-            return yaml_content
+            # Fallback to string replacement, rewriting both identifiers in one pass
+            values = {"orgIdentifier": dest_org, "projectIdentifier": dest_project}
+            return _IDENTIFIER_VALUE_RE.sub(
+                lambda match: f'{match.group("key")}: "{values[match.group("key")]}"', yaml_content)
+
+    @staticmethod
+    def _replace_child_lines(yaml_content: str, line_re: Pattern[str], values: Dict[str, str],
+                             wrapper_key: Optional[str] = None) -> Optional[str]:
+        """Replace scalar values directly in the YAML text.
+
+        Only keys that are direct children of the wrapper key (or of the root when
+        no wrapper is given) are touched, and each may appear at most once with its
+        value on the same line. Keys missing under a wrapper key are added after
+        its last child, provided they appear nowhere else in the text. Values are
+        written quoted, so identifiers such as on or 0123 stay strings.
+        Returns None when the layout is not recognized so the caller can fall back
+        to a full YAML round-trip.
+        """
+        indent = ""
+        wrapper = None
+        if wrapper_key:
+            wrapper = _wrapper_re(wrapper_key).search(yaml_content)
+            if not wrapper:
+                return None
+            indent = wrapper.group("indent")
+
+        values = {key: json.dumps(value) for key, value in values.items()}
+        replaced = dict.fromkeys(values, 0)
+        continued: List[str] = []
+
+        def replace(match):
+            if match.group("indent") != indent:
+                return match.group(0)
+            key = match.group("key")
+            replaced[key] += 1
+            next_line = _NEXT_LINE_RE.match(yaml_content, match.end())
+            if next_line and len(next_line.group("indent")) > len(indent):
+                continued.append(key)
+            return f"{indent}{key}: {values[key]}"
+
+        updated = line_re.sub(replace, yaml_content)
+        if continued or any(count > 1 for count in replaced.values()):
+            return None
+        missing = [key for key, count in replaced.items() if count == 0]
+        if not missing:
+            return updated
+        # A key written some other way (quoted, or nested elsewhere) must not be added twice
+        if any(key in yaml_content for key in missing):
+            return None
+        # Adding keys is only safe under a wrapper key that holds a mapping
+        if wrapper is None or wrapper.group(0).endswith("-"):
+            return None
+        newline = "\r\n" if "\r\n" in wrapper.group(0) else "\n"
+        # The wrapper key is top-level, so its block ends at the next unindented line
+        block_end = _UNINDENTED_LINE_RE.search(updated, wrapper.end())
+        position = block_end.start() if block_end else len(updated)
+        added = "".join(f"{indent}{key}: {values[key]}{newline}" for key in missing)
+        if position and updated[position - 1] != "\n":
+            added = newline + added
+        return updated[:position] + added + updated[position:]
 
     @staticmethod
     def extract_template_refs(yaml_content: str) -> List[Tuple[str, Optional[str]]]:
         """Extract template references from pipeline YAML"""
+        # Most pipelines reference no templates; skip parsing them entirely
+        if "templateRef" not in yaml_content:
+            return []
+
         try:
-            data = yaml.safe_load(yaml_content)
-            templates = []
+            data = _load_yaml(yaml_content)
+            # Pipelines often reuse a template in every stage; keep each reference once, in order
+            templates: Dict[Tuple[str, Optional[str]], None] = {}
 
-            def find_templates(obj, path=""):
+            # Walk only the containers, depth-first in document order, without recursing per leaf
+            stack = [data] if isinstance(data, (dict, list)) else []
+            while stack:
+                obj = stack.pop()
                 if isinstance(obj, dict):
                     if "templateRef" in obj:
-                        template_ref = obj["templateRef"]
-                        version_label = obj.get("versionLabel")
-                        templates.append((template_ref, version_label))
-                    for key, value in obj.items():
-                        find_templates(value, f"{path}.{key}" if path else key)
-                elif isinstance(obj, list):
-                    for i, item in enumerate(obj):
-                        find_templates(item, f"{path}[{i}]")
-
-            find_templates(data)
-            return templates
+                        templates[(obj["templateRef"], obj.get("versionLabel"))] = None
+                    children = obj.values()
+                else:
+                    children = obj
+                stack.extend(child for child in reversed(list(children))
+                             if isinstance(child, (dict, list)))
+            return list(templates)
         except yaml.YAMLError as e:
             logger.error("Failed to parse YAML for template extraction: %s", e)
             return []
 
+    @staticmethod
+    def update_template_yaml(yaml_content: str, dest_org: str, dest_project: str,
+                             version_label: Optional[str] = None) -> str:
+        """Update org/project identifiers and the version label of template YAML in one pass"""
+        updated = YAMLUtils._replace_child_lines(
+            yaml_content, _TEMPLATE_FIELD_LINE_RE,
+            {"orgIdentifier": dest_org, "projectIdentifier": dest_project,
+             "versionLabel": version_label or "stable"}, wrapper_key="template")
+        if updated is not None:
+            return updated
+        updated = YAMLUtils.update_identifiers(yaml_content, dest_org, dest_project, wrapper_key="template")
+        return YAMLUtils.set_template_version(updated, version_label)
+
     @staticmethod
     def set_template_version(yaml_content: str, version_label: Optional[str] = None) -> str:
         """Set version label in template YAML"""
+        # Fast path: templates fetched from Harness already carry a versionLabel to rewrite
+        updated = YAMLUtils._replace_child_lines(
+            yaml_content, _VERSION_LABEL_LINE_RE,
+            {"versionLabel": version_label or "stable"}, wrapper_key="template")
+        if updated is not None:
+            return updated
+
         try:
-            template_dict = yaml.safe_load(yaml_content)
+            template_dict = _load_yaml(yaml_content)
             if "template" in template_dict:
                 template_dict["template"]["versionLabel"] = version_label or "stable"
-            return yaml.dump(template_dict, default_flow_style=False, sort_keys=False)
+            return _dump_yaml(template_dict)
         except yaml.YAMLError:
             logger.warning("Failed to set template version, using original YAML")
             return yaml_content
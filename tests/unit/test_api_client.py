@@ -4,11 +4,21 @@ Comprehensive unit tests for HarnessAPIClient
 Tests API client functionality with proper mocking and AAA methodology.
 """
 
+import email.utils
+import io
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
+import pytest
+import requests
 from requests.exceptions import RequestException, HTTPError
 
-from src.api_client import HarnessAPIClient
+from src.api_client import (
+    CONNECTION_POOL_SIZE, GET_CACHE_MAX_ENTRIES, GET_CACHE_TTL, MAX_DRAINED_BODY_BYTES, MAX_ERROR_BODY_BYTES,
+    MAX_RETRIES, REQUEST_TIMEOUT, HarnessAPIClient, HarnessAuthenticationError, TokenBucket
+)
 
 
 @pytest.mark.unit
@@ -33,6 +43,72 @@ class TestHarnessAPIClient:
         assert client.session.headers["x-api-key"] == "test-key"
         assert client.session.headers["Content-Type"] == "application/json"
 
+    def test_init_mounts_pooled_adapter(self):
+        """Test that the session uses a connection pool sized for concurrent workers"""
+        # Arrange & Act
+        client = HarnessAPIClient("https://test.com", "test-key")
+
+        # Assert
+        adapter = client.session.get_adapter("https://test.com/v1/orgs")
+        assert adapter._pool_maxsize == CONNECTION_POOL_SIZE
+        assert adapter._pool_connections == CONNECTION_POOL_SIZE
+        assert adapter._pool_block is True
+
+    @patch('src.api_client.HTTPAdapter.send')
+    def test_adapter_applies_default_timeout(self, mock_send):
+        """Test that requests sent without a timeout get the default connect/read timeout"""
+        # Arrange
+        adapter = self.client.session.get_adapter("https://app.harness.io/v1")
+        request = Mock()
+
+        # Act
+        adapter.send(request)
+        adapter.send(request, timeout=3)
+
+        # Assert
+        assert mock_send.call_args_list[0][1]["timeout"] == REQUEST_TIMEOUT
+        assert mock_send.call_args_list[1][1]["timeout"] == 3
+
+    def test_init_resolves_environment_settings_once(self, monkeypatch):
+        """Test that proxy and CA bundle settings are read at init, not per request"""
+        # Arrange
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example.com:3128")
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", "/etc/ssl/corp-ca.pem")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+
+        # Act
+        client = HarnessAPIClient("https://test.com", "test-key")
+
+        # Assert
+        assert client.session.trust_env is False
+        assert client.session.proxies["https"] == "http://proxy.example.com:3128"
+        assert client.session.verify == "/etc/ssl/corp-ca.pem"
+
+    def test_init_shares_connection_pool_between_clients(self):
+        """Test that clients reuse one adapter so connections to the same host are shared"""
+        # Arrange & Act
+        source = HarnessAPIClient("https://app.harness.io", "source-key")
+        dest = HarnessAPIClient("https://app.harness.io", "dest-key")
+
+        # Assert
+        assert source.session.get_adapter("https://app.harness.io/v1") is \
+            dest.session.get_adapter("https://app.harness.io/v1")
+        assert source.session.headers["x-api-key"] == "source-key"
+        assert dest.session.headers["x-api-key"] == "dest-key"
+
+    def test_init_retries_only_failed_connections_in_transport(self):
+        """Test that the transport retries connection failures but leaves status retries to the client"""
+        # Arrange & Act
+        client = HarnessAPIClient("https://test.com", "test-key")
+
+        # Assert
+        retry = client.session.get_adapter("https://test.com/v1/orgs").max_retries
+        assert retry.connect == MAX_RETRIES
+        assert retry.read == 0
+        assert retry.status == 0
+        assert not retry.status_forcelist
+
     def test_init_strips_trailing_slash_from_base_url(self):
         """Test that trailing slash is removed from base_url"""
         # Arrange & Act
@@ -48,6 +124,7 @@ class TestHarnessAPIClient:
         expected_response = {"data": "test"}
         mock_response = Mock()
         mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -65,6 +142,7 @@ class TestHarnessAPIClient:
         # Arrange
         mock_response = Mock()
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         params = {"org": "test-org", "project": "test-project"}
@@ -96,7 +174,7 @@ class TestHarnessAPIClient:
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_response.text = "Not Found"
+        mock_response.content = b"Not Found"
         mock_response.url = "https://app.harness.io/test-endpoint"
         http_error = HTTPError("404 Client Error")
         http_error.response = mock_response
@@ -108,6 +186,7 @@ class TestHarnessAPIClient:
         # Assert
         assert result is None
 
+    @patch('src.api_client.orjson', None)
     @patch('src.api_client.requests.Session.post')
     def test_post_success_returns_json_response(self, mock_post):
         """Test successful POST request returns JSON response"""
@@ -115,6 +194,7 @@ class TestHarnessAPIClient:
         expected_response = {"id": "123", "status": "created"}
         mock_response = Mock()
         mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
         payload = {"name": "test"}
@@ -130,12 +210,14 @@ class TestHarnessAPIClient:
             json=payload
         )
 
+    @patch('src.api_client.orjson', None)
     @patch('src.api_client.requests.Session.post')
     def test_post_with_params_and_json(self, mock_post):
         """Test POST request with both params and json data"""
         # Arrange
         mock_response = Mock()
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         mock_response.raise_for_status.return_value = None
         mock_post.return_value = mock_response
         params = {"org": "test-org"}
@@ -151,6 +233,51 @@ class TestHarnessAPIClient:
             json=json_data
         )
 
+    @patch('src.api_client.requests.Session.post')
+    @patch('src.api_client.requests.Session.get')
+    def test_get_raw_body_is_posted_without_decoding(self, mock_get, mock_post):
+        """Test a raw GET body can be forwarded as POST data without being decoded"""
+        # Arrange
+        raw_body = b'{"name": "test"}'
+        source_response = Mock(status_code=200, content=raw_body)
+        mock_get.return_value = source_response
+        mock_post.return_value = Mock(status_code=200, content=b'{}')
+
+        # Act
+        body = self.client.get_raw("/source", params={"pipeline": "p1"})
+        self.client.post("/destination", data=body)
+
+        # Assert
+        assert body == raw_body
+        source_response.json.assert_not_called()
+        mock_post.assert_called_once_with(
+            "https://app.harness.io/destination",
+            params=None,
+            json=None,
+            data=raw_body
+        )
+
+    @patch('src.api_client.requests.Session.post')
+    def test_post_encodes_json_body_with_orjson_when_installed(self, mock_post):
+        """Test a JSON body is encoded with orjson and sent as data when it is available"""
+        # Arrange
+        mock_post.return_value = Mock(status_code=200, content=b'{}')
+        mock_orjson = Mock(OPT_NON_STR_KEYS=1)
+        mock_orjson.dumps.return_value = b'{"name":"test"}'
+
+        # Act
+        with patch('src.api_client.orjson', mock_orjson):
+            self.client.post("/test-endpoint", json={"name": "test"})
+
+        # Assert
+        mock_orjson.dumps.assert_called_once_with({"name": "test"}, option=1)
+        mock_post.assert_called_once_with(
+            "https://app.harness.io/test-endpoint",
+            params=None,
+            data=b'{"name":"test"}'
+        )
+
+    @patch('src.api_client.orjson', None)
     @patch('src.api_client.requests.Session.put')
     def test_put_success_returns_json_response(self, mock_put):
         """Test successful PUT request returns JSON response"""
@@ -158,6 +285,7 @@ class TestHarnessAPIClient:
         expected_response = {"id": "123", "status": "updated"}
         mock_response = Mock()
         mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_put.return_value = mock_response
         payload = {"name": "updated"}
@@ -180,6 +308,7 @@ class TestHarnessAPIClient:
         expected_response = {"status": "deleted"}
         mock_response = Mock()
         mock_response.json.return_value = expected_response
+        mock_response.content = json.dumps(expected_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_delete.return_value = mock_response
 
@@ -380,6 +509,7 @@ class TestHarnessAPIClient:
         # Arrange
         mock_response = Mock()
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -390,6 +520,20 @@ class TestHarnessAPIClient:
         # Assert
         mock_logger.debug.assert_called_once()
 
+    @patch('src.api_client.requests.Session.get')
+    def test_get_skips_debug_message_when_debug_disabled(self, mock_get):
+        """Test that no debug record is built when DEBUG logging is off"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+
+        # Act
+        with patch('src.api_client.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            self.client.get("/test-endpoint")
+
+        # Assert
+        mock_logger.debug.assert_not_called()
+
     @patch('src.api_client.requests.Session.get')
     def test_get_error_logs_error_message(self, mock_get):
         """Test that GET request error logs error message"""
@@ -402,3 +546,624 @@ class TestHarnessAPIClient:
 
         # Assert
         mock_logger.error.assert_called()
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.post')
+    def test_post_retries_on_rate_limit_then_succeeds(self, mock_post, mock_sleep):
+        """Test that a 429 response is retried and the eventual success is returned"""
+        # Arrange
+        throttled = Mock(status_code=429, headers={})
+        success = Mock(status_code=200)
+        success.json.return_value = {"status": "SUCCESS"}
+        success.content = json.dumps({"status": "SUCCESS"}).encode()
+        mock_post.side_effect = [throttled, success]
+
+        # Act
+        result = self.client.post("/test-endpoint", json={"test": "data"})
+
+        # Assert
+        assert result == {"status": "SUCCESS"}
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.get')
+    def test_get_retry_honors_retry_after_header(self, mock_get, mock_sleep):
+        """Test that the Retry-After header determines the retry delay"""
+        # Arrange
+        unavailable = Mock(status_code=503, headers={"Retry-After": "7"})
+        success = Mock(status_code=200)
+        success.json.return_value = {"data": "test"}
+        success.content = json.dumps({"data": "test"}).encode()
+        mock_get.side_effect = [unavailable, success]
+
+        # Act
+        result = self.client.get("/test-endpoint")
+
+        # Assert
+        assert result == {"data": "test"}
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.put')
+    def test_put_retries_on_request_timeout(self, mock_put, mock_sleep):
+        """Test that a 408 is retried without pausing the rate limiter"""
+        # Arrange
+        client = HarnessAPIClient("https://app.harness.io", "test-api-key", rate_limit=10)
+        client._rate_limiter = Mock(spec=TokenBucket)
+        timed_out = Mock(status_code=408, headers={})
+        success = Mock(status_code=200, content=b"{}")
+        mock_put.side_effect = [timed_out, success]
+
+        # Act
+        result = client.put("/test-endpoint", json={"test": "data"})
+
+        # Assert
+        assert result == {}
+        assert mock_put.call_count == 2
+        mock_sleep.assert_called_once()
+        client._rate_limiter.pause.assert_not_called()
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.get')
+    def test_get_429_pauses_shared_rate_limiter(self, mock_get, mock_sleep):
+        """Test that a 429 holds back the whole client for the Retry-After duration"""
+        # Arrange
+        client = HarnessAPIClient("https://app.harness.io", "test-api-key", rate_limit=10)
+        client._rate_limiter = Mock(spec=TokenBucket)
+        throttled = Mock(status_code=429, headers={"Retry-After": "5"})
+        success = Mock(status_code=200, content=b"{}")
+        mock_get.side_effect = [throttled, success]
+
+        # Act
+        client.get("/test-endpoint")
+
+        # Assert
+        client._rate_limiter.pause.assert_called_once_with(5.0)
+        client._rate_limiter.slow_down.assert_called_once()
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.get')
+    def test_get_gives_up_after_max_retries(self, mock_get, mock_sleep):
+        """Test that retries stop after MAX_RETRIES and the error is reported"""
+        # Arrange
+        throttled = Mock(status_code=429, headers={}, content=b"")
+        throttled.raise_for_status.side_effect = HTTPError("429 Too Many Requests", response=throttled)
+        mock_get.return_value = throttled
+
+        # Act
+        result = self.client.get("/test-endpoint")
+
+        # Assert
+        assert result is None
+        assert mock_get.call_count == MAX_RETRIES + 1
+        assert mock_sleep.call_count == MAX_RETRIES
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.get')
+    def test_get_does_not_retry_client_errors(self, mock_get, mock_sleep):
+        """Test that non-retryable 4xx responses fail immediately"""
+        # Arrange
+        not_found = Mock(status_code=404, headers={}, content=b"")
+        not_found.raise_for_status.side_effect = HTTPError("404 Not Found", response=not_found)
+        mock_get.return_value = not_found
+
+        # Act
+        result = self.client.get("/test-endpoint")
+
+        # Assert
+        assert result is None
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_retry_delay_uses_exponential_backoff_with_jitter(self):
+        """Test that the retry delay grows exponentially and stays within the jitter bound"""
+        # Arrange
+        response = Mock(headers={})
+
+        # Act
+        with patch('src.api_client.random.random', return_value=1.0):
+            delays = [self.client._get_retry_delay(response, attempt) for attempt in range(3)]
+
+        # Assert
+        assert delays == [1.5, 3.0, 6.0]
+
+    def test_retry_delay_honors_retry_after_http_date(self):
+        """Test that a Retry-After date waits until that time, and a past date not at all"""
+        # Arrange
+        retry_at = email.utils.format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+        future = Mock(headers={"Retry-After": retry_at})
+        past = Mock(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+        # Act
+        future_delay = self.client._get_retry_delay(future, 0)
+        past_delay = self.client._get_retry_delay(past, 0)
+
+        # Assert
+        assert 8.0 < future_delay <= 10.0
+        assert past_delay == 0.0
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_waits_for_rate_limiter(self, mock_get):
+        """Test that every request acquires a token from the client rate limiter"""
+        # Arrange
+        client = HarnessAPIClient("https://test.com", "test-key", rate_limit=5)
+        client._rate_limiter = Mock(spec=TokenBucket)
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+
+        # Act
+        client.get("/first")
+        client.get("/second")
+
+        # Assert
+        assert client._rate_limiter.acquire.call_count == 2
+
+    def test_rate_limiter_disabled_by_default(self):
+        """Test that a client created without a rate limit never throttles"""
+        # Arrange & Act
+        with patch('src.api_client.time.sleep') as mock_sleep:
+            for _ in range(50):
+                self.client.throttle()
+
+        # Assert
+        assert self.client._rate_limiter is None
+        mock_sleep.assert_not_called()
+
+    @patch('src.api_client.requests.Session.get')
+    def test_exists_checks_status_without_reading_body(self, mock_get):
+        """Test exists streams the response and releases it without decoding the body"""
+        # Arrange
+        response = Mock(status_code=200)
+        mock_get.return_value = response
+
+        # Act
+        result = self.client.exists("/test-endpoint")
+
+        # Assert
+        assert result is True
+        assert mock_get.call_args.kwargs["stream"] is True
+        response.close.assert_called_once()
+        response.json.assert_not_called()
+
+    @patch('src.api_client.requests.Session.get')
+    def test_exists_reads_small_body_to_keep_connection(self, mock_get):
+        """Test a small streamed body is drained so its connection returns to the pool"""
+        # Arrange
+        small = Mock(status_code=404, headers={"Content-Length": "120"})
+        large = Mock(status_code=200, headers={"Content-Length": str(MAX_DRAINED_BODY_BYTES + 1)})
+        mock_get.side_effect = [small, large]
+
+        # Act
+        missing = self.client.exists("/small")
+        found = self.client.exists("/large")
+
+        # Assert
+        assert missing is False
+        assert found is True
+        small.raw.drain_conn.assert_called_once()
+        large.raw.drain_conn.assert_not_called()
+        small.close.assert_called_once()
+        large.close.assert_called_once()
+
+    @patch('src.api_client.logger')
+    @patch('src.api_client.requests.Session.get')
+    def test_exists_treats_not_found_as_missing_without_error_log(self, mock_get, mock_logger):
+        """Test a 404 answers the existence check instead of being logged as an API error"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=404)
+
+        # Act
+        result = self.client.exists("/test-endpoint")
+
+        # Assert
+        assert result is False
+        mock_logger.error.assert_not_called()
+
+    @patch('src.api_client.requests.Session.get')
+    def test_exists_raises_on_authentication_failure(self, mock_get):
+        """Test exists reports authentication failures like other requests"""
+        # Arrange
+        response = Mock(status_code=401, content=b"")
+        response.raise_for_status.side_effect = HTTPError("401 Unauthorized", response=response)
+        mock_get.return_value = response
+
+        # Act & Assert
+        with pytest.raises(HarnessAuthenticationError):
+            self.client.exists("/test-endpoint")
+
+    @patch('src.api_client.requests.Session.get')
+    def test_exists_uses_cached_get(self, mock_get):
+        """Test a resource fetched moments ago is known to exist without another request"""
+        # Arrange
+        success = Mock(status_code=200, content=b'{"data": "test"}')
+        mock_get.return_value = success
+        self.client.get("/test-endpoint")
+
+        # Act
+        result = self.client.exists("/test-endpoint")
+
+        # Assert
+        assert result is True
+        mock_get.assert_called_once()
+
+    def test_error_body_is_truncated(self):
+        """Test that only the start of a large error body is decoded for logging"""
+        # Arrange
+        response = Mock(content=b"x" * (MAX_ERROR_BODY_BYTES * 10))
+
+        # Act
+        body = HarnessAPIClient.error_body(response)
+
+        # Assert
+        assert body == "x" * MAX_ERROR_BODY_BYTES
+
+    def test_error_body_replaces_invalid_utf8(self):
+        """Test that a body cut mid-character is still decoded"""
+        # Arrange
+        response = Mock(content="é".encode("utf-8") * MAX_ERROR_BODY_BYTES)
+
+        # Act
+        body = HarnessAPIClient.error_body(response)
+
+        # Assert
+        assert body.startswith("é")
+
+    def test_error_body_reads_only_prefix_of_streamed_response(self):
+        """Test that an unread streamed body is read only up to the logging limit"""
+        # Arrange
+        raw = io.BytesIO(b"y" * (MAX_ERROR_BODY_BYTES * 10))
+        response = requests.Response()
+        response.raw = raw
+
+        # Act
+        body = HarnessAPIClient.error_body(response)
+
+        # Assert
+        assert body == "y" * MAX_ERROR_BODY_BYTES
+        assert raw.closed
+
+    @patch('src.api_client.requests.Session.get')
+    def test_error_body_not_read_when_errors_are_not_logged(self, mock_get):
+        """Test a failed request's body is left unread when error logging is disabled"""
+        # Arrange
+        response = Mock(status_code=404)
+        response.raise_for_status.side_effect = HTTPError("404 Not Found", response=response)
+        mock_get.return_value = response
+
+        # Act
+        with patch('src.api_client.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            with patch.object(HarnessAPIClient, 'error_body') as mock_error_body:
+                result = self.client.get("/missing")
+
+        # Assert
+        assert result is None
+        mock_error_body.assert_not_called()
+        mock_logger.error.assert_not_called()
+        response.close.assert_called_once()
+
+    def test_decode_json_uses_orjson_when_installed(self):
+        """Test that response bodies are decoded from bytes with orjson when available"""
+        # Arrange
+        response = Mock(content=b'{"status": "SUCCESS"}')
+        mock_orjson = Mock(JSONDecodeError=ValueError)
+        mock_orjson.loads.return_value = {"status": "SUCCESS"}
+
+        # Act
+        with patch('src.api_client.orjson', mock_orjson):
+            result = HarnessAPIClient._decode_json(response)
+
+        # Assert
+        assert result == {"status": "SUCCESS"}
+        mock_orjson.loads.assert_called_once_with(b'{"status": "SUCCESS"}')
+        response.json.assert_not_called()
+
+    def test_decode_json_falls_back_without_orjson(self):
+        """Test that requests' JSON decoding is used when orjson is not installed"""
+        # Arrange
+        response = Mock(content=b'{"status": "SUCCESS"}')
+        response.json.return_value = {"status": "SUCCESS"}
+
+        # Act
+        with patch('src.api_client.orjson', None):
+            result = HarnessAPIClient._decode_json(response)
+
+        # Assert
+        assert result == {"status": "SUCCESS"}
+        response.json.assert_called_once()
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_non_json_body_returns_none(self, mock_get):
+        """Test that a successful response without a JSON body is logged and returns None"""
+        # Arrange
+        mock_response = Mock(status_code=200, headers={}, content=b"<html>", text="<html>")
+        mock_response.json.side_effect = requests.exceptions.JSONDecodeError("Expecting value", "<html>", 0)
+        mock_get.return_value = mock_response
+
+        # Act
+        result = self.client.get("/test-endpoint")
+
+        # Assert
+        assert result is None
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_reuses_recent_response_for_same_endpoint(self, mock_get):
+        """Test that a repeated GET without params is answered from the cache"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b'{"identifier": "org"}',
+                                     json=Mock(return_value={"identifier": "org"}))
+
+        # Act
+        first = self.client.get("/v1/orgs/org")
+        second = self.client.get("/v1/orgs/org")
+
+        # Assert
+        assert first == second == {"identifier": "org"}
+        mock_get.assert_called_once()
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_cache_expires_after_ttl(self, mock_get):
+        """Test that cached GET responses are refetched once the TTL has passed"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+
+        # Act
+        with patch('src.api_client.time.monotonic', side_effect=[100.0, 100.0 + GET_CACHE_TTL + 1, 200.0]):
+            self.client.get("/v1/orgs/org")
+            self.client.get("/v1/orgs/org")
+
+        # Assert
+        assert mock_get.call_count == 2
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_with_params_is_not_cached(self, mock_get):
+        """Test that GET requests with query parameters always reach the server"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+
+        # Act
+        self.client.get("/v1/input-sets", params={"pipeline": "p1"})
+        self.client.get("/v1/input-sets", params={"pipeline": "p1"})
+
+        # Assert
+        assert mock_get.call_count == 2
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_failure_is_not_cached(self, mock_get):
+        """Test that a failed GET is retried on the next call"""
+        # Arrange
+        not_found = Mock(status_code=404, headers={}, content=b"")
+        not_found.raise_for_status.side_effect = HTTPError("404 Not Found", response=not_found)
+        mock_get.return_value = not_found
+
+        # Act
+        self.client.get("/v1/orgs/org")
+        self.client.get("/v1/orgs/org")
+
+        # Assert
+        assert mock_get.call_count == 2
+
+    @patch('src.api_client.requests.Session.post')
+    @patch('src.api_client.requests.Session.get')
+    def test_write_invalidates_get_cache(self, mock_get, mock_post):
+        """Test that a write forces the next GET to fetch fresh data"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+        mock_post.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+
+        # Act
+        self.client.get("/v1/orgs/org/projects/proj/pipelines/p1")
+        self.client.post("/v1/orgs/org/projects/proj/pipelines", json={"identifier": "p1"})
+        self.client.get("/v1/orgs/org/projects/proj/pipelines/p1")
+
+        # Assert
+        assert mock_get.call_count == 2
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_cache_drops_oldest_entries_beyond_bound(self, mock_get):
+        """Test that the GET cache stays bounded by evicting the oldest responses"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+
+        # Act
+        for index in range(GET_CACHE_MAX_ENTRIES + 1):
+            self.client.get(f"/v1/orgs/org{index}")
+
+        # Assert
+        assert len(self.client._get_cache) == GET_CACHE_MAX_ENTRIES
+        assert "/v1/orgs/org0" not in self.client._get_cache
+        assert f"/v1/orgs/org{GET_CACHE_MAX_ENTRIES}" in self.client._get_cache
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_waits_for_inflight_request_to_same_endpoint(self, mock_get):
+        """Test that a GET already being fetched by another caller is not sent again"""
+        # Arrange
+        inflight = Future()
+        self.client._inflight["/v1/orgs/org"] = inflight
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            waiting = executor.submit(self.client.get, "/v1/orgs/org")
+
+            # Act
+            inflight.set_result({"identifier": "org"})
+            result = waiting.result(timeout=5)
+
+        # Assert
+        assert result == {"identifier": "org"}
+        mock_get.assert_not_called()
+
+    @patch('src.api_client.requests.Session.get')
+    def test_get_releases_inflight_entry_after_failure(self, mock_get):
+        """Test that a failed GET does not leave later callers waiting"""
+        # Arrange
+        mock_get.side_effect = RequestException("Network error")
+
+        # Act
+        result = self.client.get("/v1/orgs/org")
+
+        # Assert
+        assert result is None
+        assert not self.client._inflight
+
+    @patch('src.api_client.requests.Session.post')
+    @patch('src.api_client.requests.Session.get')
+    def test_write_keeps_unrelated_cached_gets(self, mock_get, mock_post):
+        """Test that a write only invalidates cached GETs on the written path"""
+        # Arrange
+        mock_get.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+        mock_post.return_value = Mock(status_code=200, headers={}, content=b"{}", json=Mock(return_value={}))
+        self.client.get("/v1/orgs/org/projects/proj/templates/t1")
+        self.client.get("/v1/orgs/org/projects/proj")
+
+        # Act
+        self.client.post("/v1/orgs/org/projects/proj/pipelines", json={"identifier": "p1"})
+        self.client.get("/v1/orgs/org/projects/proj/templates/t1")
+        self.client.get("/v1/orgs/org/projects/proj")
+
+        # Assert
+        assert mock_get.call_count == 3
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.post')
+    def test_post_reuses_idempotency_key_on_retry(self, mock_post, mock_sleep):
+        """Test that every retry of a create carries the same Idempotency-Key header"""
+        # Arrange
+        throttled = Mock(status_code=503, headers={})
+        success = Mock(status_code=200, content=b"{}", json=Mock(return_value={}))
+        mock_post.side_effect = [throttled, success]
+
+        # Act
+        self.client.post("/v1/templates", json={"identifier": "t1"}, idempotency_key="abc123")
+
+        # Assert
+        assert mock_post.call_count == 2
+        for call in mock_post.call_args_list:
+            assert call.kwargs["headers"] == {"Idempotency-Key": "abc123"}
+
+    @patch('src.api_client.time.sleep')
+    @patch('src.api_client.requests.Session.put')
+    def test_send_raw_retries_and_returns_final_response(self, mock_put, mock_sleep):
+        """Test that a non-JSON body is retried on throttling and the final response returned"""
+        # Arrange
+        throttled = Mock(status_code=429, headers={})
+        success = Mock(status_code=200)
+        mock_put.side_effect = [throttled, success]
+
+        # Act
+        result = self.client.send_raw("PUT", "/pipeline/api/triggers/t1", "trigger: {}",
+                                      "application/yaml", params={"orgIdentifier": "org"})
+
+        # Assert
+        assert result is success
+        assert mock_put.call_count == 2
+        assert mock_put.call_args.args[0] == "https://app.harness.io/pipeline/api/triggers/t1"
+        assert mock_put.call_args.kwargs["data"] == "trigger: {}"
+        assert mock_put.call_args.kwargs["headers"] == {"Content-Type": "application/yaml"}
+
+    @patch('src.api_client.requests.Session.post')
+    def test_send_raw_returns_none_on_timeout(self, mock_post):
+        """Test that a request that cannot be sent is logged and returns None instead of raising"""
+        # Arrange
+        mock_post.side_effect = requests.exceptions.ReadTimeout("read timed out")
+
+        # Act
+        with patch.object(self.client, '_report_request_error') as mock_report:
+            result = self.client.send_raw("POST", "/pipeline/api/triggers", "trigger: {}", "application/yaml")
+
+        # Assert
+        assert result is None
+        mock_report.assert_called_once_with(
+            mock_post.side_effect, "https://app.harness.io/pipeline/api/triggers")
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test suite for TokenBucket"""
+
+    def test_acquire_allows_burst_up_to_capacity(self):
+        """Test that a full bucket hands out tokens without waiting"""
+        # Arrange
+        bucket = TokenBucket(rate=10, capacity=3)
+
+        # Act
+        with patch('src.api_client.time.monotonic', return_value=100.0), \
+                patch('src.api_client.time.sleep') as mock_sleep:
+            bucket._updated = 100.0
+            for _ in range(3):
+                bucket.acquire()
+
+        # Assert
+        mock_sleep.assert_not_called()
+
+    def test_acquire_waits_for_refill_when_empty(self):
+        """Test that an empty bucket sleeps until the next token is due"""
+        # Arrange
+        bucket = TokenBucket(rate=4, capacity=1)
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        # Act
+        with patch('src.api_client.time.monotonic', side_effect=lambda: clock[0]), \
+                patch('src.api_client.time.sleep', side_effect=fake_sleep) as mock_sleep:
+            bucket._updated = clock[0]
+            bucket.acquire()
+            bucket.acquire()
+
+        # Assert
+        mock_sleep.assert_called_once_with(pytest.approx(0.25))
+
+    def test_pause_holds_back_callers_then_restarts_empty(self):
+        """Test that a pause delays the next token until the pause ends and the bucket refills"""
+        # Arrange
+        bucket = TokenBucket(rate=4, capacity=4)
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        # Act
+        with patch('src.api_client.time.monotonic', side_effect=lambda: clock[0]), \
+                patch('src.api_client.time.sleep', side_effect=fake_sleep):
+            bucket._updated = clock[0]
+            bucket.pause(2.0)
+            bucket.acquire()
+
+        # Assert
+        assert clock[0] == pytest.approx(102.25)
+
+    def test_slow_down_halves_rate_then_recovers(self):
+        """Test that a throttled bucket hands out tokens at half rate, then climbs back to its rate"""
+        # Arrange
+        bucket = TokenBucket(rate=4, capacity=1)
+        clock = [100.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        # Act
+        with patch('src.api_client.time.monotonic', side_effect=lambda: clock[0]), \
+                patch('src.api_client.time.sleep', side_effect=fake_sleep) as mock_sleep:
+            bucket._updated = clock[0]
+            bucket.acquire()
+            bucket.slow_down()
+            bucket.acquire()
+            halved_wait = mock_sleep.call_args.args[0]
+            clock[0] += 10.0
+            bucket.acquire()
+
+        # Assert
+        assert halved_wait == pytest.approx(0.5)
+        assert bucket.rate == 4
+
+    def test_slow_down_keeps_rate_above_floor(self):
+        """Test that repeated throttling does not lower the rate below the floor"""
+        # Arrange
+        bucket = TokenBucket(rate=4)
+
+        # Act
+        for _ in range(10):
+            bucket.slow_down()
+
+        # Assert
+        assert bucket.rate == 1.0
@@ -4,6 +4,7 @@ Additional unit tests for HarnessAPIClient to improve coverage
 Tests error handling and edge cases in API client functionality.
 """
 
+import json
 from unittest.mock import Mock, patch
 import requests
 
@@ -23,7 +24,7 @@ class TestHarnessAPIClientAdditional:
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.text = "Bad Request Details"
+        mock_response.content = b"Bad Request Details"
 
         mock_error = requests.exceptions.HTTPError("HTTP Error")
         mock_error.response = mock_response
@@ -62,7 +63,7 @@ class TestHarnessAPIClientAdditional:
         # Arrange
         mock_response = Mock()
         mock_response.status_code = 404
-        mock_response.text = "Not Found Details"
+        mock_response.content = b"Not Found Details"
 
         mock_error = requests.exceptions.HTTPError("HTTP Error")
         mock_error.response = mock_response
@@ -208,12 +209,14 @@ class TestHarnessAPIClientAdditional:
         # Should return empty list when no content key
         assert result == []
 
+    @patch('src.api_client.orjson', None)
     @patch('src.api_client.requests.Session.put')
     def test_put_successful_request(self, mock_put):
         """Test successful PUT request"""
         # Arrange
         mock_response = Mock()
         mock_response.json.return_value = {"status": "updated"}
+        mock_response.content = json.dumps({"status": "updated"}).encode()
         mock_put.return_value = mock_response
 
         # Act
@@ -233,6 +236,7 @@ class TestHarnessAPIClientAdditional:
         # Arrange
         mock_response = Mock()
         mock_response.json.return_value = {"status": "deleted"}
+        mock_response.content = json.dumps({"status": "deleted"}).encode()
         mock_delete.return_value = mock_response
 
         # Act
@@ -4,9 +4,10 @@ Unit tests for BaseReplicator
 Tests the base replicator functionality.
 """
 
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
-from src.base_replicator import BaseReplicator
+from src.base_replicator import DEFAULT_MAX_WORKERS, LIST_PAGE_SIZE, BaseReplicator
 from src.api_client import HarnessAPIClient
 
 
@@ -184,6 +185,194 @@ class TestBaseReplicator:
         # Assert
         assert result == "default_value"
 
+    def test_get_max_workers_default(self):
+        """Test _get_max_workers returns the default when not configured"""
+        # Act
+        result = self.base_replicator._get_max_workers()
+
+        # Assert
+        assert result == DEFAULT_MAX_WORKERS
+
+    def test_get_max_workers_from_options(self):
+        """Test _get_max_workers reads max_workers and never returns less than 1"""
+        # Arrange
+        self.config["options"] = {"max_workers": 0}
+        base_replicator = BaseReplicator(
+            self.config,
+            self.mock_source_client,
+            self.mock_dest_client,
+            self.replication_stats
+        )
+
+        # Act
+        result = base_replicator._get_max_workers()
+
+        # Assert
+        assert result == 1
+
+    def test_increment_stat_from_worker_threads(self):
+        """Test _increment_stat does not lose updates under concurrency"""
+        # Arrange
+        self.replication_stats["input_sets"] = {"success": 0, "failed": 0, "skipped": 0}
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(200):
+                executor.submit(self.base_replicator._increment_stat, "input_sets", "success")
+
+        # Assert
+        assert self.replication_stats["input_sets"]["success"] == 200
+
+    def test_rewrite_identifiers_points_yaml_at_destination(self):
+        """Test _rewrite_identifiers replaces the source org/project with the destination"""
+        # Arrange
+        yaml_content = "pipeline:\n  orgIdentifier: source_org\n  projectIdentifier: source_project\n"
+
+        # Act
+        result = self.base_replicator._rewrite_identifiers(yaml_content, wrapper_key="pipeline")
+
+        # Assert
+        assert result == 'pipeline:\n  orgIdentifier: "dest_org"\n  projectIdentifier: "dest_project"\n'
+
+    def test_rewrite_identifiers_skipped_within_same_org_and_project(self):
+        """Test _rewrite_identifiers leaves YAML untouched when source and destination scopes match"""
+        # Arrange
+        self.config["destination"] = dict(self.config["source"])
+        replicator = BaseReplicator(
+            self.config, self.mock_source_client, self.mock_dest_client, self.replication_stats)
+        yaml_content = "pipeline:\n  orgIdentifier: source_org\n  projectIdentifier: source_project\n"
+
+        with patch('src.base_replicator.YAMLUtils.update_identifiers') as mock_update:
+            # Act
+            result = replicator._rewrite_identifiers(yaml_content, wrapper_key="pipeline")
+
+        # Assert
+        assert result is yaml_content
+        mock_update.assert_not_called()
+
+    def test_merge_stats_adds_collected_outcomes(self):
+        """Test _merge_stats adds every collected outcome count to the statistics"""
+        # Arrange
+        self.replication_stats["triggers"] = {"success": 1, "failed": 0, "skipped": 2}
+
+        # Act
+        self.base_replicator._merge_stats("triggers", {"success": 3, "failed": 1})
+
+        # Assert
+        assert self.replication_stats["triggers"] == {"success": 4, "failed": 1, "skipped": 2}
+
+    def test_iter_list_fetches_pages_until_short_page(self):
+        """Test _iter_list requests successive pages and stops at a short page"""
+        # Arrange
+        first_page = [{"identifier": f"item{i}"} for i in range(LIST_PAGE_SIZE)]
+        second_page = [{"identifier": "last"}]
+        self.mock_source_client.get.side_effect = [first_page, second_page]
+
+        # Act
+        items = list(self.base_replicator._iter_list(
+            self.mock_source_client, "/v1/input-sets", params={"pipeline": "p1"}))
+
+        # Assert
+        assert len(items) == LIST_PAGE_SIZE + 1
+        assert items[-1] == {"identifier": "last"}
+        self.mock_source_client.get.assert_any_call(
+            "/v1/input-sets", params={"pipeline": "p1", "page": 0, "limit": LIST_PAGE_SIZE})
+        self.mock_source_client.get.assert_any_call(
+            "/v1/input-sets", params={"pipeline": "p1", "page": 1, "limit": LIST_PAGE_SIZE})
+
+    def test_iter_list_is_lazy(self):
+        """Test _iter_list does not request the next page before it is needed"""
+        # Arrange
+        self.mock_source_client.get.return_value = [{"identifier": f"item{i}"} for i in range(LIST_PAGE_SIZE)]
+
+        # Act
+        items = self.base_replicator._iter_list(self.mock_source_client, "/v1/input-sets")
+        next(items)
+
+        # Assert
+        self.mock_source_client.get.assert_called_once()
+
+    def test_iter_list_empty_response(self):
+        """Test _iter_list yields nothing when the API returns no data"""
+        # Arrange
+        self.mock_source_client.get.return_value = None
+
+        # Act
+        items = list(self.base_replicator._iter_list(self.mock_source_client, "/v1/input-sets"))
+
+        # Assert
+        assert items == []
+        self.mock_source_client.get.assert_called_once()
+
+    def test_iter_pages_stops_when_a_page_repeats(self):
+        """Test _iter_pages stops at a full page listing only items already seen"""
+        # Arrange
+        page = [{"identifier": f"item{i}"} for i in range(LIST_PAGE_SIZE)]
+        self.mock_source_client.get.return_value = page
+
+        # Act
+        pages = list(self.base_replicator._iter_pages(self.mock_source_client, "/v1/input-sets"))
+
+        # Assert
+        assert pages == [page]
+        assert self.mock_source_client.get.call_count == 2
+
+    def test_iter_pages_continues_with_new_versions_of_seen_templates(self):
+        """Test _iter_pages keeps paging when a page lists new versions of templates already seen"""
+        # Arrange
+        first_page = [{"identifier": f"template{i}", "version_label": "v1"} for i in range(LIST_PAGE_SIZE)]
+        second_page = [{"identifier": "template0", "version_label": "v2"}]
+        self.mock_source_client.get.side_effect = [first_page, second_page]
+
+        # Act
+        pages = list(self.base_replicator._iter_pages(self.mock_source_client, "/v1/templates"))
+
+        # Assert
+        assert pages == [first_page, second_page]
+
+    def test_iter_pages_yields_none_for_failed_page(self):
+        """Test _iter_pages reports a failed request as None and stops"""
+        # Arrange
+        first_page = [{"identifier": f"item{i}"} for i in range(LIST_PAGE_SIZE)]
+        self.mock_source_client.get.side_effect = [first_page, None]
+
+        # Act
+        pages = list(self.base_replicator._iter_pages(self.mock_source_client, "/v1/templates"))
+
+        # Assert
+        assert pages == [first_page, None]
+        assert self.mock_source_client.get.call_count == 2
+
+    def test_idempotency_key_is_stable_per_resource(self):
+        """Test idempotency keys repeat for the same resource and differ between resources"""
+        # Arrange & Act
+        first = self.base_replicator._idempotency_key("templates", "my-template", "v1")
+        again = self.base_replicator._idempotency_key("templates", "my-template", "v1")
+        other_version = self.base_replicator._idempotency_key("templates", "my-template", "v2")
+        no_version = self.base_replicator._idempotency_key("templates", "my-template", None)
+
+        # Assert
+        assert first == again
+        assert len(first) == 32
+        assert len({first, other_version, no_version}) == 3
+
+    def test_idempotency_key_differs_between_runs(self):
+        """Test handlers of one run share idempotency keys while a later run gets new ones"""
+        # Arrange
+        same_run = BaseReplicator(self.config, self.mock_source_client, self.mock_dest_client,
+                                  self.replication_stats, self.base_replicator.run_id)
+        next_run = BaseReplicator(self.config, self.mock_source_client, self.mock_dest_client,
+                                  self.replication_stats)
+
+        # Act
+        key = self.base_replicator._idempotency_key("pipelines", "pipeline1")
+        same_run_key = same_run._idempotency_key("pipelines", "pipeline1")
+        next_run_key = next_run._idempotency_key("pipelines", "pipeline1")
+
+        # Assert
+        assert key == same_run_key
+        assert key != next_run_key
+
     def test_build_endpoint_basic(self):
         """Test _build_endpoint builds basic endpoint"""
         # Act
@@ -235,6 +424,24 @@ class TestBaseReplicator:
         # Assert
         assert result == "/v1/orgs/test_org/projects/test_project/templates/template123/versions/v1"
 
+    def test_source_endpoint_uses_source_scope(self):
+        """Test _source_endpoint builds endpoints within the source org/project"""
+        # Act
+        result = self.base_replicator._source_endpoint("input-sets", "inputset123")
+
+        # Assert
+        assert result == "/v1/orgs/source_org/projects/source_project/input-sets/inputset123"
+
+    def test_dest_endpoint_uses_destination_scope(self):
+        """Test _dest_endpoint matches _build_endpoint for the destination org/project"""
+        # Act
+        result = self.base_replicator._dest_endpoint("templates", "template123", "versions/v1")
+
+        # Assert
+        assert result == self.base_replicator._build_endpoint(
+            "templates", org="dest_org", project="dest_project",
+            resource_id="template123", sub_resource="versions/v1")
+
     def test_build_endpoint_no_resource(self):
         """Test _build_endpoint builds endpoint without resource"""
         # Act
@@ -5,7 +5,12 @@ Tests command-line interface functionality with proper mocking and AAA methodolo
 """
 
 import logging
-from unittest.mock import Mock, patch
+from logging.handlers import QueueHandler
+from unittest.mock import ANY, Mock, patch
+
+import pytest
+
+from src import logging_utils
 from src.logging_utils import setup_logging
 from src.mode_handlers import ModeHandlers
 from src.config_validator import ConfigValidator
@@ -14,6 +19,21 @@ from src.config_validator import ConfigValidator
 class TestSetupLogging:
     """Test suite for setup_logging function"""
 
+    @pytest.fixture(autouse=True)
+    def isolate_log_file(self, tmp_path, monkeypatch):
+        """Write log files into tmp_path and detach the handlers setup_logging adds"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(logging_utils, "_log_file_name", None)
+        root_logger = logging.getLogger()
+        original_handlers = root_logger.handlers[:]
+        original_level = root_logger.level
+        yield
+        logging_utils._stop_file_listener()
+        for handler in root_logger.handlers[:]:
+            if handler not in original_handlers:
+                root_logger.removeHandler(handler)
+        root_logger.setLevel(original_level)
+
     def test_setup_logging_debug_false(self):
         """Test setup_logging with debug=False sets INFO level"""
         # Arrange & Act
@@ -41,22 +61,70 @@ class TestSetupLogging:
         mock_logger.setLevel.assert_called_with(logging.DEBUG)
 
     def test_setup_logging_creates_file_handler(self):
-        """Test setup_logging creates file handler with timestamp"""
+        """Test setup_logging writes to a timestamped file handler through a queue"""
         # Arrange & Act
         with patch('src.logging_utils.setup_output') as mock_setup_output:
             with patch('src.logging_utils.logging.getLogger') as mock_get_logger:
                 with patch('src.logging_utils.logging.FileHandler') as mock_file_handler:
-                    mock_logger = Mock()
-                    mock_get_logger.return_value = mock_logger
-                    mock_handler = Mock()
-                    mock_file_handler.return_value = mock_handler
+                    with patch('src.logging_utils.QueueListener') as mock_listener:
+                        mock_logger = Mock()
+                        mock_get_logger.return_value = mock_logger
+                        mock_handler = Mock()
+                        mock_file_handler.return_value = mock_handler
 
-                    setup_logging(debug=False)
+                        setup_logging(debug=False)
 
         # Assert
         mock_setup_output.assert_called_once()
-        mock_file_handler.assert_called_once()
-        mock_logger.addHandler.assert_called_with(mock_handler)
+        mock_file_handler.assert_called_once_with(ANY, encoding="utf-8", delay=True)
+        mock_listener.assert_called_once_with(ANY, mock_handler, respect_handler_level=True)
+        mock_listener.return_value.start.assert_called_once()
+        queue_handler = mock_logger.addHandler.call_args.args[0]
+        assert isinstance(queue_handler, QueueHandler)
+        assert queue_handler.queue is mock_listener.call_args.args[0]
+
+    def test_setup_logging_file_records_are_written_in_background(self, tmp_path):
+        """Test records logged after setup_logging reach the log file once the listener stops"""
+        # Arrange
+        with patch('src.logging_utils.setup_output'):
+            setup_logging(debug=False)
+
+        # Act
+        logging.getLogger("src.test").info("queued message")
+        logging_utils._stop_file_listener()
+
+        # Assert
+        log_files = list(tmp_path.glob("replication_*.log"))
+        assert len(log_files) == 1
+        assert "INFO - src.test - queued message" in log_files[0].read_text(encoding="utf-8")
+
+    def test_setup_logging_reuses_log_file_when_called_again(self):
+        """Test repeated setup_logging calls keep writing to the same log file"""
+        # Arrange & Act
+        with patch('src.logging_utils.setup_output'):
+            with patch('src.logging_utils.logging.getLogger'):
+                with patch('src.logging_utils.logging.FileHandler') as mock_file_handler:
+                    with patch('src.logging_utils.QueueListener'):
+                        with patch('src.logging_utils.datetime') as mock_datetime:
+                            mock_datetime.now.return_value.strftime.side_effect = ["20240101_000000",
+                                                                                   "20240101_000001"]
+                            setup_logging(debug=False)
+                            setup_logging(debug=True)
+
+        # Assert
+        file_names = [call.args[0] for call in mock_file_handler.call_args_list]
+        assert file_names == ["replication_20240101_000000.log"] * 2
+
+    def test_setup_logging_does_not_create_file_before_first_record(self, tmp_path):
+        """Test the log file is only created once something is logged to it"""
+        # Arrange & Act
+        with patch('src.logging_utils.setup_output'):
+            with patch('src.logging_utils.logging.getLogger'):
+                setup_logging(debug=False)
+        logging_utils._stop_file_listener()
+
+        # Assert
+        assert list(tmp_path.glob("replication_*.log")) == []
 
     def test_setup_logging_creates_stream_handler(self):
         """Test setup_logging sets up output orchestrator"""
@@ -130,6 +198,51 @@ class TestConfigValidator:
         # Assert
         assert result is True
 
+    def test_missing_required_fields_reports_every_missing_field(self):
+        """Test missing_required_fields lists all missing fields in one pass"""
+        # Arrange
+        config_data = {
+            "source": {"base_url": "https://app.harness.io", "api_key": "test-key", "org": "source-org"},
+            "destination": "not-a-section"
+        }
+
+        # Act
+        missing = ConfigValidator.missing_required_fields(config_data)
+
+        # Assert
+        assert missing == [
+            "source.project (Source project)",
+            "destination.base_url (Destination Harness URL)",
+            "destination.api_key (Destination API key)",
+            "destination.org (Destination organization)",
+            "destination.project (Destination project)",
+        ]
+
+    def test_invalid_options_reports_options_that_are_not_positive_numbers(self):
+        """Test invalid_options lists numeric options that are zero, negative or not numbers"""
+        # Arrange
+        config_data = {"options": {"rate_limit_rps": -5, "max_workers": "8"}}
+
+        # Act
+        invalid = ConfigValidator.invalid_options(config_data)
+
+        # Assert
+        assert invalid == [
+            "options.rate_limit_rps=-5 (must be a number greater than 0)",
+            "options.max_workers='8' (must be a positive integer)",
+        ]
+
+    def test_invalid_options_accepts_positive_numbers(self):
+        """Test invalid_options accepts a fractional rate limit and an integer worker count"""
+        # Arrange
+        config_data = {"options": {"rate_limit_rps": 0.5, "max_workers": 8}}
+
+        # Act
+        invalid = ConfigValidator.invalid_options(config_data)
+
+        # Assert
+        assert invalid == []
+
     def test_validate_api_credentials_success(self):
         """Test validate_api_credentials succeeds with valid credentials"""
         # Arrange
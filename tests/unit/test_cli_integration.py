@@ -116,11 +116,11 @@ class TestCLISimple:
     @patch('src.cli.ArgumentParser')
     @patch('src.cli.setup_logging')
     def test_main_basic_flow(self, mock_setup_logging, mock_arg_parser, mock_load_config,
-                            mock_build_config, mock_replicator):
+                            mock_build_config, mock_replicator, tmp_path):
         """Test basic main function flow"""
         # Arrange
         mock_args = Mock()
-        mock_args.config = "config.json"
+        mock_args.config = str(tmp_path / "config.json")
         mock_args.non_interactive = True
         
         mock_parser_instance = Mock()
@@ -35,6 +35,18 @@ class TestCLISimple:
         result = _validate_final_config(config, True, True)
         assert result is True
 
+    def test_validate_final_config_invalid_numeric_option(self):
+        """Test _validate_final_config rejects a config file option that is not a positive number"""
+        config = {
+            "source": {"base_url": "https://app.harness.io", "api_key": "key", "org": "org", "project": "project"},
+            "destination": {"base_url": "https://app.harness.io", "api_key": "key", "org": "org", "project": "project"},
+            "pipelines": [{"identifier": "test"}],
+            "options": {"rate_limit_rps": 0}
+        }
+
+        result = _validate_final_config(config, True, True)
+        assert result is False
+
     def test_validate_final_config_missing_source_url(self):
         """Test _validate_final_config with missing source URL"""
         config = {
@@ -115,11 +127,11 @@ class TestCLISimple:
     @patch('src.cli.ArgumentParser')
     @patch('src.cli.setup_logging')
     def test_main_basic_flow(self, mock_setup_logging, mock_arg_parser, mock_load_config,
-                            mock_build_config, mock_replicator):
+                            mock_build_config, mock_replicator, tmp_path):
         """Test basic main function flow"""
         # Arrange
         mock_args = Mock()
-        mock_args.config = "config.json"
+        mock_args.config = str(tmp_path / "config.json")
         mock_args.non_interactive = True
         
         mock_parser_instance = Mock()
@@ -46,6 +46,27 @@ class TestLoadConfig:
         # Assert
         assert result == expected_config
 
+    def test_load_config_strips_line_and_block_comments(self):
+        """Test that // line comments and /* */ block comments are removed before parsing"""
+        # Arrange
+        content = (
+            '{\n'
+            '  // Source instance\n'
+            '  "source": {"base_url": "https://app.harness.io"},\n'
+            '  /* Destination instance,\n'
+            '     may be the same host */\n'
+            '  "destination": {"base_url": "https://app3.harness.io"}\n'
+            '}\n'
+        )
+
+        # Act
+        with patch("builtins.open", mock_open(read_data=content)):
+            result = load_config("config.json")
+
+        # Assert
+        assert result["source"] == {"base_url": "https://app.harness.io"}
+        assert result["destination"] == {"base_url": "https://app3.harness.io"}
+
     def test_load_config_file_not_found_returns_empty_dict(self):
         """Test loading non-existent config file returns empty dict"""
         # Arrange
@@ -178,7 +199,7 @@ class TestApplyEnvOverrides:
             "HARNESS_SOURCE_URL", "HARNESS_SOURCE_API_KEY", "HARNESS_SOURCE_ORG", "HARNESS_SOURCE_PROJECT",
             "HARNESS_DEST_URL", "HARNESS_DEST_API_KEY", "HARNESS_DEST_ORG", "HARNESS_DEST_PROJECT",
             "HARNESS_SKIP_INPUT_SETS", "HARNESS_SKIP_TRIGGERS", "HARNESS_SKIP_TEMPLATES", "HARNESS_UPDATE_EXISTING",
-            "HARNESS_DRY_RUN", "HARNESS_DEBUG", "HARNESS_NON_INTERACTIVE"
+            "HARNESS_RATE_LIMIT_RPS", "HARNESS_MAX_WORKERS", "HARNESS_DRY_RUN", "HARNESS_DEBUG", "HARNESS_NON_INTERACTIVE"
         ]
         for var in self.env_vars_to_clean:
             if var in os.environ:
@@ -253,6 +274,72 @@ class TestApplyEnvOverrides:
         assert result["options"]["update_existing"] is False
         assert result["debug"] is False
 
+    def test_apply_env_overrides_rate_limit_env_var(self):
+        """Test applying the numeric rate limit environment variable"""
+        # Arrange
+        config = {"options": {"rate_limit_rps": 20}}
+        os.environ["HARNESS_RATE_LIMIT_RPS"] = "7.5"
+
+        # Act
+        result = _apply_env_overrides(config)
+
+        # Assert
+        assert result["options"]["rate_limit_rps"] == 7.5
+
+    def test_apply_env_overrides_max_workers_env_var(self):
+        """Test applying the numeric max workers environment variable"""
+        # Arrange
+        config = {"options": {"max_workers": 4}}
+        os.environ["HARNESS_MAX_WORKERS"] = "8"
+
+        # Act
+        result = _apply_env_overrides(config)
+
+        # Assert
+        assert result["options"]["max_workers"] == 8
+        assert isinstance(result["options"]["max_workers"], int)
+
+    def test_apply_env_overrides_ignores_invalid_rate_limit(self):
+        """Test that a non-numeric rate limit environment variable is ignored"""
+        # Arrange
+        config = {"options": {"rate_limit_rps": 20}}
+        os.environ["HARNESS_RATE_LIMIT_RPS"] = "fast"
+
+        # Act
+        result = _apply_env_overrides(config)
+
+        # Assert
+        assert result["options"]["rate_limit_rps"] == 20
+
+    def test_apply_env_overrides_ignores_rate_limit_not_above_zero(self):
+        """Test that a zero or negative rate limit environment variable is ignored with a warning"""
+        # Arrange
+        config = {"options": {"rate_limit_rps": 20}}
+        os.environ["HARNESS_RATE_LIMIT_RPS"] = "-5"
+
+        # Act
+        with patch('src.config.logger') as mock_logger:
+            result = _apply_env_overrides(config)
+
+        # Assert
+        assert result["options"]["rate_limit_rps"] == 20
+        mock_logger.warning.assert_called_once()
+
+    def test_apply_env_overrides_ignores_invalid_max_workers(self):
+        """Test that a max workers environment variable that is not a positive integer is ignored"""
+        for env_value in ("0", "-2", "2.5"):
+            # Arrange
+            config = {"options": {"max_workers": 4}}
+            os.environ["HARNESS_MAX_WORKERS"] = env_value
+
+            # Act
+            with patch('src.config.logger') as mock_logger:
+                result = _apply_env_overrides(config)
+
+            # Assert
+            assert result["options"]["max_workers"] == 4
+            mock_logger.warning.assert_called_once()
+
     def test_apply_env_overrides_overrides_existing_config(self):
         """Test that environment variables override existing config values"""
         # Arrange
@@ -52,6 +52,11 @@ class TestInputSetHandler:
             self.replication_stats
         )
 
+    @staticmethod
+    def _source_listing(input_sets):
+        """Normalize source listings to the given input sets, keeping destination listings as returned"""
+        return lambda response: response if isinstance(response, list) else input_sets
+
     def test_replicate_input_sets_no_input_sets_found(self):
         """Test replicate_input_sets when no input sets exist for pipeline"""
         # Arrange
@@ -102,13 +107,13 @@ class TestInputSetHandler:
         ]
 
         # Mock destination client - input set doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
 
         # Mock successful creation
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
-            with patch('src.inputset_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
+            with patch('src.base_replicator.YAMLUtils.update_identifiers') as mock_yaml_update:
                 mock_yaml_update.return_value = "updated_yaml"
 
                 # Act
@@ -121,6 +126,33 @@ class TestInputSetHandler:
         assert self.replication_stats["input_sets"]["skipped"] == 0
         self.mock_dest_client.post.assert_called_once()
 
+    def test_replicate_input_sets_same_scope_forwards_raw_body(self):
+        """Test input sets replicated within one org/project are forwarded without decoding"""
+        # Arrange
+        self.config["destination"]["org"] = "source_org"
+        self.config["destination"]["project"] = "source_project"
+        handler = InputSetHandler(self.config, self.mock_source_client, self.mock_dest_client, self.replication_stats)
+        input_set_data = {"identifier": "test_input_set", "name": "Test Input Set"}
+        raw_body = b'{"input_set_yaml": "inputSet:\\n  orgIdentifier: source_org"}'
+        self.mock_source_client.get.return_value = {"data": {"content": [input_set_data]}}
+        self.mock_source_client.get_raw.return_value = raw_body
+        self.mock_dest_client.get.return_value = []
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
+            # Act
+            result = handler.replicate_input_sets("test_pipeline")
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["input_sets"]["success"] == 1
+        self.mock_source_client.get_raw.assert_called_once_with(
+            "/v1/orgs/source_org/projects/source_project/input-sets/test_input_set",
+            params={"pipeline": "test_pipeline"})
+        post_kwargs = self.mock_dest_client.post.call_args.kwargs
+        assert post_kwargs["data"] == raw_body
+        assert post_kwargs["json"] is None
+
     def test_replicate_input_sets_skip_existing(self):
         """Test input set replication skips existing input sets when update_existing is False"""
         # Arrange
@@ -139,9 +171,9 @@ class TestInputSetHandler:
         ]
 
         # Mock existing input set check (exists)
-        self.mock_dest_client.get.return_value = {"identifier": "test_input_set"}
+        self.mock_dest_client.get.return_value = [{"identifier": "test_input_set"}]
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
             # Act
             result = self.handler.replicate_input_sets(pipeline_id)
 
@@ -179,13 +211,13 @@ class TestInputSetHandler:
         ]
 
         # Mock existing input set check (exists)
-        self.mock_dest_client.get.return_value = {"identifier": "test_input_set"}
+        self.mock_dest_client.get.return_value = [{"identifier": "test_input_set"}]
 
         # Mock successful update
         self.mock_dest_client.put.return_value = {"status": "SUCCESS"}
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
-            with patch('src.inputset_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
+            with patch('src.base_replicator.YAMLUtils.update_identifiers') as mock_yaml_update:
                 mock_yaml_update.return_value = "updated_yaml"
 
                 # Act
@@ -215,13 +247,13 @@ class TestInputSetHandler:
         ]
 
         # Mock destination client - input set doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
 
         # Mock failed creation
         self.mock_dest_client.post.return_value = None
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
-            with patch('src.inputset_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
+            with patch('src.base_replicator.YAMLUtils.update_identifiers') as mock_yaml_update:
                 mock_yaml_update.return_value = "updated_yaml"
 
                 # Act
@@ -259,10 +291,10 @@ class TestInputSetHandler:
         ]
 
         # Mock destination client - input set doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
-            with patch('src.inputset_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
+            with patch('src.base_replicator.YAMLUtils.update_identifiers') as mock_yaml_update:
                 mock_yaml_update.return_value = "updated_yaml"
 
                 # Act
@@ -273,6 +305,8 @@ class TestInputSetHandler:
         assert self.replication_stats["input_sets"]["success"] == 1
         # Verify no actual API calls were made
         self.mock_dest_client.post.assert_not_called()
+        # Only the list is read from the source; details are not needed for a dry run
+        self.mock_source_client.get.assert_called_once()
         self.mock_dest_client.put.assert_not_called()
 
     def test_replicate_input_sets_missing_input_set_details(self):
@@ -292,7 +326,10 @@ class TestInputSetHandler:
             None
         ]
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
+        # Mock destination client - input set doesn't exist
+        self.mock_dest_client.get.return_value = []
+
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
             # Act
             result = self.handler.replicate_input_sets(pipeline_id)
 
@@ -319,12 +356,12 @@ class TestInputSetHandler:
         ]
 
         # Mock destination client - input set doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
 
         # Mock successful creation
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
             # Act
             result = self.handler.replicate_input_sets(pipeline_id)
 
@@ -354,23 +391,47 @@ class TestInputSetHandler:
         ]
 
         # Mock destination client - input sets don't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
 
         # Mock successful creation
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=input_set_data):
-            with patch('src.inputset_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing(input_set_data)):
+            with patch('src.base_replicator.YAMLUtils.update_identifiers') as mock_yaml_update:
                 mock_yaml_update.return_value = "updated_yaml"
-                with patch('src.inputset_handler.time.sleep'):  # Mock sleep to speed up test
-                    # Act
-                    result = self.handler.replicate_input_sets(pipeline_id)
+                # Act
+                result = self.handler.replicate_input_sets(pipeline_id)
 
         # Assert
         assert result is True
         assert self.replication_stats["input_sets"]["success"] == 2
         assert self.replication_stats["input_sets"]["failed"] == 0
         assert self.mock_dest_client.post.call_count == 2
+        # One destination listing answers the existence check for both input sets
+        self.mock_dest_client.get.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/input-sets",
+            params={"pipeline": pipeline_id, "page": 0, "limit": 100})
+        self.mock_dest_client.exists.assert_not_called()
+
+    def test_replicate_input_sets_probes_when_destination_listing_fails(self):
+        """Test input sets are probed individually when the destination listing fails"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        input_set_data = {"identifier": "test_input_set", "name": "Test Input Set"}
+        self.mock_source_client.get.return_value = {"data": {"content": [input_set_data]}}
+        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.exists.return_value = True
+
+        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
+            # Act
+            result = self.handler.replicate_input_sets(pipeline_id)
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["input_sets"]["skipped"] == 1
+        self.mock_dest_client.exists.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/input-sets/test_input_set",
+            params={"pipeline": pipeline_id})
 
     def test_replicate_input_sets_non_dict_details(self):
         """Test input set replication handles non-dict input set details"""
@@ -390,12 +451,12 @@ class TestInputSetHandler:
         ]
 
         # Mock destination client - input set doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
 
         # Mock successful creation
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[input_set_data]):
+        with patch.object(HarnessAPIClient, 'normalize_response', side_effect=self._source_listing([input_set_data])):
             # Act
             result = self.handler.replicate_input_sets(pipeline_id)
 
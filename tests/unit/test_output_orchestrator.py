@@ -319,6 +319,17 @@ class TestOutputOrchestrator:
         # JSON mode should not print individual messages immediately
         mock_print.assert_not_called()
 
+    @patch('src.output_orchestrator.json.dumps')
+    def test_json_output_methods_defer_serialization(self, mock_dumps):
+        """Test JSON mode collects messages without serializing each one"""
+        orchestrator = OutputOrchestrator(OutputType.JSON)
+
+        orchestrator.info("Info message")
+        orchestrator.warning("Warning message")
+
+        mock_dumps.assert_not_called()
+        assert [m["message"] for m in orchestrator.transformer.messages] == ["Info message", "Warning message"]
+
     @patch('builtins.print')
     def test_output_summary(self, mock_print):
         """Test summary output"""
@@ -375,6 +386,25 @@ class TestOutputOrchestrator:
         # Should have at least one handler (the orchestrator handler)
         assert len(logger.handlers) > 0 or len(logging.getLogger().handlers) > 0
 
+    def test_logging_records_keep_their_creation_time_and_category(self):
+        """Test log records are collected with the record's own timestamp and short logger name"""
+        # Arrange
+        orchestrator = OutputOrchestrator(OutputType.JSON)
+        logging.getLogger().setLevel(logging.INFO)
+        record = logging.LogRecord("src.pipeline_handler", logging.INFO, __file__, 1,
+                                   "Replicating %s", ("pipeline1",), None)
+        record.created = 1700000000.0
+
+        # Act
+        for handler in logging.getLogger().handlers:
+            handler.handle(record)
+
+        # Assert
+        message = orchestrator.transformer.messages[-1]
+        assert message["message"] == "Replicating pipeline1"
+        assert message["category"] == "pipeline_handler"
+        assert message["timestamp"] == datetime.fromtimestamp(1700000000.0).isoformat()
+
 
 class TestGlobalFunctions:
     """Test suite for global orchestrator functions"""
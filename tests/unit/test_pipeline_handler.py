@@ -4,7 +4,10 @@ Comprehensive unit tests for PipelineHandler
 Tests pipeline replication functionality with proper mocking and AAA methodology.
 """
 
-from unittest.mock import Mock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, call, patch
+
+import pytest
 
 from src.pipeline_handler import PipelineHandler
 from src.api_client import HarnessAPIClient
@@ -129,6 +132,116 @@ class TestPipelineHandler:
         assert self.replication_stats["pipelines"]["failed"] == 1
         assert self.replication_stats["pipelines"]["success"] == 0
 
+    def test_replicate_pipelines_replicates_concurrently(self):
+        """Test definitions are prefetched and each pipeline is replicated on the worker pool"""
+        # Arrange
+        self.config["options"]["max_workers"] = 3
+        self.config["pipelines"] = [
+            {"identifier": f"pipeline{i}", "name": f"Pipeline {i}"} for i in range(1, 4)
+        ]
+        self.mock_source_client.get.side_effect = lambda endpoint: {
+            "pipeline_yaml": f"pipeline:\n  identifier: {endpoint.rsplit('/', 1)[-1]}"
+        }
+        self.mock_dest_client.get.return_value = []
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        with patch('src.pipeline_handler.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            # Act
+            result = self.handler.replicate_pipelines(
+                self.mock_template_handler,
+                self.mock_inputset_handler,
+                self.mock_trigger_handler
+            )
+
+        # Assert
+        assert result is True
+        assert mock_executor.call_args_list == [call(max_workers=3), call(max_workers=3)]
+        assert self.mock_source_client.get.call_count == 3
+        assert self.replication_stats["pipelines"]["success"] == 3
+        posted_yaml = [call.kwargs["json"]["pipeline_yaml"] for call in self.mock_dest_client.post.call_args_list]
+        assert sorted(yaml.split("\n")[1] for yaml in posted_yaml) == [f"  identifier: pipeline{i}" for i in range(1, 4)]
+        replicated = [call.args[0] for call in self.mock_inputset_handler.replicate_input_sets.call_args_list]
+        assert sorted(replicated) == ["pipeline1", "pipeline2", "pipeline3"]
+
+    def test_replicate_pipelines_merges_outcomes_of_finished_pipelines_on_error(self):
+        """Test outcomes of pipelines that finished are recorded even if another one raises"""
+        # Arrange
+        self.config["options"]["max_workers"] = 1
+        self.config["pipelines"] = [{"identifier": "pipeline1"}, {"identifier": "pipeline2"}]
+        self.mock_source_client.get.return_value = {"pipeline_yaml": "pipeline:\n  identifier: pipeline1"}
+
+        # Act
+        with patch.object(self.handler, '_replicate_pipeline', side_effect=["skipped", RuntimeError("boom")]):
+            with pytest.raises(RuntimeError):
+                self.handler.replicate_pipelines(
+                    self.mock_template_handler,
+                    self.mock_inputset_handler,
+                    self.mock_trigger_handler
+                )
+
+        # Assert
+        assert self.replication_stats["pipelines"] == {"success": 0, "failed": 0, "skipped": 1}
+        assert self.handler._prefetch_executor is None
+
+    def test_replicate_pipelines_uses_prefetched_details(self):
+        """Test pipeline definitions prefetched during setup are not fetched again"""
+        # Arrange
+        self.mock_source_client.get.return_value = {"pipeline_yaml": "pipeline:\n  identifier: pipeline1"}
+        self.mock_dest_client.get.return_value = []
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        # Act
+        self.handler.prefetch_pipeline_details()
+        result = self.handler.replicate_pipelines(
+            self.mock_template_handler,
+            self.mock_inputset_handler,
+            self.mock_trigger_handler
+        )
+
+        # Assert
+        assert result is True
+        self.mock_source_client.get.assert_called_once()
+        assert self.replication_stats["pipelines"]["success"] == 1
+        assert self.handler._prefetch_executor is None
+
+    def test_prefetch_pipeline_details_does_not_restart_running_prefetch(self):
+        """Test a second prefetch call keeps the running prefetch instead of fetching again"""
+        # Arrange
+        self.mock_source_client.get.return_value = {"pipeline_yaml": "pipeline:\n  identifier: pipeline1"}
+        self.handler.prefetch_pipeline_details()
+        executor = self.handler._prefetch_executor
+
+        # Act
+        self.handler.prefetch_pipeline_details()
+        executor_after_second_call = self.handler._prefetch_executor
+        details = self.handler._get_pipeline_details({"identifier": "pipeline1"})
+        self.handler.cancel_prefetch()
+
+        # Assert
+        assert executor_after_second_call is executor
+        assert details == {"pipeline_yaml": "pipeline:\n  identifier: pipeline1"}
+        self.mock_source_client.get.assert_called_once()
+
+    def test_prefetch_pipeline_details_fetches_bounded_window_ahead(self):
+        """Test only a few definitions per worker are prefetched, refilled as they are used"""
+        # Arrange
+        self.config["options"]["max_workers"] = 1
+        self.config["pipelines"] = [{"identifier": f"pipeline{i}"} for i in range(5)]
+        self.mock_source_client.get.side_effect = lambda endpoint: {"endpoint": endpoint}
+
+        # Act
+        self.handler.prefetch_pipeline_details()
+        initially_prefetched = sorted(self.handler._prefetched_details)
+        details = self.handler._get_pipeline_details({"identifier": "pipeline0"})
+        prefetched_after_use = sorted(self.handler._prefetched_details)
+        self.handler.cancel_prefetch()
+
+        # Assert
+        assert initially_prefetched == ["pipeline0", "pipeline1"]
+        assert details == {"endpoint": "/v1/orgs/source_org/projects/source_project/pipelines/pipeline0"}
+        assert prefetched_after_use == ["pipeline1", "pipeline2"]
+        assert not self.handler._prefetch_pending
+
     def test_replicate_pipelines_successful_creation(self):
         """Test successful pipeline replication"""
         # Arrange
@@ -138,7 +251,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipeline doesn't exist
+        self.mock_dest_client.get.return_value = []  # Pipeline doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
@@ -167,6 +280,28 @@ class TestPipelineHandler:
         self.mock_inputset_handler.replicate_input_sets.assert_called_once_with("pipeline1")
         self.mock_trigger_handler.replicate_triggers.assert_called_once_with("pipeline1")
 
+    def test_replicate_pipelines_sends_rewritten_yaml_without_changing_source_details(self):
+        """Test the rewritten YAML is sent while the fetched source details stay unchanged"""
+        # Arrange
+        source_yaml = "pipeline:\n  name: Pipeline 1\n  orgIdentifier: source_org"
+        pipeline_details = {"pipeline_yaml": source_yaml, "git_details": {"branch": "main"}}
+        self.mock_source_client.get.return_value = pipeline_details
+        self.mock_dest_client.get.return_value = []
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        # Act
+        with patch('src.pipeline_handler.YAMLUtils.update_identifiers', return_value="updated_yaml"):
+            self.handler.replicate_pipelines(
+                self.mock_template_handler,
+                self.mock_inputset_handler,
+                self.mock_trigger_handler
+            )
+
+        # Assert
+        payload = self.mock_dest_client.post.call_args.kwargs["json"]
+        assert payload == {"pipeline_yaml": "updated_yaml", "git_details": {"branch": "main"}}
+        assert pipeline_details["pipeline_yaml"] == source_yaml
+
     def test_replicate_pipelines_skip_existing(self):
         """Test pipeline replication skips existing pipelines when update_existing is False"""
         # Arrange
@@ -176,7 +311,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = {"identifier": "pipeline1"}  # Pipeline exists
+        self.mock_dest_client.get.return_value = [{"identifier": "pipeline1"}]  # Pipeline exists
 
         # Mock template handler
         self.mock_template_handler.extract_template_refs.return_value = []
@@ -216,7 +351,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = {"identifier": "pipeline1"}  # Pipeline exists
+        self.mock_dest_client.get.return_value = [{"identifier": "pipeline1"}]  # Pipeline exists
         self.mock_dest_client.put.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
@@ -254,7 +389,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipeline doesn't exist
+        self.mock_dest_client.get.return_value = []  # Pipeline doesn't exist
         self.mock_dest_client.post.return_value = None  # Creation fails
 
         # Mock template handler
@@ -296,7 +431,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipeline doesn't exist
+        self.mock_dest_client.get.return_value = []  # Pipeline doesn't exist
 
         # Mock template handler
         self.mock_template_handler.extract_template_refs.return_value = []
@@ -322,6 +457,7 @@ class TestPipelineHandler:
         # Verify no actual API calls were made
         self.mock_dest_client.post.assert_not_called()
         self.mock_dest_client.put.assert_not_called()
+        mock_yaml_update.assert_not_called()
         # Should still replicate input sets and triggers in dry run
         self.mock_inputset_handler.replicate_input_sets.assert_called_once_with("pipeline1")
         self.mock_trigger_handler.replicate_triggers.assert_called_once_with("pipeline1")
@@ -335,11 +471,12 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipeline doesn't exist
+        self.mock_dest_client.get.return_value = []  # Pipeline doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler with templates
         template_refs = [("my-template", "v1")]
+        self.mock_template_handler.check_templates_exist.return_value = [False]
         self.mock_template_handler.handle_missing_templates.return_value = True
 
         # Mock other handlers
@@ -362,7 +499,7 @@ class TestPipelineHandler:
         assert result is True
         assert self.replication_stats["pipelines"]["success"] == 1
         mock_extract.assert_called_once()
-        self.mock_template_handler.handle_missing_templates.assert_called_once_with(template_refs, "Pipeline 1")
+        self.mock_template_handler.handle_missing_templates.assert_called_once_with(template_refs, "Pipeline 1", [False])
 
     def test_replicate_pipelines_template_handling_fails(self):
         """Test pipeline replication when template handling fails"""
@@ -376,6 +513,7 @@ class TestPipelineHandler:
 
         # Mock template handler failure
         template_refs = [("my-template", "v1")]
+        self.mock_template_handler.check_templates_exist.return_value = [False]
         self.mock_template_handler.handle_missing_templates.return_value = False  # Template handling fails
 
         with patch('src.pipeline_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
@@ -414,7 +552,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipeline doesn't exist
+        self.mock_dest_client.get.return_value = []  # Pipeline doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
@@ -459,7 +597,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipeline doesn't exist
+        self.mock_dest_client.get.return_value = []  # Pipeline doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
@@ -507,7 +645,7 @@ class TestPipelineHandler:
 
         # Mock API responses
         self.mock_source_client.get.return_value = pipeline_details
-        self.mock_dest_client.get.return_value = None  # Pipelines don't exist
+        self.mock_dest_client.get.return_value = []  # Pipelines don't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
@@ -535,6 +673,75 @@ class TestPipelineHandler:
         assert self.mock_inputset_handler.replicate_input_sets.call_count == 2
         assert self.mock_trigger_handler.replicate_triggers.call_count == 2
 
+    def test_replicate_pipelines_replicates_repeated_pipeline_once(self):
+        """Test a pipeline selected twice is fetched and replicated once"""
+        # Arrange
+        self.config["pipelines"].append({"identifier": "pipeline1", "name": "Pipeline 1"})
+        self.mock_source_client.get.return_value = {"pipeline_yaml": "pipeline:\n  name: Pipeline 1"}
+        self.mock_dest_client.get.return_value = []
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        # Act
+        result = self.handler.replicate_pipelines(
+            self.mock_template_handler,
+            self.mock_inputset_handler,
+            self.mock_trigger_handler
+        )
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["pipelines"]["success"] == 1
+        self.mock_source_client.get.assert_called_once()
+        self.mock_dest_client.post.assert_called_once()
+
+    def test_pipeline_exists_lists_destination_once(self):
+        """Test that existence checks are answered from a single destination listing"""
+        # Arrange
+        self.config["pipelines"].append({"identifier": "pipeline2", "name": "Pipeline 2"})
+        self.mock_dest_client.get.return_value = [{"identifier": "pipeline1"}]
+
+        # Act
+        results = [self.handler._pipeline_exists("pipeline1"), self.handler._pipeline_exists("pipeline2")]
+
+        # Assert
+        assert results == [True, False]
+        self.mock_dest_client.get.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/pipelines", params={"page": 0, "limit": 100})
+        self.mock_dest_client.exists.assert_not_called()
+
+    def test_pipeline_exists_stops_listing_once_selected_pipelines_found(self):
+        """Test that the destination listing stops once every selected pipeline was found"""
+        # Arrange
+        page = [{"identifier": f"other{i}"} for i in range(99)] + [{"identifier": "pipeline1"}]
+        self.mock_dest_client.get.return_value = page
+        self.mock_dest_client.exists.return_value = False
+
+        # Act
+        selected_exists = self.handler._pipeline_exists("pipeline1")
+        unselected_exists = self.handler._pipeline_exists("other0")
+
+        # Assert
+        assert selected_exists is True
+        assert unselected_exists is False
+        self.mock_dest_client.get.assert_called_once()
+        assert self.handler._destination_pipeline_ids == {"pipeline1"}
+        self.mock_dest_client.exists.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/pipelines/other0")
+
+    def test_pipeline_exists_probes_when_listing_fails(self):
+        """Test that pipelines are probed individually when the listing fails"""
+        # Arrange
+        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.exists.return_value = True
+
+        # Act
+        result = self.handler._pipeline_exists("pipeline1")
+
+        # Assert
+        assert result is True
+        self.mock_dest_client.exists.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/pipelines/pipeline1")
+
     def test_replicate_pipelines_non_dict_pipeline_details(self):
         """Test pipeline replication with non-dict pipeline details"""
         # Arrange
@@ -555,6 +762,28 @@ class TestPipelineHandler:
         self.mock_dest_client.get.assert_not_called()
         self.mock_dest_client.post.assert_not_called()
 
+    def test_replicate_pipelines_existing_pipeline_skips_template_handling(self):
+        """Test templates of a pipeline that already exists and is not updated are left alone"""
+        # Arrange
+        self.mock_source_client.get.return_value = {
+            "pipeline_yaml": "pipeline:\n  stages:\n    - stage:\n        template:\n          templateRef: my-template"
+        }
+        self.mock_dest_client.get.return_value = [{"identifier": "pipeline1"}]
+
+        # Act
+        result = self.handler.replicate_pipelines(
+            self.mock_template_handler,
+            self.mock_inputset_handler,
+            self.mock_trigger_handler
+        )
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["pipelines"]["skipped"] == 1
+        self.mock_template_handler.check_templates_exist.assert_not_called()
+        self.mock_template_handler.handle_missing_templates.assert_not_called()
+        self.mock_inputset_handler.replicate_input_sets.assert_called_once_with("pipeline1")
+
     def test_replicate_pipelines_with_templates_already_exist(self):
         """Test pipeline replication when templates already exist"""
         # Arrange
@@ -565,12 +794,12 @@ class TestPipelineHandler:
         self.mock_source_client.get.return_value = pipeline_details
 
         # Mock destination client - pipeline doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
         template_refs = [("existing-template", "v1")]
-        self.mock_template_handler.check_template_exists.return_value = True
+        self.mock_template_handler.check_templates_exist.return_value = [True]
         self.mock_template_handler.handle_missing_templates.return_value = True
 
         # Mock other handlers
@@ -593,8 +822,9 @@ class TestPipelineHandler:
         assert self.replication_stats["pipelines"]["success"] == 1
         assert self.replication_stats["templates"]["skipped"] == 1
 
-        # Verify template existence was checked
-        self.mock_template_handler.check_template_exists.assert_called_once_with("existing-template", "v1")
+        # Verify destination templates were listed before existence was checked
+        self.mock_template_handler.load_destination_templates.assert_called_once()
+        self.mock_template_handler.check_templates_exist.assert_called_once_with(template_refs)
 
     def test_replicate_pipelines_empty_yaml_content(self):
         """Test pipeline replication with empty YAML content"""
@@ -606,7 +836,7 @@ class TestPipelineHandler:
         self.mock_source_client.get.return_value = pipeline_details
 
         # Mock destination client - pipeline doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
@@ -643,7 +873,7 @@ class TestPipelineHandler:
         self.mock_source_client.get.return_value = pipeline_details
 
         # Mock destination client - pipeline doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.get.return_value = []
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Mock template handler
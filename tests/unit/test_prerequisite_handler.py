@@ -4,7 +4,8 @@ Comprehensive unit tests for PrerequisiteHandler
 Tests organization and project creation functionality with proper mocking and AAA methodology.
 """
 
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import Mock, call, patch
 
 from src.prerequisite_handler import PrerequisiteHandler
 from src.api_client import HarnessAPIClient
@@ -47,31 +48,54 @@ class TestPrerequisiteHandler:
             self.replication_stats
         )
 
+    @staticmethod
+    def _exists_by_endpoint(existing):
+        """Build an exists() side effect that answers by endpoint, independent of call order"""
+        return lambda endpoint, params=None: endpoint in existing
+
+    def test_verify_prerequisites_probes_org_and_project_concurrently(self):
+        """Test verify_prerequisites issues org and project lookups from worker threads"""
+        # Arrange
+        callers = []
+
+        def record_caller(endpoint, params=None):
+            callers.append(threading.current_thread())
+            return True
+
+        self.mock_dest_client.exists.side_effect = record_caller
+
+        # Act
+        result = self.handler.verify_prerequisites()
+
+        # Assert
+        assert result is True
+        assert self.mock_dest_client.exists.call_count == 2
+        assert threading.main_thread() not in callers
+
     def test_verify_prerequisites_both_exist(self):
         """Test verify_prerequisites when both org and project exist"""
         # Arrange
-        # Mock org exists
-        self.mock_dest_client.get.side_effect = [
-            {"identifier": "dest_org"},  # Org exists
-            {"identifier": "dest_project"}  # Project exists
-        ]
+        # Mock org and project exist (probed concurrently, so answer by endpoint)
+        self.mock_dest_client.exists.side_effect = self._exists_by_endpoint({
+            "/v1/orgs/dest_org",
+            "/v1/orgs/dest_org/projects/dest_project"
+        })
 
         # Act
         result = self.handler.verify_prerequisites()
 
         # Assert
         assert result is True
-        assert self.mock_dest_client.get.call_count == 2
+        assert self.mock_dest_client.exists.call_count == 2
+        self.mock_dest_client.get.assert_not_called()
         self.mock_dest_client.post.assert_not_called()
 
     def test_verify_prerequisites_org_creation_fails(self):
         """Test verify_prerequisites when org creation fails"""
         # Arrange
-        # Mock org doesn't exist
-        self.mock_dest_client.get.side_effect = [
-            None,  # Org doesn't exist
-            None,  # Org list check returns None
-        ]
+        # Mock org doesn't exist and org list check returns None
+        self.mock_dest_client.exists.side_effect = self._exists_by_endpoint(set())
+        self.mock_dest_client.get.return_value = None
         # Mock org creation fails
         self.mock_dest_client.post.return_value = None
 
@@ -86,12 +110,9 @@ class TestPrerequisiteHandler:
     def test_verify_prerequisites_project_creation_fails(self):
         """Test verify_prerequisites when project creation fails"""
         # Arrange
-        # Mock org exists, project doesn't
-        self.mock_dest_client.get.side_effect = [
-            {"identifier": "dest_org"},  # Org exists
-            None,  # Project doesn't exist
-            None   # Project list check returns None
-        ]
+        # Mock org exists, project doesn't and project list check returns None
+        self.mock_dest_client.exists.side_effect = self._exists_by_endpoint({"/v1/orgs/dest_org"})
+        self.mock_dest_client.get.return_value = None
         # Mock project creation fails
         self.mock_dest_client.post.return_value = None
 
@@ -106,22 +127,20 @@ class TestPrerequisiteHandler:
     def test_create_org_if_missing_org_exists(self):
         """Test _create_org_if_missing when org already exists"""
         # Arrange
-        self.mock_dest_client.get.return_value = {"identifier": "dest_org"}
+        self.mock_dest_client.exists.return_value = True
 
         # Act
         result = self.handler._create_org_if_missing()
 
         # Assert
         assert result is True
-        self.mock_dest_client.get.assert_called_once_with("/v1/orgs/dest_org")
+        self.mock_dest_client.exists.assert_called_once_with("/v1/orgs/dest_org")
         self.mock_dest_client.post.assert_not_called()
 
     def test_create_org_if_missing_successful_creation(self):
         """Test _create_org_if_missing with successful org creation"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Org doesn't exist
-        ]
+        self.mock_dest_client.exists.return_value = False  # Org doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Act
@@ -138,33 +157,24 @@ class TestPrerequisiteHandler:
     def test_create_org_if_missing_creation_fails_but_exists_concurrently(self):
         """Test _create_org_if_missing when creation fails but org exists due to race condition"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Org doesn't exist initially
-        ]
+        # Org doesn't exist initially, but is found after creation fails
+        self.mock_dest_client.exists.side_effect = [False, True]
         self.mock_dest_client.post.return_value = None  # Creation fails
 
-        # Mock the list check to find the org
-        orgs_list_response = {"data": {"content": [{"identifier": "dest_org"}]}}
-        self.mock_dest_client.get.side_effect = [
-            None,  # Initial check - org doesn't exist
-            orgs_list_response  # List check - org found
-        ]
-
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[{"identifier": "dest_org"}]):
-            # Act
-            result = self.handler._create_org_if_missing()
+        # Act
+        result = self.handler._create_org_if_missing()
 
         # Assert
         assert result is True
         self.mock_dest_client.post.assert_called_once()
+        assert self.mock_dest_client.exists.call_args_list == [call("/v1/orgs/dest_org"), call("/v1/orgs/dest_org")]
+        self.mock_dest_client.get.assert_not_called()
 
     def test_create_org_if_missing_creation_fails_completely(self):
         """Test _create_org_if_missing when creation fails and org doesn't exist"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Org doesn't exist initially
-            None   # List check also returns None
-        ]
+        self.mock_dest_client.exists.return_value = False
+        self.mock_dest_client.get.return_value = None  # List check also returns None
         self.mock_dest_client.post.return_value = None  # Creation fails
 
         with patch.object(HarnessAPIClient, 'normalize_response', return_value=[]):
@@ -178,22 +188,20 @@ class TestPrerequisiteHandler:
     def test_create_project_if_missing_project_exists(self):
         """Test _create_project_if_missing when project already exists"""
         # Arrange
-        self.mock_dest_client.get.return_value = {"identifier": "dest_project"}
+        self.mock_dest_client.exists.return_value = True
 
         # Act
         result = self.handler._create_project_if_missing()
 
         # Assert
         assert result is True
-        self.mock_dest_client.get.assert_called_once_with("/v1/orgs/dest_org/projects/dest_project")
+        self.mock_dest_client.exists.assert_called_once_with("/v1/orgs/dest_org/projects/dest_project")
         self.mock_dest_client.post.assert_not_called()
 
     def test_create_project_if_missing_successful_creation(self):
         """Test _create_project_if_missing with successful project creation"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Project doesn't exist
-        ]
+        self.mock_dest_client.exists.return_value = False  # Project doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Act
@@ -211,33 +219,24 @@ class TestPrerequisiteHandler:
     def test_create_project_if_missing_creation_fails_but_exists_concurrently(self):
         """Test _create_project_if_missing when creation fails but project exists due to race condition"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Project doesn't exist initially
-        ]
+        # Project doesn't exist initially, but is found after creation fails
+        self.mock_dest_client.exists.side_effect = [False, True]
         self.mock_dest_client.post.return_value = None  # Creation fails
 
-        # Mock the list check to find the project
-        projects_list_response = {"data": {"content": [{"identifier": "dest_project"}]}}
-        self.mock_dest_client.get.side_effect = [
-            None,  # Initial check - project doesn't exist
-            projects_list_response  # List check - project found
-        ]
-
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[{"identifier": "dest_project"}]):
-            # Act
-            result = self.handler._create_project_if_missing()
+        # Act
+        result = self.handler._create_project_if_missing()
 
         # Assert
         assert result is True
         self.mock_dest_client.post.assert_called_once()
+        assert self.mock_dest_client.exists.call_args_list == [call("/v1/orgs/dest_org/projects/dest_project"), call("/v1/orgs/dest_org/projects/dest_project")]
+        self.mock_dest_client.get.assert_not_called()
 
     def test_create_project_if_missing_creation_fails_completely(self):
         """Test _create_project_if_missing when creation fails and project doesn't exist"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Project doesn't exist initially
-            None   # List check also returns None
-        ]
+        self.mock_dest_client.exists.return_value = False
+        self.mock_dest_client.get.return_value = None  # List check also returns None
         self.mock_dest_client.post.return_value = None  # Creation fails
 
         with patch.object(HarnessAPIClient, 'normalize_response', return_value=[]):
@@ -251,10 +250,9 @@ class TestPrerequisiteHandler:
     def test_verify_prerequisites_creates_both_org_and_project(self):
         """Test verify_prerequisites creates both org and project when neither exist"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Org doesn't exist
-            None,  # Project doesn't exist
-        ]
+        # Neither org nor project exist
+        self.mock_dest_client.exists.side_effect = self._exists_by_endpoint(set())
+        self.mock_dest_client.get.return_value = None
         self.mock_dest_client.post.side_effect = [
             {"status": "SUCCESS"},  # Org creation succeeds
             {"status": "SUCCESS"}   # Project creation succeeds
@@ -287,7 +285,7 @@ class TestPrerequisiteHandler:
             self.replication_stats
         )
 
-        self.mock_dest_client.get.return_value = None  # Org doesn't exist
+        self.mock_dest_client.exists.return_value = False  # Org doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Act
@@ -309,7 +307,7 @@ class TestPrerequisiteHandler:
             self.replication_stats
         )
 
-        self.mock_dest_client.get.return_value = None  # Project doesn't exist
+        self.mock_dest_client.exists.return_value = False  # Project doesn't exist
         self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
 
         # Act
@@ -320,34 +318,28 @@ class TestPrerequisiteHandler:
         call_args = self.mock_dest_client.post.call_args
         assert call_args[1]['json']['project']['name'] == 'My Test Project'
 
-    def test_create_org_if_missing_race_condition_not_found_in_list(self):
-        """Test _create_org_if_missing when creation fails and org not found in concurrent list"""
+    def test_create_org_if_missing_race_condition_not_found(self):
+        """Test _create_org_if_missing when creation fails and the org is still not found"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Org doesn't exist initially
-            {"data": {"content": []}}  # List check - empty list
-        ]
+        self.mock_dest_client.exists.return_value = False
         self.mock_dest_client.post.return_value = None  # Creation fails
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[]):
-            # Act
-            result = self.handler._create_org_if_missing()
+        # Act
+        result = self.handler._create_org_if_missing()
 
         # Assert
         assert result is False
+        assert self.mock_dest_client.exists.call_count == 2
 
-    def test_create_project_if_missing_race_condition_not_found_in_list(self):
-        """Test _create_project_if_missing when creation fails and project not found in concurrent list"""
+    def test_create_project_if_missing_race_condition_not_found(self):
+        """Test _create_project_if_missing when creation fails and the project is still not found"""
         # Arrange
-        self.mock_dest_client.get.side_effect = [
-            None,  # Project doesn't exist initially
-            {"data": {"content": []}}  # List check - empty list
-        ]
+        self.mock_dest_client.exists.return_value = False
         self.mock_dest_client.post.return_value = None  # Creation fails
 
-        with patch.object(HarnessAPIClient, 'normalize_response', return_value=[]):
-            # Act
-            result = self.handler._create_project_if_missing()
+        # Act
+        result = self.handler._create_project_if_missing()
 
         # Assert
         assert result is False
+        assert self.mock_dest_client.exists.call_count == 2
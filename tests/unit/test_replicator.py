@@ -7,7 +7,7 @@ Tests replication functionality with proper mocking and AAA methodology.
 import pytest
 from unittest.mock import patch
 
-from src.api_client import HarnessAPIClient
+from src.api_client import HarnessAPIClient, HarnessAuthenticationError
 from src.replicator import HarnessReplicator
 
 
@@ -59,35 +59,97 @@ class TestHarnessReplicator:
             "triggers": {"success": 0, "failed": 0, "skipped": 0}
         }
 
+    def test_init_applies_rate_limit_option(self):
+        """Test that the rate_limit_rps option is passed to both API clients"""
+        # Arrange
+        self.config["options"] = {"rate_limit_rps": 7}
+
+        # Act
+        with patch('src.replicator.HarnessAPIClient') as mock_client:
+            HarnessReplicator(self.config)
+
+        # Assert
+        assert mock_client.call_count == 2
+        for call in mock_client.call_args_list:
+            assert call.kwargs["rate_limit"] == 7
+
+    def test_init_shares_one_client_per_instance_across_handlers(self):
+        """Test every handler reuses the same two clients, whose sessions share pooled connections"""
+        # Arrange & Act
+        replicator = HarnessReplicator(self.config)
+
+        # Assert
+        handlers = [replicator.prerequisite_handler, replicator.template_handler,
+                    replicator.inputset_handler, replicator.trigger_handler, replicator.pipeline_handler]
+        for handler in handlers:
+            assert handler.source_client is replicator.source_client
+            assert handler.dest_client is replicator.dest_client
+        assert replicator.source_client.session is not replicator.dest_client.session
+        source_adapter = replicator.source_client.session.get_adapter("https://app.harness.io")
+        dest_adapter = replicator.dest_client.session.get_adapter("https://app3.harness.io")
+        assert source_adapter is dest_adapter
+
+    def test_init_shares_run_id_across_handlers(self):
+        """Test the handlers of one replicator share its run_id, and another replicator gets a new one"""
+        # Arrange & Act
+        replicator = HarnessReplicator(self.config)
+        other = HarnessReplicator(self.config)
+
+        # Assert
+        handlers = [replicator.prerequisite_handler, replicator.template_handler,
+                    replicator.inputset_handler, replicator.trigger_handler, replicator.pipeline_handler]
+        assert {handler.run_id for handler in handlers} == {replicator.run_id}
+        assert replicator.run_id != other.run_id
+
     def test_run_replication_success(self):
         """Test successful replication run"""
         # Arrange
-        with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites', return_value=True):
-            with patch.object(self.replicator.pipeline_handler, 'replicate_pipelines', return_value=True):
-                with patch.object(self.replicator, 'print_summary'):
-                    # Act
-                    result = self.replicator.run_replication()
+        with patch.object(self.replicator.pipeline_handler, 'prefetch_pipeline_details') as mock_prefetch:
+            with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites', return_value=True):
+                with patch.object(self.replicator.pipeline_handler, 'replicate_pipelines', return_value=True):
+                    with patch.object(self.replicator, 'print_summary'):
+                        # Act
+                        result = self.replicator.run_replication()
 
         # Assert
         assert result is True
+        mock_prefetch.assert_called_once()
 
     def test_run_replication_prerequisites_fail(self):
-        """Test replication fails when prerequisites fail"""
+        """Test replication fails when prerequisites fail and prefetched pipelines are dropped"""
         # Arrange
-        with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites', return_value=False):
-            # Act
-            result = self.replicator.run_replication()
+        with patch.object(self.replicator.pipeline_handler, 'prefetch_pipeline_details'):
+            with patch.object(self.replicator.pipeline_handler, 'cancel_prefetch') as mock_cancel:
+                with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites', return_value=False):
+                    # Act
+                    result = self.replicator.run_replication()
 
         # Assert
         assert result is False
+        mock_cancel.assert_called_once()
+
+    def test_run_replication_prerequisites_raise_cancels_prefetch(self):
+        """Test prefetched pipelines are dropped when verifying prerequisites raises"""
+        # Arrange
+        error = HarnessAuthenticationError("Unauthorized", "https://app3.harness.io")
+        with patch.object(self.replicator.pipeline_handler, 'prefetch_pipeline_details'):
+            with patch.object(self.replicator.pipeline_handler, 'cancel_prefetch') as mock_cancel:
+                with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites',
+                                  side_effect=error):
+                    # Act & Assert
+                    with pytest.raises(HarnessAuthenticationError):
+                        self.replicator.run_replication()
+
+        mock_cancel.assert_called_once()
 
     def test_run_replication_pipelines_fail(self):
         """Test replication fails when pipeline replication fails"""
         # Arrange
-        with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites', return_value=True):
-            with patch.object(self.replicator.pipeline_handler, 'replicate_pipelines', return_value=False):
-                # Act
-                result = self.replicator.run_replication()
+        with patch.object(self.replicator.pipeline_handler, 'prefetch_pipeline_details'):
+            with patch.object(self.replicator.prerequisite_handler, 'verify_prerequisites', return_value=True):
+                with patch.object(self.replicator.pipeline_handler, 'replicate_pipelines', return_value=False):
+                    # Act
+                    result = self.replicator.run_replication()
 
         # Assert
         assert result is False
@@ -4,6 +4,9 @@ Comprehensive unit tests for TemplateHandler
 Tests template replication functionality with proper mocking and AAA methodology.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 from src.template_handler import TemplateHandler
@@ -58,34 +61,223 @@ class TestTemplateHandler:
         # Arrange
         template_ref = "my-template"
         version_label = "v1"
-        self.mock_dest_client.get.return_value = {"identifier": template_ref}
+        self.mock_dest_client.exists.return_value = True
 
         # Act
         result = self.handler.check_template_exists(template_ref, version_label)
 
         # Assert
         assert result is True
-        self.mock_dest_client.get.assert_called_once()
+        self.mock_dest_client.exists.assert_called_once()
+
+    def test_check_template_exists_caches_result(self):
+        """Test check_template_exists only queries the destination once per template version"""
+        # Arrange
+        self.mock_dest_client.exists.return_value = False
+
+        # Act
+        first = self.handler.check_template_exists("my-template", "v1")
+        second = self.handler.check_template_exists("my-template", "v1")
+        other_version = self.handler.check_template_exists("my-template", "v2")
+
+        # Assert
+        assert first is False
+        assert second is False
+        assert other_version is False
+        assert self.mock_dest_client.exists.call_count == 2
+
+    def test_check_template_exists_shares_concurrent_lookup(self):
+        """Test concurrent checks of the same template version send one request"""
+        # Arrange
+        release = threading.Event()
+
+        def slow_exists(endpoint):
+            release.wait(timeout=5)
+            return True
+
+        self.mock_dest_client.exists.side_effect = slow_exists
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(self.handler.check_template_exists, "my-template", "v1")
+            while not self.handler._pending_checks:
+                time.sleep(0.001)
+            second = executor.submit(self.handler.check_template_exists, "my-template", "v1")
+            release.set()
+            results = [first.result(), second.result()]
+
+        # Assert
+        assert results == [True, True]
+        self.mock_dest_client.exists.assert_called_once()
+        assert not self.handler._pending_checks
+
+    def test_replicate_template_marks_template_as_existing(self):
+        """Test a successfully replicated template is reported as existing without another lookup"""
+        # Arrange
+        self.mock_dest_client.exists.return_value = False
+        self.mock_source_client.get.return_value = {
+            "template": {"yaml": "template:\n  name: My Template"}
+        }
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+        assert self.handler.check_template_exists("my-template", "v1") is False
+
+        self.handler.replicate_template("my-template", "v1")
+
+        # Act
+        result = self.handler.check_template_exists("my-template", "v1")
+
+        # Assert
+        assert result is True
+        self.mock_dest_client.exists.assert_called_once()
+
+    def test_load_destination_templates_primes_existence_checks(self):
+        """Test templates listed in the destination are reported as existing without a lookup"""
+        # Arrange
+        self.mock_dest_client.get.return_value = {"content": [
+            {"identifier": "stable-template", "version_label": "v1", "stable_template": True},
+            {"identifier": "stable-template", "version_label": "v2", "stable_template": False},
+        ]}
+        self.handler.load_destination_templates()
+        self.mock_dest_client.get.reset_mock()
+
+        # Act
+        v1 = self.handler.check_template_exists("stable-template", "v1")
+        v2 = self.handler.check_template_exists("stable-template", "v2")
+        stable = self.handler.check_template_exists("stable-template", None)
+
+        # Assert
+        assert v1 is True
+        assert v2 is True
+        assert stable is True
+        self.mock_dest_client.exists.assert_not_called()
+
+    def test_load_destination_templates_accepts_camel_case_fields(self):
+        """Test listings using versionLabel/stableTemplate field names also prime existence checks"""
+        # Arrange
+        self.mock_dest_client.get.return_value = {"content": [
+            {"identifier": "camel-template", "versionLabel": "v1", "stableTemplate": True},
+        ]}
+        self.handler.load_destination_templates()
+
+        # Act
+        v1 = self.handler.check_template_exists("camel-template", "v1")
+        stable = self.handler.check_template_exists("camel-template", None)
+
+        # Assert
+        assert v1 is True
+        assert stable is True
+        self.mock_dest_client.exists.assert_not_called()
+
+    def test_load_destination_templates_lists_once(self):
+        """Test the destination template listing is only requested once per run"""
+        # Arrange
+        self.mock_dest_client.get.return_value = {"content": []}
+
+        # Act
+        self.handler.load_destination_templates()
+        self.handler.load_destination_templates()
+
+        # Assert
+        self.mock_dest_client.get.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/templates",
+            params={"type": "ALL", "page": 0, "limit": 100})
+
+    def test_load_destination_templates_complete_listing_answers_missing_templates(self):
+        """Test a template absent from a complete listing is reported missing without a lookup"""
+        # Arrange
+        self.mock_dest_client.get.return_value = {"content": [
+            {"identifier": "other-template", "version_label": "v1", "stable_template": True},
+        ]}
+        self.handler.load_destination_templates()
+        self.mock_dest_client.get.reset_mock()
+
+        # Act
+        result = self.handler.check_template_exists("my-template", "v1")
+
+        # Assert
+        assert result is False
+        self.mock_dest_client.exists.assert_not_called()
+
+    def test_load_destination_templates_failed_listing_falls_back_to_lookups(self):
+        """Test templates are looked up individually when the listing could not be fetched"""
+        # Arrange
+        self.mock_dest_client.get.return_value = None
+        self.handler.load_destination_templates()
+        self.mock_dest_client.exists.return_value = True
+
+        # Act
+        result = self.handler.check_template_exists("my-template", "v1")
+
+        # Assert
+        assert result is True
+        self.mock_dest_client.exists.assert_called_once()
+
+    def test_check_templates_exist_checks_concurrently_in_order(self):
+        """Test check_templates_exist returns one result per template in the given order"""
+        # Arrange
+        self.config["options"]["max_workers"] = 3
+        existing = {"/v1/orgs/dest_org/projects/dest_project/templates/t1/versions/v1",
+                    "/v1/orgs/dest_org/projects/dest_project/templates/t3"}
+        self.mock_dest_client.exists.side_effect = lambda endpoint, *args, **kwargs: endpoint in existing
+
+        with patch('src.template_handler.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            # Act
+            result = self.handler.check_templates_exist([("t1", "v1"), ("t2", "v1"), ("t3", None)])
+
+        # Assert
+        assert result == [True, False, True]
+        mock_executor.assert_called_once_with(max_workers=3)
+        assert self.mock_dest_client.exists.call_count == 3
+
+    def test_check_templates_exist_answers_known_templates_without_worker_pool(self):
+        """Test templates answered by the destination listing are not checked on the worker pool"""
+        # Arrange
+        self.handler._template_exists_cache[("t1", "v1")] = True
+        self.handler._destination_listing_complete = True
+
+        with patch('src.template_handler.ThreadPoolExecutor') as mock_executor:
+            # Act
+            result = self.handler.check_templates_exist([("t1", "v1"), ("t2", None)])
+
+        # Assert
+        assert result == [True, False]
+        mock_executor.assert_not_called()
+        self.mock_dest_client.exists.assert_not_called()
+
+    def test_check_templates_exist_checks_repeated_template_once(self):
+        """Test a template referenced several times is checked once, without a worker pool"""
+        # Arrange
+        self.mock_dest_client.exists.return_value = True
+
+        with patch('src.template_handler.ThreadPoolExecutor') as mock_executor:
+            # Act
+            result = self.handler.check_templates_exist([("t1", "v1"), ("t1", "v1")])
+
+        # Assert
+        assert result == [True, True]
+        mock_executor.assert_not_called()
+        self.mock_dest_client.exists.assert_called_once_with(
+            "/v1/orgs/dest_org/projects/dest_project/templates/t1/versions/v1")
 
     def test_check_template_exists_template_not_found(self):
         """Test check_template_exists returns False when template doesn't exist"""
         # Arrange
         template_ref = "my-template"
         version_label = "v1"
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.exists.return_value = False
 
         # Act
         result = self.handler.check_template_exists(template_ref, version_label)
 
         # Assert
         assert result is False
-        self.mock_dest_client.get.assert_called_once()
+        self.mock_dest_client.exists.assert_called_once()
 
     def test_check_template_exists_no_version(self):
         """Test check_template_exists without version label"""
         # Arrange
         template_ref = "my-template"
-        self.mock_dest_client.get.return_value = {"identifier": template_ref}
+        self.mock_dest_client.exists.return_value = True
 
         # Act
         result = self.handler.check_template_exists(template_ref)
@@ -93,7 +285,7 @@ class TestTemplateHandler:
         # Assert
         assert result is True
         # Verify endpoint was built without sub_resource
-        call_args = self.mock_dest_client.get.call_args[0][0]
+        call_args = self.mock_dest_client.exists.call_args[0][0]
         assert "versions" not in call_args
 
     def test_replicate_template_successful(self):
@@ -124,6 +316,62 @@ class TestTemplateHandler:
         assert self.replication_stats["templates"]["success"] == 1
         self.mock_source_client.get.assert_called_once()
         self.mock_dest_client.post.assert_called_once()
+        assert self.mock_dest_client.post.call_args.kwargs["idempotency_key"] == \
+            self.handler._idempotency_key("templates", template_ref, version_label)
+
+    def test_replicate_template_reuses_source_template_after_failed_create(self):
+        """Test a retried replication does not fetch the same source template again"""
+        # Arrange
+        self.mock_source_client.get.return_value = {
+            "template": {"yaml": "template:\n  name: My Template"}
+        }
+        self.mock_dest_client.post.side_effect = [None, {"status": "SUCCESS"}]
+
+        # Act
+        first = self.handler.replicate_template("my-template", "v1")
+        second = self.handler.replicate_template("my-template", "v1")
+
+        # Assert
+        assert first is False
+        assert second is True
+        self.mock_source_client.get.assert_called_once()
+        assert self.mock_dest_client.post.call_count == 2
+
+    def test_replicate_template_shared_by_concurrent_pipelines_is_created_once(self):
+        """Test concurrent replications of the same template create it only once"""
+        # Arrange
+        self.mock_source_client.get.return_value = {
+            "template": {"yaml": "template:\n  name: My Template"}
+        }
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        # Act
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: self.handler.replicate_template("my-template", "v1"), range(4)))
+
+        # Assert
+        assert results == [True] * 4
+        self.mock_dest_client.post.assert_called_once()
+        assert self.replication_stats["templates"]["success"] == 1
+        assert self.replication_stats["templates"]["skipped"] == 3
+
+    def test_replicate_template_refetches_after_failed_source_lookup(self):
+        """Test a failed source lookup is not cached"""
+        # Arrange
+        self.mock_source_client.get.side_effect = [
+            None, {"template": {"yaml": "template:\n  name: My Template"}}
+        ]
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        # Act
+        first = self.handler.replicate_template("my-template", "v1")
+        second = self.handler.replicate_template("my-template", "v1")
+
+        # Assert
+        assert first is False
+        assert second is True
+        assert self.mock_source_client.get.call_count == 2
 
     def test_replicate_template_source_not_found(self):
         """Test template replication when source template not found"""
@@ -202,6 +450,44 @@ class TestTemplateHandler:
         assert self.replication_stats["templates"]["success"] == 1
         # Verify no actual API call was made
         self.mock_dest_client.post.assert_not_called()
+        self.mock_source_client.get.assert_called_once()
+        assert (template_ref, version_label) not in handler._template_exists_cache
+
+    def test_replicate_template_dry_run_reports_planned_template_once(self):
+        """Test a template planned in a dry run is reported once and not treated as existing"""
+        # Arrange
+        self.config["dry_run"] = True
+        handler = TemplateHandler(
+            self.config, self.mock_source_client, self.mock_dest_client, self.replication_stats)
+        self.mock_source_client.get.return_value = {"template": {"yaml": "template:\n  name: My Template"}}
+        self.mock_dest_client.exists.return_value = False
+
+        # Act
+        first = handler.replicate_template("my-template", "v1")
+        second = handler.replicate_template("my-template", "v1")
+        exists = handler.check_template_exists("my-template", "v1")
+
+        # Assert
+        assert first is True and second is True
+        assert exists is False
+        assert self.replication_stats["templates"]["success"] == 1
+        assert self.replication_stats["templates"]["skipped"] == 0
+
+    def test_replicate_template_dry_run_missing_from_source_fails(self):
+        """Test a dry run reports a template missing from the source as failed"""
+        # Arrange
+        self.config["dry_run"] = True
+        handler = TemplateHandler(
+            self.config, self.mock_source_client, self.mock_dest_client, self.replication_stats)
+        self.mock_source_client.get.return_value = None
+
+        # Act
+        result = handler.replicate_template("my-template", "v1")
+
+        # Assert
+        assert result is False
+        assert self.replication_stats["templates"]["failed"] == 1
+        assert self.replication_stats["templates"]["success"] == 0
 
     def test_replicate_template_no_yaml_content(self):
         """Test template replication with template data without YAML content"""
@@ -282,14 +568,27 @@ pipeline:
         pipeline_name = "Test Pipeline"
 
         # Mock all templates exist
-        self.mock_dest_client.get.return_value = {"identifier": "template"}
+        self.mock_dest_client.exists.return_value = True
 
         # Act
         result = self.handler.handle_missing_templates(template_refs, pipeline_name)
 
         # Assert
         assert result is True
-        assert self.mock_dest_client.get.call_count == 2
+        assert self.mock_dest_client.exists.call_count == 2
+
+    def test_handle_missing_templates_uses_given_existence_results(self):
+        """Test handle_missing_templates does not check templates again when results are given"""
+        # Arrange
+        template_refs = [("template1", "v1"), ("template2", "v2")]
+        self.config["options"]["skip_templates"] = True
+
+        # Act
+        result = self.handler.handle_missing_templates(template_refs, "Test Pipeline", [True, False])
+
+        # Assert
+        assert result is True
+        self.mock_dest_client.exists.assert_not_called()
 
     def test_handle_missing_templates_some_missing_replicated(self):
         """Test handle_missing_templates when some templates are missing but can be replicated"""
@@ -298,9 +597,9 @@ pipeline:
         pipeline_name = "Test Pipeline"
 
         # Mock first template exists, second doesn't
-        self.mock_dest_client.get.side_effect = [
-            {"identifier": "template1"},  # First template exists
-            None  # Second template doesn't exist
+        self.mock_dest_client.exists.side_effect = [
+            True,  # First template exists
+            False  # Second template doesn't exist
         ]
 
         # Mock source template data for replication
@@ -315,14 +614,78 @@ pipeline:
 
         with patch('src.template_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
             mock_yaml_update.return_value = "updated_yaml"
-            with patch('src.template_handler.time.sleep'):  # Mock sleep to speed up test
-                # Act
-                result = self.handler.handle_missing_templates(template_refs, pipeline_name)
+            # Act
+            result = self.handler.handle_missing_templates(template_refs, pipeline_name)
 
         # Assert
         assert result is True
         assert self.replication_stats["templates"]["success"] == 1
 
+    def test_handle_missing_templates_replicates_with_configured_workers(self):
+        """Test handle_missing_templates replicates every missing template using max_workers"""
+        # Arrange
+        self.config["options"]["max_workers"] = 2
+        handler = TemplateHandler(
+            self.config,
+            self.mock_source_client,
+            self.mock_dest_client,
+            self.replication_stats
+        )
+        template_refs = [("template1", "v1"), ("template2", "v1"), ("template3", None)]
+        self.mock_dest_client.exists.return_value = False
+        self.mock_source_client.get.return_value = {
+            "template": {"yaml": "template:\n  name: Template"}
+        }
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        with patch('src.template_handler.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            # Act
+            result = handler.handle_missing_templates(template_refs, "Test Pipeline")
+
+        # Assert
+        assert result is True
+        mock_executor.assert_called_once_with(max_workers=2)
+        assert self.replication_stats["templates"]["success"] == 3
+        posted_refs = sorted(call[1]["json"]["template_identifier"]
+                             for call in self.mock_dest_client.post.call_args_list)
+        assert posted_refs == ["template1", "template2", "template3"]
+
+    def test_handle_missing_templates_sizes_pool_to_missing_templates(self):
+        """Test handle_missing_templates starts no more workers than there are missing templates"""
+        # Arrange
+        self.config["options"]["max_workers"] = 8
+        self.mock_dest_client.exists.return_value = False
+        self.mock_source_client.get.return_value = {
+            "template": {"yaml": "template:\n  name: Template"}
+        }
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        with patch('src.template_handler.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            # Act
+            self.handler.handle_missing_templates([("template1", "v1"), ("template2", None)], "Test Pipeline")
+
+        # Assert
+        mock_executor.assert_called_once_with(max_workers=2)
+        assert self.replication_stats["templates"]["success"] == 2
+
+    def test_handle_missing_templates_single_template_without_worker_pool(self):
+        """Test a single missing template is replicated on the calling thread"""
+        # Arrange
+        self.mock_dest_client.exists.return_value = False
+        self.mock_source_client.get.return_value = {
+            "template": {"yaml": "template:\n  name: Template"}
+        }
+        self.mock_dest_client.post.return_value = {"status": "SUCCESS"}
+
+        with patch('src.template_handler.ThreadPoolExecutor') as mock_executor:
+            # Act
+            result = self.handler.handle_missing_templates([("template1", "v1")], "Test Pipeline")
+
+        # Assert
+        assert result is True
+        mock_executor.assert_not_called()
+        assert self.replication_stats["templates"]["success"] == 1
+
     def test_handle_missing_templates_replication_fails(self):
         """Test handle_missing_templates when template replication fails"""
         # Arrange
@@ -330,7 +693,7 @@ pipeline:
         pipeline_name = "Test Pipeline"
 
         # Mock template doesn't exist
-        self.mock_dest_client.get.return_value = None
+        self.mock_dest_client.exists.return_value = False
 
         # Mock source template not found
         self.mock_source_client.get.return_value = None
@@ -353,7 +716,7 @@ pipeline:
 
         # Assert
         assert result is True
-        self.mock_dest_client.get.assert_not_called()
+        self.mock_dest_client.exists.assert_not_called()
 
     def test_handle_missing_templates_skip_templates_option(self):
         """Test handle_missing_templates with skip_templates option"""
@@ -375,7 +738,7 @@ pipeline:
         # Assert
         assert result is True
         # Should check if templates exist but not replicate them
-        self.mock_dest_client.get.assert_called_once()
+        self.mock_dest_client.exists.assert_called_once()
         # Should not replicate templates (no source client calls)
         self.mock_source_client.get.assert_not_called()
 
@@ -415,16 +778,16 @@ pipeline:
         pipeline_name = "Test Pipeline"
 
         # Mock first template exists, second can be replicated, third fails
-        self.mock_dest_client.get.side_effect = [
-            {"identifier": "template1"},  # First exists
-            None,  # Second doesn't exist
-            None   # Third doesn't exist
+        self.mock_dest_client.exists.side_effect = [
+            True,  # First exists
+            False,  # Second doesn't exist
+            False   # Third doesn't exist
         ]
 
         # Mock source responses for replication attempts
         self.mock_source_client.get.side_effect = [
             {"template": {"yaml": "template:\n  name: Template 2"}},  # Second template found
-            None  # Third template not found in source
+            False  # Third template not found in source
         ]
 
         # Mock successful creation for second template
@@ -432,9 +795,8 @@ pipeline:
 
         with patch('src.template_handler.YAMLUtils.update_identifiers') as mock_yaml_update:
             mock_yaml_update.return_value = "updated_yaml"
-            with patch('src.template_handler.time.sleep'):  # Mock sleep to speed up test
-                # Act
-                result = self.handler.handle_missing_templates(template_refs, pipeline_name)
+            # Act
+            result = self.handler.handle_missing_templates(template_refs, pipeline_name)
 
         # Assert
         assert result is True  # handle_missing_templates always returns True
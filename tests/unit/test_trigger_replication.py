@@ -4,10 +4,12 @@ Unit Tests for Trigger Replication
 These tests focus on the behavior of trigger replication functionality,
 using mocks to isolate the logic from external dependencies.
 """
-from unittest.mock import Mock
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
 from src.trigger_handler import TriggerHandler
 from src.api_client import HarnessAPIClient
+from src.base_replicator import LIST_PAGE_SIZE
 
 
 class TestTriggerReplication:
@@ -39,10 +41,6 @@ class TestTriggerReplication:
         self.mock_source_client = Mock(spec=HarnessAPIClient)
         self.mock_dest_client = Mock(spec=HarnessAPIClient)
 
-        # Mock the session attribute for trigger API calls
-        self.mock_dest_client.session = Mock()
-        self.mock_dest_client.base_url = "https://dest.harness.io"
-
         # Create replication stats
         self.replication_stats = {
             "triggers": {"success": 0, "failed": 0, "skipped": 0}
@@ -107,7 +105,7 @@ class TestTriggerReplication:
         # Mock successful creation
         mock_response = Mock()
         mock_response.status_code = 201
-        self.mock_dest_client.session.post.return_value = mock_response
+        self.mock_dest_client.send_raw.return_value = mock_response
 
         # Act
         result = self.handler.replicate_triggers(pipeline_id)
@@ -143,6 +141,58 @@ class TestTriggerReplication:
         assert self.replication_stats["triggers"]["success"] == 0
         assert self.replication_stats["triggers"]["skipped"] == 1
 
+    def test_replicate_triggers_checks_destination_with_one_listing(self):
+        """Test existing destination triggers are found with one listing instead of a request per trigger"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        self.mock_source_client.get.side_effect = [
+            {"data": {"content": [{"identifier": "existing"}, {"identifier": "new"}]}},
+            {"data": {"yaml": "trigger:\n  name: New"}}
+        ]
+        self.mock_dest_client.get.return_value = {"data": {"content": [{"identifier": "existing"}]}}
+        mock_response = Mock()
+        mock_response.status_code = 201
+        self.mock_dest_client.send_raw.return_value = mock_response
+
+        # Act
+        result = self.handler.replicate_triggers(pipeline_id)
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["triggers"]["skipped"] == 1
+        assert self.replication_stats["triggers"]["success"] == 1
+        self.mock_dest_client.get.assert_called_once_with("/pipeline/api/triggers", params={
+            "orgIdentifier": "dest_org",
+            "projectIdentifier": "dest_project",
+            "targetIdentifier": pipeline_id,
+            "page": 0,
+            "size": LIST_PAGE_SIZE
+        })
+        self.mock_dest_client.send_raw.assert_called_once()
+
+    def test_replicate_triggers_replicates_triggers_concurrently(self):
+        """Test the triggers of a pipeline are replicated on a worker pool"""
+        # Arrange
+        self.config["options"]["max_workers"] = 3
+        triggers = [{"identifier": f"trigger{i}"} for i in range(3)]
+        self.mock_source_client.get.side_effect = lambda endpoint, params=None: (
+            {"data": {"content": triggers}} if endpoint == "/pipeline/api/triggers"
+            else {"data": {"yaml": "trigger:\n  name: Trigger"}})
+        self.mock_dest_client.get.return_value = {"data": {"content": []}}
+        mock_response = Mock()
+        mock_response.status_code = 201
+        self.mock_dest_client.send_raw.return_value = mock_response
+
+        # Act
+        with patch('src.trigger_handler.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            result = self.handler.replicate_triggers("test_pipeline")
+
+        # Assert
+        assert result is True
+        mock_executor.assert_called_once_with(max_workers=3)
+        assert self.replication_stats["triggers"]["success"] == 3
+        assert self.mock_dest_client.send_raw.call_count == 3
+
     def test_replicate_triggers_update_existing(self):
         """Test trigger replication updates existing triggers when skip_existing is False"""
         # Arrange
@@ -175,7 +225,7 @@ class TestTriggerReplication:
         # Mock successful update
         mock_response = Mock()
         mock_response.status_code = 200
-        self.mock_dest_client.session.put.return_value = mock_response
+        self.mock_dest_client.send_raw.return_value = mock_response
 
         # Act
         result = handler.replicate_triggers(pipeline_id)
@@ -183,6 +233,14 @@ class TestTriggerReplication:
         # Assert
         assert result is True
         assert self.replication_stats["triggers"]["success"] == 1
+        self.mock_dest_client.send_raw.assert_called_once()
+        put_args = self.mock_dest_client.send_raw.call_args
+        assert put_args.args[:2] == ("PUT", "/pipeline/api/triggers/test_trigger")
+        assert put_args.kwargs["params"] == {
+            "orgIdentifier": "dest_org",
+            "projectIdentifier": "dest_project",
+            "targetIdentifier": pipeline_id
+        }
 
     def test_replicate_triggers_creation_fails(self):
         """Test trigger replication handles creation failures"""
@@ -207,8 +265,8 @@ class TestTriggerReplication:
         # Mock failed creation
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-        self.mock_dest_client.session.post.return_value = mock_response
+        mock_response.content = b"Bad Request"
+        self.mock_dest_client.send_raw.return_value = mock_response
 
         # Act
         result = self.handler.replicate_triggers(pipeline_id)
@@ -218,6 +276,30 @@ class TestTriggerReplication:
         assert self.replication_stats["triggers"]["failed"] == 1
         assert self.replication_stats["triggers"]["success"] == 0
 
+    def test_replicate_triggers_creation_fails_skips_error_body_when_not_logged(self):
+        """Test the error body of a failed creation is not decoded when errors are not logged"""
+        # Arrange
+        trigger_data = {"identifier": "test_trigger", "name": "Test Trigger"}
+        self.mock_source_client.get.side_effect = [
+            {"data": {"content": [trigger_data]}},
+            {"data": {"yaml": "trigger:\n  name: Test Trigger"}}
+        ]
+        self.mock_dest_client.get.return_value = None
+        mock_response = Mock()
+        mock_response.status_code = 400
+        self.mock_dest_client.send_raw.return_value = mock_response
+
+        # Act
+        with patch('src.trigger_handler.logger') as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            with patch.object(HarnessAPIClient, 'error_body') as mock_error_body:
+                result = self.handler.replicate_triggers("test_pipeline")
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["triggers"]["failed"] == 1
+        mock_error_body.assert_not_called()
+
     def test_replicate_triggers_dry_run_mode(self):
         """Test trigger replication in dry run mode"""
         # Arrange
@@ -254,7 +336,7 @@ class TestTriggerReplication:
         assert result is True
         assert self.replication_stats["triggers"]["success"] == 1
         # Verify no actual API calls were made to create
-        self.mock_dest_client.session.post.assert_not_called()
+        self.mock_dest_client.send_raw.assert_not_called()
 
     def test_replicate_triggers_missing_trigger_details(self):
         """Test trigger replication handles missing trigger details"""
@@ -283,3 +365,124 @@ class TestTriggerReplication:
         assert result is True  # Method continues despite individual failures
         assert self.replication_stats["triggers"]["failed"] == 1
         assert self.replication_stats["triggers"]["success"] == 0
+
+    def test_replicate_triggers_fetches_all_pages(self):
+        """Test replicate_triggers lists triggers page by page until the last page"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        first_page = [{"identifier": f"trigger{i}"} for i in range(LIST_PAGE_SIZE)]
+        second_page = [{"identifier": "last_trigger"}]
+        self.mock_source_client.get.side_effect = lambda endpoint, params=None: {
+            "data": {"content": first_page if params["page"] == 0 else second_page, "totalPages": 2}
+        } if endpoint == "/pipeline/api/triggers" else None
+        self.mock_dest_client.get.return_value = {"data": {"identifier": "existing"}}
+
+        # Act
+        result = self.handler.replicate_triggers(pipeline_id)
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["triggers"]["skipped"] == LIST_PAGE_SIZE + 1
+        page_indexes = [call.kwargs["params"]["page"] for call in self.mock_source_client.get.call_args_list]
+        assert page_indexes == [0, 1]
+
+    def test_replicate_triggers_fetches_remaining_pages_concurrently_in_order(self):
+        """Test pages after the first are fetched on the worker pool and processed in page order"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        pages = [[{"identifier": f"page{index}_trigger{i}"} for i in range(LIST_PAGE_SIZE)] for index in range(3)]
+        self.mock_source_client.get.side_effect = lambda endpoint, params=None: {
+            "data": {"content": pages[params["page"]], "totalPages": 3}
+        } if endpoint == "/pipeline/api/triggers" else None
+        self.mock_dest_client.get.return_value = {"data": {"identifier": "existing"}}
+
+        # Act
+        with patch('src.trigger_handler.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as mock_executor:
+            triggers = list(self.handler._iter_triggers(pipeline_id))
+
+        # Assert
+        mock_executor.assert_called_once()
+        assert triggers == pages[0] + pages[1] + pages[2]
+        page_indexes = sorted(call.kwargs["params"]["page"] for call in self.mock_source_client.get.call_args_list)
+        assert page_indexes == [0, 1, 2]
+
+    def test_replicate_triggers_stops_at_total_pages(self):
+        """Test replicate_triggers does not request a page past totalPages"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        full_page = [{"identifier": f"trigger{i}"} for i in range(LIST_PAGE_SIZE)]
+        self.mock_source_client.get.return_value = {"data": {"content": full_page, "totalPages": 1}}
+        self.mock_dest_client.get.return_value = {"data": {"identifier": "existing"}}
+
+        # Act
+        self.handler.replicate_triggers(pipeline_id)
+
+        # Assert
+        self.mock_source_client.get.assert_called_once()
+
+    def test_replicate_triggers_requests_pages_with_page_and_size(self):
+        """Test trigger pages are requested with the page and size query parameters"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        self.mock_source_client.get.return_value = {"data": {"content": [], "totalPages": 0}}
+
+        # Act
+        self.handler.replicate_triggers(pipeline_id)
+
+        # Assert
+        self.mock_source_client.get.assert_called_once_with("/pipeline/api/triggers", params={
+            "orgIdentifier": "source_org",
+            "projectIdentifier": "source_project",
+            "targetIdentifier": pipeline_id,
+            "page": 0,
+            "size": LIST_PAGE_SIZE
+        })
+
+    def test_replicate_triggers_replicates_triggers_of_a_repeated_page_once(self):
+        """Test a page repeated by a server ignoring the paging parameters is not replicated twice"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        page = [{"identifier": f"trigger{i}"} for i in range(LIST_PAGE_SIZE)]
+        self.mock_source_client.get.side_effect = lambda endpoint, params=None: {
+            "data": {"content": page, "totalPages": 2}
+        } if endpoint == "/pipeline/api/triggers" else None
+        self.mock_dest_client.get.return_value = {"data": {"content": [], "totalPages": 0}}
+
+        # Act
+        triggers = list(self.handler._iter_triggers(pipeline_id))
+
+        # Assert
+        assert triggers == page
+
+    def test_replicate_triggers_stops_paging_when_a_page_repeats(self):
+        """Test paging without a page count stops at a page holding only triggers already seen"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        page = [{"identifier": f"trigger{i}"} for i in range(LIST_PAGE_SIZE)]
+        self.mock_source_client.get.return_value = {"data": {"content": page}}
+
+        # Act
+        triggers = list(self.handler._iter_triggers(pipeline_id))
+
+        # Assert
+        assert triggers == page
+        assert self.mock_source_client.get.call_count == 2
+
+    def test_replicate_triggers_counts_trigger_that_could_not_be_sent_as_failed(self):
+        """Test a trigger whose create request could not be sent is counted as failed"""
+        # Arrange
+        pipeline_id = "test_pipeline"
+        self.mock_source_client.get.side_effect = [
+            {"data": {"content": [{"identifier": "test_trigger", "name": "Test Trigger"}]}},
+            {"data": {"yaml": "trigger:\n  name: Test Trigger"}}
+        ]
+        self.mock_dest_client.get.return_value = {"data": {"content": []}}
+        self.mock_dest_client.send_raw.return_value = None
+
+        # Act
+        result = self.handler.replicate_triggers(pipeline_id)
+
+        # Assert
+        assert result is True
+        assert self.replication_stats["triggers"]["failed"] == 1
+        assert self.replication_stats["triggers"]["success"] == 0
@@ -158,7 +158,43 @@ class TestSelectPipelines:
         assert len(result) == 2
         assert result[0]["identifier"] == "pipeline1"
         assert result[1]["identifier"] == "pipeline2"
-        mock_client.get.assert_called_once_with(f"/v1/orgs/{org}/projects/{project}/pipelines")
+        mock_client.get.assert_called_once_with(
+            f"/v1/orgs/{org}/projects/{project}/pipelines", params={"page": 0, "limit": 100})
+
+    def test_select_pipelines_lists_every_page(self):
+        """Test select_pipelines keeps requesting pages until a short page is returned"""
+        # Arrange
+        mock_client = Mock()
+        first_page = [{"identifier": f"pipeline{i}", "name": f"Pipeline {i}"} for i in range(100)]
+        second_page = [{"identifier": "pipeline100", "name": "Pipeline 100"}]
+        mock_client.normalize_response.side_effect = [first_page, second_page]
+
+        # Act
+        with patch('src.ui.checkboxlist_dialog') as mock_dialog:
+            mock_dialog.return_value.run.return_value = ["pipeline100"]
+            result = select_pipelines(mock_client, "test-org", "test-project")
+
+        # Assert
+        assert result == [{"identifier": "pipeline100", "name": "Pipeline 100"}]
+        assert len(mock_dialog.call_args[1]["values"]) == 101
+        assert [call[1]["params"]["page"] for call in mock_client.get.call_args_list] == [0, 1]
+
+    def test_select_pipelines_stops_listing_when_a_page_repeats(self):
+        """Test select_pipelines stops requesting pages when the server repeats a full page"""
+        # Arrange
+        mock_client = Mock()
+        page = [{"identifier": f"pipeline{i}", "name": f"Pipeline {i}"} for i in range(100)]
+        mock_client.normalize_response.return_value = page
+
+        # Act
+        with patch('src.ui.checkboxlist_dialog') as mock_dialog:
+            mock_dialog.return_value.run.return_value = ["pipeline0"]
+            result = select_pipelines(mock_client, "test-org", "test-project")
+
+        # Assert
+        assert result == [{"identifier": "pipeline0", "name": "Pipeline 0"}]
+        assert len(mock_dialog.call_args[1]["values"]) == 100
+        assert mock_client.get.call_count == 2
 
     def test_select_pipelines_no_pipelines_shows_error(self):
         """Test select_pipelines shows error when no pipelines found"""
@@ -358,7 +394,7 @@ class TestCreateOrganization:
         mock_client.post.return_value = {"success": True}
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value="new-org"):
+        with patch('src.ui.prompt', return_value="new-org"):
             result = create_organization(mock_client)
 
         # Assert
@@ -371,7 +407,7 @@ class TestCreateOrganization:
         mock_client = Mock()
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value=""):
+        with patch('src.ui.prompt', return_value=""):
             result = create_organization(mock_client)
 
         # Assert
@@ -384,7 +420,7 @@ class TestCreateOrganization:
         mock_client.post.return_value = None
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value="new-org"):
+        with patch('src.ui.prompt', return_value="new-org"):
             with patch('src.ui.message_dialog') as mock_message:
                 result = create_organization(mock_client)
 
@@ -399,7 +435,7 @@ class TestCreateOrganization:
         mock_client.post.side_effect = Exception("API Error")
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value="new-org"):
+        with patch('src.ui.prompt', return_value="new-org"):
             with patch('src.ui.message_dialog') as mock_message:
                 result = create_organization(mock_client)
 
@@ -419,7 +455,7 @@ class TestCreateProject:
         mock_client.post.return_value = {"success": True}
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value="new-project"):
+        with patch('src.ui.prompt', return_value="new-project"):
             result = create_project(mock_client, org)
 
         # Assert
@@ -433,7 +469,7 @@ class TestCreateProject:
         org = "test-org"
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value=""):
+        with patch('src.ui.prompt', return_value=""):
             result = create_project(mock_client, org)
 
         # Assert
@@ -447,7 +483,7 @@ class TestCreateProject:
         mock_client.post.return_value = None
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value="new-project"):
+        with patch('src.ui.prompt', return_value="new-project"):
             with patch('src.ui.message_dialog') as mock_message:
                 result = create_project(mock_client, org)
 
@@ -463,7 +499,7 @@ class TestCreateProject:
         mock_client.post.side_effect = Exception("API Error")
 
         # Act
-        with patch('prompt_toolkit.prompt', return_value="new-project"):
+        with patch('src.ui.prompt', return_value="new-project"):
             with patch('src.ui.message_dialog') as mock_message:
                 result = create_project(mock_client, org)
 
@@ -105,7 +105,7 @@ pipeline:
         dest_org = "new_org"
         dest_project = "new_project"
 
-        with patch('src.yaml_utils.yaml.safe_load', side_effect=yaml.YAMLError("Parse error")):
+        with patch('src.yaml_utils._load_yaml', side_effect=yaml.YAMLError("Parse error")):
             # Act
             result = YAMLUtils.update_identifiers(yaml_content, dest_org, dest_project)
 
@@ -135,6 +135,159 @@ pipeline:
         assert data["orgIdentifier"] == dest_org
         assert data["projectIdentifier"] == dest_project
 
+    def test_update_identifiers_preserves_formatting_without_yaml_round_trip(self):
+        """Test update_identifiers rewrites identifier lines in place, keeping comments and order"""
+        # Arrange
+        yaml_content = """pipeline:
+  # Pipeline owned by team A
+  name: Test Pipeline
+  identifier: test_pipeline
+  projectIdentifier: "old_project"
+  orgIdentifier: old_org
+  stages: []
+"""
+
+        with patch('src.yaml_utils._load_yaml') as mock_load:
+            # Act
+            result = YAMLUtils.update_identifiers(yaml_content, "new_org", "new_project", "pipeline")
+
+        # Assert
+        mock_load.assert_not_called()
+        assert result == """pipeline:
+  # Pipeline owned by team A
+  name: Test Pipeline
+  identifier: test_pipeline
+  projectIdentifier: "new_project"
+  orgIdentifier: "new_org"
+  stages: []
+"""
+
+    def test_update_identifiers_quotes_identifiers_yaml_would_retype(self):
+        """Test identifiers such as on or 0123 are written quoted so they stay strings"""
+        # Arrange
+        yaml_content = "pipeline:\n  orgIdentifier: old_org\n  projectIdentifier: old_project\n"
+
+        # Act
+        result = YAMLUtils.update_identifiers(yaml_content, "on", "0123", wrapper_key="pipeline")
+
+        # Assert
+        assert yaml.safe_load(result) == {"pipeline": {"orgIdentifier": "on", "projectIdentifier": "0123"}}
+
+    def test_update_template_yaml_rewrites_crlf_lines_in_place(self):
+        """Test CRLF template lines are rewritten where they are instead of being added again"""
+        # Arrange
+        yaml_content = ("template:\r\n  name: T\r\n  orgIdentifier: so\r\n  projectIdentifier: sp\r\n"
+                        "  versionLabel: v0\r\n  spec: {}\r\n")
+
+        # Act
+        result = YAMLUtils.update_template_yaml(yaml_content, "do", "dp", "v1")
+
+        # Assert
+        assert result == ('template:\r\n  name: T\r\n  orgIdentifier: "do"\r\n  projectIdentifier: "dp"\r\n'
+                          '  versionLabel: "v1"\r\n  spec: {}\r\n')
+
+    def test_update_identifiers_quoted_key_is_not_added_twice(self):
+        """Test a quoted identifier key is rewritten by the YAML fallback rather than duplicated"""
+        # Arrange
+        yaml_content = 'pipeline:\n  name: P\n  "orgIdentifier": so\n  projectIdentifier: sp\n'
+
+        # Act
+        result = YAMLUtils.update_identifiers(yaml_content, "do", "dp", wrapper_key="pipeline")
+
+        # Assert
+        assert result.count("orgIdentifier") == 1
+        assert yaml.safe_load(result) == {"pipeline": {"name": "P", "orgIdentifier": "do", "projectIdentifier": "dp"}}
+
+    def test_update_identifiers_value_on_next_line_uses_yaml_fallback(self):
+        """Test an identifier whose value sits on the next line is rewritten into valid YAML"""
+        # Arrange
+        yaml_content = "pipeline:\n  orgIdentifier:\n    so\n  projectIdentifier: sp\n  stages: []\n"
+
+        # Act
+        result = YAMLUtils.update_identifiers(yaml_content, "do", "dp", wrapper_key="pipeline")
+
+        # Assert
+        assert yaml.safe_load(result) == {
+            "pipeline": {"orgIdentifier": "do", "projectIdentifier": "dp", "stages": []}}
+
+    def test_update_identifiers_ignores_nested_identifiers(self):
+        """Test update_identifiers only rewrites identifiers that belong to the wrapper"""
+        # Arrange
+        yaml_content = """template:
+  name: Test Template
+  orgIdentifier: old_org
+  projectIdentifier: old_project
+  spec:
+    connectorRef:
+      orgIdentifier: other_org
+      projectIdentifier: other_project
+"""
+
+        # Act
+        result = YAMLUtils.update_identifiers(yaml_content, "new_org", "new_project", "template")
+
+        # Assert
+        data = yaml.safe_load(result)
+        assert data["template"]["orgIdentifier"] == "new_org"
+        assert data["template"]["projectIdentifier"] == "new_project"
+        assert data["template"]["spec"]["connectorRef"]["orgIdentifier"] == "other_org"
+        assert data["template"]["spec"]["connectorRef"]["projectIdentifier"] == "other_project"
+
+    def test_update_identifiers_adds_missing_identifiers_without_yaml_round_trip(self):
+        """Test update_identifiers adds absent identifiers after the wrapper's children in place"""
+        # Arrange
+        yaml_content = """
+inputSet:
+  name: Test Input Set
+  orgIdentifier: old_org
+  pipeline:
+    stages: []
+other: value
+"""
+
+        # Act
+        with patch('src.yaml_utils._load_yaml') as mock_load:
+            result = YAMLUtils.update_identifiers(yaml_content, "new_org", "new_project", "inputSet")
+
+        # Assert
+        mock_load.assert_not_called()
+        data = yaml.safe_load(result)
+        assert data["inputSet"]["orgIdentifier"] == "new_org"
+        assert data["inputSet"]["projectIdentifier"] == "new_project"
+        assert data["inputSet"]["pipeline"] == {"stages": []}
+        assert data["other"] == "value"
+
+    def test_update_identifiers_wrapper_holding_list_uses_yaml(self):
+        """Test identifiers are not added in place under a wrapper key that holds a list"""
+        # Arrange
+        yaml_content = """pipeline:
+  - stage: one
+"""
+
+        # Act
+        with patch('src.yaml_utils._load_yaml', side_effect=yaml.YAMLError("Parse error")) as mock_load:
+            YAMLUtils.update_identifiers(yaml_content, "new_org", "new_project", "pipeline")
+
+        # Assert
+        mock_load.assert_called_once_with(yaml_content)
+
+    def test_extract_template_refs_skips_parsing_without_template_refs(self):
+        """Test extract_template_refs does not parse YAML that has no templateRef"""
+        # Arrange
+        yaml_content = """
+pipeline:
+  name: Test Pipeline
+  stages: []
+"""
+
+        with patch('src.yaml_utils._load_yaml') as mock_load:
+            # Act
+            result = YAMLUtils.extract_template_refs(yaml_content)
+
+        # Assert
+        assert result == []
+        mock_load.assert_not_called()
+
     def test_extract_template_refs_single_template(self):
         """Test extract_template_refs with single template reference"""
         # Arrange
@@ -182,6 +335,46 @@ pipeline:
         ]
         assert result == expected
 
+    def test_extract_template_refs_deduplicates_repeated_references(self):
+        """Test extract_template_refs returns each template reference once, in first-seen order"""
+        # Arrange
+        yaml_content = """
+pipeline:
+  stages:
+    - stage:
+        template:
+          templateRef: stage-template
+          versionLabel: v1
+    - stage:
+        template:
+          templateRef: other-template
+    - stage:
+        template:
+          templateRef: stage-template
+          versionLabel: v1
+    - stage:
+        template:
+          templateRef: stage-template
+          versionLabel: v2
+"""
+
+        # Act
+        result = YAMLUtils.extract_template_refs(yaml_content)
+
+        # Assert
+        assert result == [("stage-template", "v1"), ("other-template", None), ("stage-template", "v2")]
+
+    def test_extract_template_refs_scalar_document(self):
+        """Test extract_template_refs returns nothing for a document that is not a mapping or list"""
+        # Arrange
+        yaml_content = "templateRef"
+
+        # Act
+        result = YAMLUtils.extract_template_refs(yaml_content)
+
+        # Assert
+        assert result == []
+
     def test_extract_template_refs_nested_templates(self):
         """Test extract_template_refs with deeply nested template references"""
         # Arrange
@@ -294,9 +487,11 @@ template:
 """
 
         # Act
-        result = YAMLUtils.set_template_version(yaml_content)
+        with patch('src.yaml_utils._load_yaml') as mock_load:
+            result = YAMLUtils.set_template_version(yaml_content)
 
         # Assert
+        mock_load.assert_not_called()
         data = yaml.safe_load(result)
         assert data["template"]["versionLabel"] == "stable"
         assert data["template"]["name"] == "Test Template"
@@ -434,7 +629,7 @@ pipeline:
         dest_org = "new_org"
         dest_project = "new_project"
 
-        with patch('src.yaml_utils.yaml.safe_load', side_effect=TypeError("Type error")):
+        with patch('src.yaml_utils._load_yaml', side_effect=TypeError("Type error")):
             # Act
             result = YAMLUtils.update_identifiers(yaml_content, dest_org, dest_project)
 
@@ -454,7 +649,7 @@ pipeline:
         dest_project = "new_project"
 
         # Mock yaml.safe_load to return data that causes KeyError
-        with patch('src.yaml_utils.yaml.safe_load', return_value={}):
+        with patch('src.yaml_utils._load_yaml', return_value={}):
             # Act
             result = YAMLUtils.update_identifiers(yaml_content, dest_org, dest_project)
 
@@ -462,3 +657,69 @@ pipeline:
         # Regex fallback produces unquoted values
         assert f'orgIdentifier: {dest_org}' in result
         assert f'projectIdentifier: {dest_project}' in result
+
+    def test_set_template_version_rewrites_existing_label_in_place(self):
+        """Test set_template_version rewrites an existing versionLabel without a YAML round-trip"""
+        # Arrange
+        yaml_content = """template:
+  name: Test Template
+  versionLabel: v1
+  spec:
+    stages:
+      - stage:
+          versionLabel: nested
+"""
+
+        # Act
+        with patch('src.yaml_utils._load_yaml') as mock_load:
+            result = YAMLUtils.set_template_version(yaml_content, "1.0")
+
+        # Assert
+        mock_load.assert_not_called()
+        data = yaml.safe_load(result)
+        assert data["template"]["versionLabel"] == "1.0"
+        assert data["template"]["spec"]["stages"][0]["stage"]["versionLabel"] == "nested"
+        assert result.startswith("template:\n  name: Test Template\n")
+
+    def test_update_identifiers_compiles_wrapper_pattern_once(self):
+        """Test the wrapper-key pattern is compiled once and reused for later documents"""
+        # Arrange
+        yaml_content = """inputSet:
+  identifier: my_input_set
+  orgIdentifier: source_org
+  projectIdentifier: source_project
+"""
+
+        # Act
+        first = YAMLUtils.update_identifiers(yaml_content, "dest_org", "dest_project", wrapper_key="inputSet")
+        with patch('src.yaml_utils.re.compile') as mock_compile:
+            second = YAMLUtils.update_identifiers(yaml_content, "dest_org", "dest_project", wrapper_key="inputSet")
+
+        # Assert
+        mock_compile.assert_not_called()
+        assert first == second
+        assert '  orgIdentifier: "dest_org"\n' in second
+
+    def test_update_template_yaml_rewrites_identifiers_and_version_in_one_pass(self):
+        """Test update_template_yaml rewrites identifiers and version label without a YAML round-trip"""
+        # Arrange
+        yaml_content = """template:
+  name: Test Template
+  orgIdentifier: source_org
+  projectIdentifier: source_project
+  versionLabel: v1
+  spec:
+    orgIdentifier: nested_org
+"""
+
+        # Act
+        with patch('src.yaml_utils._load_yaml') as mock_load:
+            result = YAMLUtils.update_template_yaml(yaml_content, "dest_org", "dest_project", "v2")
+
+        # Assert
+        mock_load.assert_not_called()
+        data = yaml.safe_load(result)
+        assert data["template"]["orgIdentifier"] == "dest_org"
+        assert data["template"]["projectIdentifier"] == "dest_project"
+        assert data["template"]["versionLabel"] == "v2"
+        assert data["template"]["spec"]["orgIdentifier"] == "nested_org"